@@ -1,9 +1,63 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
-from app.configs.tortoise_config import initialize_tortoise
+from app.configs import config
+from app.configs.tortoise_config import close_tortoise, init_tortoise
+from app.apis.ai_router import router as ai_router
+from app.apis.auth_router import router as auth_router
 from app.apis.community_router import router as community_router
+from app.apis.system_router import metrics_router, router as system_router
+from app.services.ai_services.plan_jobs import plan_job_queue
+from app.services.auth_services.tokens import purge_expired_forever, revocation_index
+from app.services.community_services.counter_reconciler import counter_reconciler
+from app.services.community_services.counter_store import counter_store
+from app.services.community_services.post_cache import post_cache
+from app.utils.db_router import ReadYourWritesMiddleware
+from app.utils.instrumentation import MetricsMiddleware, install_query_hooks, uninstall_query_hooks
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 요청 처리에 필요 없는 초기화(DB 드라이버, 모델 관계 해석, 배치 작업 모듈)는 import 가 아니라 기동 때 한다
+    from app.services.community_services.archive import archive_forever
+
+    if config.METRICS_ENABLED:
+        install_query_hooks(slow_query_seconds=config.SLOW_QUERY_SECONDS)
+    await init_tortoise()
 
-app = FastAPI(default_response_class=ORJSONResponse)
+    # 좋아요/댓글 수가 DB 에 반영되면 캐시된 본문을 무효화하고, 조회수만 바뀐 글은 캐시된 조회수에 더한다
+    counter_reconciler.add_flush_listener(post_cache.apply_counter_flush)
+    counter_reconciler.start()
+    plan_job_queue.start()
+    revocation_index.start()
+    purge_task = asyncio.create_task(purge_expired_forever())
+    archive_task = asyncio.create_task(archive_forever())
+    yield
+    archive_task.cancel()
+    purge_task.cancel()
+    # 취소된 작업이 DB 를 쓰던 중일 수 있으므로 끝날 때까지 기다린 뒤 연결을 닫는다
+    await asyncio.gather(archive_task, purge_task, return_exceptions=True)
+    await revocation_index.stop()
+    await plan_job_queue.stop()
+    # 종료 시 남은 카운터 증가분까지 반영
+    await counter_reconciler.stop()
+    await counter_store.close()
+    await close_tortoise()
+    uninstall_query_hooks()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+app.include_router(auth_router)
 app.include_router(community_router)
+app.include_router(ai_router)
+app.include_router(system_router)
+app.include_router(metrics_router)
+
+if config.DB_REPLICA_HOST:
+    app.add_middleware(ReadYourWritesMiddleware, window=config.DB_READ_YOUR_WRITES_SECONDS)
 
-initialize_tortoise(app=app)
\ No newline at end of file
+if config.METRICS_ENABLED:
+    # 가장 바깥에서 감싸 다른 미들웨어 시간까지 잰다
+    app.add_middleware(MetricsMiddleware, sample_rate=config.METRICS_SAMPLE_RATE)
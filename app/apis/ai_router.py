@@ -0,0 +1,99 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.apis.auth_router import get_current_user_id
+from app.configs import config
+from app.dtos.ai_dtos.ai_request import StudyPlanRequest
+from app.dtos.ai_dtos.ai_response import PlanJobResponse
+from app.models.ai import AIPlanJobModel
+from app.services.ai_services.plan_generator import PlanRequest
+from app.services.ai_services.plan_jobs import QueueFullError, plan_job_queue
+from app.services.ai_services.plan_stream import TooManyStreamsError, plan_streamer
+from app.utils import fast_json
+from app.utils.fast_json import json_response
+from app.utils.sse import SSE_HEADERS, sse_event
+
+router = APIRouter(prefix="/api/ai", tags=["AI"])
+
+
+async def to_job_response(job: AIPlanJobModel) -> dict:
+    plan = None
+    if job.plan_id is not None:
+        await job.fetch_related("plan")
+        plan = {
+            "id": job.plan.id,
+            "is_challenge": job.plan.is_challenge,
+            "input_data": job.plan.input_data,
+            "output_data": job.plan.output_data,
+            "start_date": job.plan.start_date,
+            "end_date": job.plan.end_date,
+            "created_at": job.plan.created_at,
+        }
+    return {
+        "id": job.id,
+        "status": job.status.value,
+        "attempts": job.attempts,
+        "error": job.error,
+        "plan": plan,
+        "created_at": job.created_at,
+        "updated_at": job.updated_at,
+    }
+
+
+async def get_job_or_404(job_id: int, user_id: int) -> AIPlanJobModel:
+    job = await AIPlanJobModel.get_or_none(id=job_id, user_id=user_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    return job
+
+
+# ===== 학습 계획 생성 작업 =====
+@router.post("/plans/jobs", response_model=PlanJobResponse, status_code=202)
+async def create_plan_job(body: StudyPlanRequest, user_id: int = Depends(get_current_user_id)):
+    request = PlanRequest(body.input_data, body.is_challenge, body.start_date, body.end_date)
+    try:
+        job = await plan_job_queue.enqueue(user_id, request)
+    except QueueFullError:
+        raise HTTPException(
+            status_code=503,
+            detail="학습 계획 생성 요청이 많습니다. 잠시 후 다시 시도해 주세요",
+            headers={"Retry-After": str(int(config.AI_PLAN_RETRY_BACKOFF) or 1)},
+        )
+    return json_response(PlanJobResponse, await to_job_response(job), status_code=202)
+
+
+@router.get("/plans/jobs/{job_id}", response_model=PlanJobResponse)
+async def get_plan_job(job_id: int, user_id: int = Depends(get_current_user_id)):
+    job = await get_job_or_404(job_id, user_id)
+    return json_response(PlanJobResponse, await to_job_response(job))
+
+
+@router.get("/plans/jobs/{job_id}/events")
+async def watch_plan_job(job_id: int, user_id: int = Depends(get_current_user_id)):
+    """상태가 바뀔 때마다 SSE 이벤트(status) 하나, 완료/실패하면 스트림 종료"""
+    await get_job_or_404(job_id, user_id)
+
+    async def events():
+        async for job in plan_job_queue.watch(job_id):
+            yield sse_event("status", fast_json.encode(PlanJobResponse, await to_job_response(job)))
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+# ===== 학습 계획 실시간 생성 (SSE) =====
+@router.post("/plans/stream")
+async def stream_plan(body: StudyPlanRequest, user_id: int = Depends(get_current_user_id)):
+    """
+    생성되는 대로 chunk 이벤트({"text": ...})를 보내고,
+    끝까지 생성되면 저장 후 done 이벤트({"plan_id": ...}), 실패하면 error 이벤트로 끝난다.
+    """
+    request = PlanRequest(body.input_data, body.is_challenge, body.start_date, body.end_date)
+    try:
+        stream = plan_streamer.open(user_id, request)
+    except TooManyStreamsError:
+        raise HTTPException(
+            status_code=503,
+            detail="학습 계획 생성 요청이 많습니다. 잠시 후 다시 시도해 주세요",
+            headers={"Retry-After": "1"},
+        )
+    return StreamingResponse(stream, media_type="text/event-stream", headers=SSE_HEADERS)
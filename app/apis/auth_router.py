@@ -0,0 +1,91 @@
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.dtos.auth_dtos.auth_request import LoginRequest, RefreshTokenRequest
+from app.dtos.auth_dtos.auth_response import TokenResponse
+from app.models.user import UserModel
+from app.services.auth_services.social_login import (
+    AccountConflictError,
+    InactiveUserError,
+    InvalidHandoffError,
+    SignupRequiredError,
+    login_with_handoff,
+)
+from app.services.auth_services.tokens import (
+    InvalidRefreshTokenError,
+    revoke_refresh_token,
+    rotate_refresh_token,
+    verify_access_token,
+)
+from app.utils.fast_json import json_response
+from app.utils.jwt import InvalidTokenError
+
+router = APIRouter(prefix="/api/auth", tags=["Auth"])
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(status_code=401, detail=detail, headers={"WWW-Authenticate": "Bearer"})
+
+
+async def get_current_user_id(credentials: HTTPAuthorizationCredentials | None = Depends(_bearer)) -> int:
+    """Authorization: Bearer <access token> 의 사용자. 서명만 확인하고 DB 는 보지 않는다."""
+    if credentials is None:
+        raise _unauthorized("로그인이 필요합니다")
+    try:
+        return verify_access_token(credentials.credentials).user_id
+    except InvalidTokenError as e:
+        raise _unauthorized(str(e))
+
+
+async def require_superuser(user_id: int) -> None:
+    if not await UserModel.filter(id=user_id, is_superuser=True).exists():
+        raise HTTPException(status_code=403, detail="관리자만 사용할 수 있습니다")
+
+
+async def get_superuser_id(user_id: int = Depends(get_current_user_id)) -> int:
+    """관리자만 쓰는 라우터 전체에 거는 의존성"""
+    await require_superuser(user_id)
+    return user_id
+
+
+# ===== 로그인 (소셜 로그인 콜백이 넘긴 계정으로 토큰 발급, 처음이면 가입) =====
+@router.post("/login", response_model=TokenResponse)
+async def login(body: LoginRequest):
+    try:
+        tokens = await login_with_handoff(body.assertion, body.nickname)
+    except InvalidHandoffError:
+        raise _unauthorized("유효하지 않은 로그인 정보입니다")
+    except SignupRequiredError:
+        raise HTTPException(status_code=422, detail="처음 로그인하는 계정은 nickname 이 필요합니다")
+    except AccountConflictError:
+        raise HTTPException(status_code=409, detail="이미 사용 중인 닉네임 또는 이메일입니다")
+    except InactiveUserError:
+        raise HTTPException(status_code=403, detail="비활성화된 사용자입니다")
+    return json_response(TokenResponse, {
+        "access_token": tokens.access_token,
+        "refresh_token": tokens.refresh_token,
+        "expires_in": tokens.expires_in,
+    })
+
+
+# ===== 토큰 갱신 (refresh token 은 한 번 쓰면 새로 바뀐다) =====
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(body: RefreshTokenRequest):
+    try:
+        tokens = await rotate_refresh_token(body.refresh_token)
+    except InvalidRefreshTokenError:
+        raise _unauthorized("유효하지 않은 refresh token 입니다")
+    return json_response(TokenResponse, {
+        "access_token": tokens.access_token,
+        "refresh_token": tokens.refresh_token,
+        "expires_in": tokens.expires_in,
+    })
+
+
+# ===== 로그아웃 (이 세션의 access token 도 함께 무효화) =====
+@router.post("/logout", status_code=204)
+async def logout(body: RefreshTokenRequest):
+    await revoke_refresh_token(body.refresh_token)
+    return Response(status_code=204)
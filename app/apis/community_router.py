@@ -1,5 +1,11 @@
-from fastapi import APIRouter, HTTPException
-from datetime import datetime, timedelta
+import logging
+import math
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from tortoise import timezone
+from app.apis.auth_router import get_current_user_id, require_superuser
+from app.configs import config
 from app.dtos.community_dtos.community_request import (
     StudyPostRequest,
     FreePostRequest,
@@ -9,12 +15,52 @@ from app.dtos.community_dtos.community_request import (
     CommentRequest
 )
 from app.dtos.community_dtos.community_response import (
+    BulkIngestResponse,
     StudyPostResponse,
     FreePostResponse,
     SharePostResponse,
     # CommonPostResponse,
-    CommentResponse
+    CommentResponse,
+    CommentTreeListResponse,
+    LikedPostsResponse,
+    LikeResponse,
+    PostListResponse,
+    PostSearchResponse,
+    StudyJoinResponse,
 )
+from app.models.community import CategoryType, CommentModel, PostModel
+from app.services.community_services.bulk_ingest import ingest, iter_lines
+from app.services.community_services.comment_tree import load_comment_tree
+from app.services.community_services.counter_store import counter_store
+from app.services.community_services.export import ndjson_stream, parse_checkpoint
+from app.services.community_services.like_service import (
+    PostNotFoundError,
+    get_liked_post_ids,
+    like_post,
+    unlike_post,
+)
+from app.services.community_services.post_cache import encode_post_body, post_cache, with_views
+from app.services.community_services.post_feed import list_posts
+from app.services.community_services.post_repository import (
+    apply_study_post_update,
+    create_post,
+    get_post,
+    to_post_response,
+)
+from app.services.community_services.post_search import search_posts
+from app.services.community_services.study_membership import (
+    RecruitClosedError,
+    StudyNotFoundError,
+    join_study,
+    leave_study,
+)
+from app.services.community_services.write_throttle import write_throttle
+from app.services.user_services.profile_loader import ProfileLoader, get_profile_loader
+from app.utils.db_router import use_primary
+from app.utils.fast_json import json_response
+
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/community", tags=["Community"])
 
 
@@ -26,159 +72,306 @@ router = APIRouter(prefix="/api/community", tags=["Community"])
 #         "category": body.category,
 #     }
 
-# 조회수 캐시 (카테고리, post_id) 기준
-post_views = {}
+def write_limit(scope: str):
+    """scope(post/comment/join) 한도를 넘은 사용자의 쓰기 요청은 429 + Retry-After 로 거절한다"""
+
+    async def dependency(user_id: int = Depends(get_current_user_id)) -> None:
+        retry_after = await write_throttle.retry_after(scope, user_id)
+        if retry_after:
+            raise HTTPException(
+                status_code=429,
+                detail="요청이 너무 많습니다. 잠시 후 다시 시도해 주세요",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+    return dependency
+
+
+async def get_post_views(post: PostModel) -> int:
+    """DB 에 반영된 조회수 + 아직 flush 되지 않은 증가분"""
+    try:
+        return post.view_count + await counter_store.pending(post.id, "view_count")
+    except (ConnectionError, OSError):
+        logger.warning("카운터 저장소에 연결할 수 없어 DB 조회수만 보여줍니다", exc_info=True)
+        return post.view_count
+
+
+async def count_view(post_id: int) -> int:
+    """
+    조회수를 1 올리고 아직 flush 되지 않은 증가분을 돌려준다.
+    카운터 집계 프로세스가 죽어도 조회 자체는 실패시키지 않는다 (그동안의 조회수는 세지 않는다).
+    """
+    try:
+        return await counter_store.incr(post_id, "view_count")
+    except (ConnectionError, OSError):
+        logger.warning("카운터 저장소에 연결할 수 없어 조회수를 세지 않습니다", exc_info=True)
+        return 0
+
+
+async def get_post_or_404(post_id: int, category: CategoryType) -> PostModel:
+    post = await get_post(post_id)
+    if post is None or post.category != category:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다")
+    return post
+
+
+# ===== 게시글 목록 =====
+@router.get("/posts", response_model=PostListResponse)
+async def get_posts(
+    category: Optional[CategoryType] = None,
+    is_active: bool = True,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    profiles: ProfileLoader = Depends(get_profile_loader),
+):
+    try:
+        posts, next_cursor = await list_posts(category, is_active, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    items = [
+        {
+            "id": post.id,
+            "title": post.title,
+            "category": post.category,
+            "author_id": post.user_id,
+            "views": post.view_count,
+            "like_count": post.like_count,
+            "comment_count": post.comment_count,
+            "created_at": post.created_at,
+            "updated_at": post.updated_at,
+        }
+        for post in posts
+    ]
+    return json_response(PostListResponse, {
+        "items": await profiles.attach_authors(items),
+        "next_cursor": next_cursor,
+    })
+
+
+@router.get("/search", response_model=PostSearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=100),
+    category: Optional[CategoryType] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    profiles: ProfileLoader = Depends(get_profile_loader),
+):
+    try:
+        items, next_cursor = await search_posts(q, category, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_response(PostSearchResponse, {
+        "items": await profiles.attach_authors(items),
+        "next_cursor": next_cursor,
+    })
+
+
+@router.get("/posts/likes", response_model=LikedPostsResponse)
+async def get_my_likes(
+    post_ids: list[int] = Query(..., max_length=100),
+    user_id: int = Depends(get_current_user_id),
+):
+    return {"liked_post_ids": await get_liked_post_ids(user_id, post_ids)}
 
 
 # ===== 스터디 모집 =====
-@router.post("/post/study", response_model=StudyPostResponse)
-async def create_study_post(body: StudyPostRequest):
-    now = datetime.now()
-    key = ("study", 1)
-    post_views[key] = 0
-
-    return {
-        "id": 1,
-        "title": body.title,
-        "content": body.content,
-        "category": body.category,
-        "author_id": 123,
-        "views": post_views[key],
-        "study_recruitment": {
-            "recruit_start": body.recruit_start,
-            "recruit_end": body.recruit_end,
-            "study_start": body.study_start,
-            "study_end": body.study_end,
-            "max_member": body.max_member,
-        },
-        "created_at": now,
-        "updated_at": now,
-    }
+@router.post("/post/study", response_model=StudyPostResponse, dependencies=[Depends(write_limit("post"))])
+async def create_study_post(body: StudyPostRequest, author_id: int = Depends(get_current_user_id)):
+    post = await create_post(author_id, body)
+    return json_response(StudyPostResponse, to_post_response(post, views=0))
 
 
 @router.get("/post/study/{post_id}", response_model=StudyPostResponse)
 async def get_study_post(post_id: int):
-    now = datetime.now()
-    key = ("study", post_id)
-
-    # 현재 조회수 가져오기
-    current_views = post_views.get(key, 0) + 1
-    post_views[key] = current_views
-
-    return {
-        "id": post_id,
-        "title": "스터디 모집",
-        "content": "테스트용 스터디",
-        "category": "study",
-        "author_id": 123,
-        "views": current_views,   # ✅ 여기서만 증가된 값 반환
-        "study_recruitment": {
-            "recruit_start": now - timedelta(days=1),
-            "recruit_end": now + timedelta(days=5),
-            "study_start": now + timedelta(days=10),
-            "study_end": now + timedelta(days=20),
-            "max_member": 5,
-        },
-        "created_at": now,
-        "updated_at": now,
-    }
+    async def load() -> tuple[bytes, int] | None:
+        # 채운 본문은 TTL 동안 모든 요청(방금 수정한 작성자 포함)에 나가므로 뒤처진 replica 가 아니라 primary 에서 읽는다
+        with use_primary():
+            post = await get_post(post_id)
+        if post is None or post.category != CategoryType.STUDY:
+            return None
+        return encode_post_body(StudyPostResponse, to_post_response(post, views=0)), post.view_count
+
+    # 인기 글에 요청이 몰려도 워커마다 같은 글의 DB 조회는 한 번만 진행된다
+    try:
+        cached = await post_cache.get_or_load(post_id, load, timeout=config.POST_CACHE_LOAD_TIMEOUT)
+    except TimeoutError:
+        raise HTTPException(
+            status_code=503,
+            detail="요청이 많아 게시글을 불러오지 못했습니다. 잠시 후 다시 시도해 주세요",
+            headers={"Retry-After": "1"},
+        )
+    if cached is None:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다")
+
+    # 조회수는 카운터 저장소에 쌓고 주기적으로 DB 에 반영
+    views = cached.view_count + await count_view(post_id)
+    return Response(content=with_views(cached.body, views), media_type="application/json")
 
 
 @router.put("/post/study/{post_id}", response_model=StudyPostResponse)
-async def update_study_post(post_id: int, body: StudyPostUpdateRequest):
-    now = datetime.now()
-    recruit_end_from_db = now - timedelta(days=5)
+async def update_study_post(
+    post_id: int, body: StudyPostUpdateRequest, user_id: int = Depends(get_current_user_id)
+):
+    post = await get_post_or_404(post_id, CategoryType.STUDY)
+    if post.user_id != user_id:
+        raise HTTPException(status_code=403, detail="작성자만 수정할 수 있습니다")
 
-    if recruit_end_from_db < now:
+    if post.study_recruitment.recruit_end < timezone.now():
         raise HTTPException(
             status_code=403, detail="구인 기간이 끝난 스터디는 수정할 수 없습니다"
         )
 
-    key = ("study", post_id)
-    views = post_views.get(key, 0)
-
-    return {
-        "id": post_id,
-        "title": body.title or "기존 제목",
-        "content": body.content or "기존 내용",
-        "category": "study",
-        "author_id": 123,
-        "views": views,
-        "study_recruitment": {
-            "recruit_start": body.recruit_start or now,
-            "recruit_end": body.recruit_end or (now + timedelta(days=7)),
-            "study_start": body.study_start or (now + timedelta(days=10)),
-            "study_end": body.study_end or (now + timedelta(days=20)),
-            "max_member": body.max_member or 5,
-        },
-        "created_at": now,
-        "updated_at": now,
-    }
-
-
-@router.post("/post/study/{post_id}/join")
-async def join_study_post(post_id: int, body: dict):
-    now = datetime.now()
-    recruit_end_from_db = now - timedelta(days=5)
-
-    if recruit_end_from_db < now:
-        raise HTTPException(
-            status_code=403, detail="구인 기간이 끝난 스터디는 참여할 수 없습니다"
-        )
+    try:
+        post = await apply_study_post_update(post, body)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    post_cache.invalidate(post_id)
+    return json_response(StudyPostResponse, to_post_response(post, views=await get_post_views(post)))
+
 
-    return {"message": f"user {body['user_id']} joined study {post_id}"}
+@router.post(
+    "/post/study/{post_id}/join", response_model=StudyJoinResponse, dependencies=[Depends(write_limit("join"))]
+)
+async def join_study_post(post_id: int, user_id: int = Depends(get_current_user_id)):
+    try:
+        state = await join_study(user_id, post_id)
+    except StudyNotFoundError:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다")
+    except RecruitClosedError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    post_cache.invalidate(post_id)
+    return json_response(StudyJoinResponse, {"post_id": post_id, **state._asdict()})
+
+
+@router.delete("/post/study/{post_id}/join", response_model=StudyJoinResponse)
+async def leave_study_post(post_id: int, user_id: int = Depends(get_current_user_id)):
+    try:
+        state = await leave_study(user_id, post_id)
+    except StudyNotFoundError:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다")
+    post_cache.invalidate(post_id)
+    return json_response(StudyJoinResponse, {"post_id": post_id, **state._asdict()})
 
 
 # ===== 자유게시판 =====
-@router.post("/post/free", response_model=FreePostResponse)
-async def create_free_post(body: FreePostRequest):
-    now = datetime.now()
-    key = ("free", 2)
-    post_views[key] = 0
-
-    return {
-        "id": 2,
-        "title": body.title,
-        "content": body.content,
-        "category": body.category,
-        "author_id": 123,
-        "views": post_views[key],
-        "free_board": {"image_url": body.image_url},
-        "created_at": now,
-        "updated_at": now,
-    }
+@router.post("/post/free", response_model=FreePostResponse, dependencies=[Depends(write_limit("post"))])
+async def create_free_post(body: FreePostRequest, author_id: int = Depends(get_current_user_id)):
+    post = await create_post(author_id, body)
+    return json_response(FreePostResponse, to_post_response(post, views=0))
 
 
 # ===== 자료공유 =====
-@router.post("/post/share", response_model=SharePostResponse)
-async def create_share_post(body: SharePostRequest):
-    now = datetime.now()
-    key = ("share", 3)
-    post_views[key] = 0
-
-    return {
-        "id": 3,
-        "title": body.title,
-        "content": body.content,
-        "category": body.category,
-        "author_id": 123,
-        "views": post_views[key],
-        "data_share": {"file_url": body.file_url},
-        "created_at": now,
-        "updated_at": now,
-    }
+@router.post("/post/share", response_model=SharePostResponse, dependencies=[Depends(write_limit("post"))])
+async def create_share_post(body: SharePostRequest, author_id: int = Depends(get_current_user_id)):
+    post = await create_post(author_id, body)
+    return json_response(SharePostResponse, to_post_response(post, views=0))
 
 
 # ===== 댓글 =====
-@router.post("/post/{post_id}/comment", response_model=CommentResponse)
-async def create_comment(post_id: int, body: CommentRequest):
-    now = datetime.now()
-    return {
-        "id": 1,
+@router.post(
+    "/post/{post_id}/comment", response_model=CommentResponse, dependencies=[Depends(write_limit("comment"))]
+)
+async def create_comment(post_id: int, body: CommentRequest, author_id: int = Depends(get_current_user_id)):
+    if not await PostModel.filter(id=post_id, deleted_at__isnull=True).exists():
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다")
+    if body.parent_id is not None and not await CommentModel.filter(id=body.parent_id, post_id=post_id).exists():
+        raise HTTPException(status_code=404, detail="원 댓글을 찾을 수 없습니다")
+
+    comment = await CommentModel.create(
+        post_id=post_id,
+        user_id=author_id,
+        content=body.content,
+        parent_comment_id=body.parent_id,
+    )
+    try:
+        await counter_store.incr(post_id, "comment_count")
+    except (ConnectionError, OSError):
+        # 댓글은 이미 저장됐으므로 500 으로 돌려주지 않는다
+        logger.warning("카운터 저장소에 연결할 수 없어 댓글 수를 올리지 못했습니다 (post_id=%s)", post_id, exc_info=True)
+    post_cache.invalidate(post_id)
+
+    return json_response(CommentResponse, {
+        "id": comment.id,
         "post_id": post_id,
-        "content": body.content,
-        "author_id": 123,
-        "parent_id": body.parent_id,
-        "created_at": now,
-        "updated_at": now,
-    }
+        "content": comment.content,
+        "author_id": author_id,
+        "parent_id": comment.parent_comment_id,
+        "created_at": comment.created_at,
+        "updated_at": comment.updated_at,
+    })
+
+
+@router.get("/post/{post_id}/comments", response_model=CommentTreeListResponse)
+async def get_comments(
+    post_id: int,
+    parent_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    child_limit: int = Query(10, ge=0, le=100),
+    max_depth: int = Query(3, ge=0, le=10),
+    profiles: ProfileLoader = Depends(get_profile_loader),
+):
+    try:
+        items, next_cursor = await load_comment_tree(post_id, parent_id, cursor, limit, child_limit, max_depth)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_response(CommentTreeListResponse, {
+        "items": await profiles.attach_authors(items),
+        "next_cursor": next_cursor,
+    })
+
+
+# ===== 좋아요 =====
+@router.post("/post/{post_id}/like", response_model=LikeResponse)
+async def create_like(post_id: int, user_id: int = Depends(get_current_user_id)):
+    try:
+        like_count = await like_post(user_id, post_id)
+    except PostNotFoundError:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다")
+    post_cache.invalidate(post_id)
+    return {"post_id": post_id, "liked": True, "like_count": like_count}
+
+
+@router.delete("/post/{post_id}/like", response_model=LikeResponse)
+async def delete_like(post_id: int, user_id: int = Depends(get_current_user_id)):
+    try:
+        like_count = await unlike_post(user_id, post_id)
+    except PostNotFoundError:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다")
+    post_cache.invalidate(post_id)
+    return {"post_id": post_id, "liked": False, "like_count": like_count}
+
+
+# ===== 대량 적재 (NDJSON) =====
+@router.post("/bulk", response_model=BulkIngestResponse)
+async def bulk_ingest(request: Request, user_id: int = Depends(get_current_user_id)):
+    await require_superuser(user_id)
+    report = await ingest(iter_lines(request.stream()))
+    return json_response(BulkIngestResponse, {
+        "posts": report.posts,
+        "comments": report.comments,
+        "chunks": report.chunks,
+        "elapsed_seconds": report.elapsed_seconds,
+        "posts_per_second": report.posts_per_second,
+        "rows_per_second": report.rows_per_second,
+        "errors": [{"line": line, "detail": detail} for line, detail in report.errors],
+    })
+
+
+# ===== 내보내기 (NDJSON) =====
+@router.get("/export/{kind}")
+async def export(
+    kind: Literal["posts", "comments"],
+    since: Optional[str] = None,
+    user_id: int = Depends(get_current_user_id),
+):
+    """행마다 JSON 한 줄. 중간중간 나오는 {"checkpoint": ...} 를 since 로 주면 이어서 받는다."""
+    await require_superuser(user_id)
+    try:
+        position = parse_checkpoint(since) if since is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return StreamingResponse(
+        ndjson_stream(kind, position, config.EXPORT_FETCH_SIZE), media_type="application/x-ndjson"
+    )
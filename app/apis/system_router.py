@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+
+from app.apis.auth_router import get_superuser_id
+from app.services.ai_services.plan_cache import plan_generator
+from app.services.ai_services.plan_stream import plan_streamer
+from app.services.community_services.post_cache import post_cache
+from app.utils.instrumentation import slow_query_log
+from app.utils.metrics import registry
+
+# 내부 상태(SQL, 캐시, 풀 크기)를 그대로 보여주므로 관리자만 본다
+router = APIRouter(prefix="/api/system", tags=["System"], dependencies=[Depends(get_superuser_id)])
+# Prometheus 가 긁어가는 경로는 관례대로 /metrics (인증 없이 긁어 가므로 내부망에만 연다)
+metrics_router = APIRouter(tags=["System"])
+
+
+# ===== Prometheus 지표 =====
+@metrics_router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
+# ===== DB 커넥션 풀 상태 =====
+@router.get("/db/pool")
+async def get_db_pool_stats():
+    # asyncpg 는 DB 연결 때 올라오므로 import 시점에 끌어오지 않는다
+    from app.utils.db_pool import get_pool_stats
+
+    return get_pool_stats()
+
+
+# ===== 게시글 상세 캐시 (single-flight 로 합친 조회, 미리 갱신 수) =====
+@router.get("/post-cache")
+async def get_post_cache_stats():
+    return post_cache.stats()
+
+
+# ===== AI 학습 계획 캐시 적중률 =====
+@router.get("/ai/plan-cache")
+async def get_plan_cache_stats():
+    return plan_generator.stats()
+
+
+# ===== AI 학습 계획 스트리밍 (동시 스트림 수, 첫 조각까지 걸린 시간) =====
+@router.get("/ai/plan-stream")
+async def get_plan_stream_stats():
+    return plan_streamer.stats()
+
+
+# ===== 느린 SQL (값을 지운 SQL 별 합계 시간 순) =====
+@router.get("/db/slow-queries")
+async def get_slow_queries(limit: int = Query(20, ge=1, le=200)):
+    return {"threshold_seconds": slow_query_log.threshold, "items": slow_query_log.top(limit)}
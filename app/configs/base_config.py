@@ -1,7 +1,13 @@
 from enum import StrEnum
+from typing import Literal
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# 로컬 개발용 JWT 서명 키. local 이 아닌 환경에서 이 값 그대로면 기동하지 않는다
+LOCAL_JWT_SECRET_KEY = "local-only-insecure-jwt-secret"
+LOCAL_AUTH_HANDOFF_SECRET = "local-only-insecure-handoff-secret"
+
 
 class Env(StrEnum):
     LOCAL = "local"
@@ -17,4 +23,110 @@ class Config(BaseSettings):
     DB_PORT: int = 5432
     DB_USER: str = "postgres"
     DB_PASSWORD: str = "1234"
-    DB_NAME: str = "study_with_ai"
\ No newline at end of file
+    DB_NAME: str = "study_with_ai"
+
+    # asyncpg 커넥션 풀
+    DB_POOL_MINSIZE: int = 1
+    DB_POOL_MAXSIZE: int = 10
+    DB_POOL_MAX_INACTIVE_CONNECTION_LIFETIME: float = 300.0
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_COMMAND_TIMEOUT: float | None = 30.0
+    DB_SERVER_SETTINGS: dict[str, str] = {}
+
+    # 읽기 전용 replica (DB_REPLICA_HOST 가 없으면 모든 쿼리가 primary 로 간다)
+    DB_REPLICA_HOST: str | None = None
+    DB_REPLICA_PORT: int = 5432
+    DB_REPLICA_USER: str | None = None
+    DB_REPLICA_PASSWORD: str | None = None
+    DB_REPLICA_NAME: str | None = None
+    # 자신이 쓴 직후에는 replica 지연을 피하기 위해 primary 에서 읽는 시간(초)
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    # 게시글 카운터 (memory: 워커 프로세스 내부, unix: 워커 간 공유 집계 프로세스)
+    COUNTER_BACKEND: Literal["memory", "unix"] = "memory"
+    COUNTER_SOCKET_PATH: str = "/tmp/study_with_ai_counters.sock"
+    COUNTER_FLUSH_INTERVAL: float = 5.0
+    COUNTER_FLUSH_BATCH_SIZE: int = 500
+
+    # 쓰기 요청 제한 (사용자별 GCRA. memory: 워커마다 따로, unix: 카운터 집계 프로세스에서 워커 간 공유)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: Literal["memory", "unix"] = "memory"
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    # 분당 허용 수 / 한 번에 몰아서 허용하는 수
+    RATE_LIMIT_POST_PER_MINUTE: float = 10.0
+    RATE_LIMIT_POST_BURST: int = 5
+    RATE_LIMIT_COMMENT_PER_MINUTE: float = 30.0
+    RATE_LIMIT_COMMENT_BURST: int = 10
+    RATE_LIMIT_JOIN_PER_MINUTE: float = 20.0
+    RATE_LIMIT_JOIN_BURST: int = 10
+
+    # 게시글 상세 응답 캐시 (POST_CACHE_SHARED_DIR 를 주면 워커 간 공유 계층 사용, 예: /dev/shm/...)
+    POST_CACHE_TTL: float = 60.0
+    POST_CACHE_MAX_ENTRIES: int = 10000
+    POST_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    POST_CACHE_SHARED_DIR: str | None = None
+    # 만료 직전 확률적 미리 갱신 강도 (0 이면 끔), 같은 게시글 조회를 기다리는 최대 초
+    POST_CACHE_EARLY_REFRESH_BETA: float = 1.0
+    POST_CACHE_LOAD_TIMEOUT: float = 3.0
+
+    # 게시글/댓글 대량 적재 시 트랜잭션 하나에 넣을 게시글 수
+    BULK_INGEST_CHUNK_SIZE: int = 1000
+    # NDJSON 내보내기 시 서버 측 커서에서 한 번에 가져올 행 수
+    EXPORT_FETCH_SIZE: int = 1000
+    # checkpoint 에서 이어 내보낼 때 이만큼(초) 앞의 updated_at 부터 다시 읽는다.
+    # updated_at 은 커밋이 아니라 저장 시각이라, 더 늦게 커밋된 행을 놓치지 않으려면 가장 긴 쓰기 트랜잭션보다 길어야 한다
+    EXPORT_CHECKPOINT_OVERLAP_SECONDS: float = 60.0
+
+    # soft delete 후 ARCHIVE_AFTER_DAYS 일이 지난 게시글을 *_archive 테이블로 옮기는 주기(초)와 batch 크기
+    ARCHIVE_AFTER_DAYS: int = 30
+    ARCHIVE_INTERVAL: float = 3600.0
+    ARCHIVE_BATCH_SIZE: int = 500
+    ARCHIVE_BATCH_PAUSE: float = 0.1
+
+    # AI 학습 계획 생성 작업 큐 (AI_PLAN_GENERATOR: "stub" 또는 "패키지.모듈:클래스")
+    AI_PLAN_GENERATOR: str = "stub"
+    AI_PLAN_STUB_DELAY: float = 0.05
+    AI_PLAN_WORKERS: int = 4
+    AI_PLAN_MAX_PENDING: int = 100
+    AI_PLAN_MAX_ATTEMPTS: int = 3
+    AI_PLAN_RETRY_BACKOFF: float = 2.0
+    AI_PLAN_TIMEOUT: float = 120.0
+    # 생성 결과 캐시 (AI_PLAN_CACHE_DIR 를 주면 디스크에도 저장해 재시작 후에도 유지)
+    AI_PLAN_CACHE_TTL: float = 7 * 24 * 3600
+    AI_PLAN_CACHE_MAX_ENTRIES: int = 1000
+    AI_PLAN_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    AI_PLAN_CACHE_DIR: str | None = None
+    # 동시에 열어둘 수 있는 SSE 생성 스트림 수
+    AI_PLAN_MAX_STREAMS: int = 200
+
+    # 작성자 프로필 캐시 (프로필이 바뀌면 이 워커에서는 바로, 다른 워커에서는 TTL 안에 반영)
+    USER_PROFILE_CACHE_TTL: float = 60.0
+    USER_PROFILE_CACHE_MAX_ENTRIES: int = 10000
+    USER_PROFILE_CACHE_MAX_BYTES: int = 4 * 1024 * 1024
+
+    # 인증 (access token 은 서명만 확인, 로그아웃은 폐기 목록 동기화 주기 안에 모든 워커에 반영)
+    JWT_SECRET_KEY: str = LOCAL_JWT_SECRET_KEY
+    JWT_ACCESS_TOKEN_TTL: int = 15 * 60
+    JWT_REFRESH_TOKEN_TTL: int = 14 * 24 * 3600
+    TOKEN_REVOCATION_SYNC_INTERVAL: float = 5.0
+    REFRESH_TOKEN_PURGE_INTERVAL: float = 3600.0
+    REFRESH_TOKEN_PURGE_BATCH_SIZE: int = 1000
+    # 소셜 로그인 콜백(OAuth 처리 쪽)이 확인한 계정을 넘길 때 서명하는 키. JWT_SECRET_KEY 와 다른 값을 쓴다
+    AUTH_HANDOFF_SECRET: str = LOCAL_AUTH_HANDOFF_SECRET
+
+    # 요청별 지연 시간/SQL 수 계측 (METRICS_SAMPLE_RATE 비율의 요청만), 느린 SQL 기준(초)
+    METRICS_ENABLED: bool = True
+    METRICS_SAMPLE_RATE: float = 1.0
+    SLOW_QUERY_SECONDS: float = 0.2
+
+    # 응답 빠른 직렬화 결과를 pydantic 스키마와 비교 (테스트 전용, 운영에서는 끄기)
+    FAST_JSON_VALIDATE: bool = False
+
+    @model_validator(mode="after")
+    def require_jwt_secret(self) -> "Config":
+        # 공개된 기본 키로는 누구나 access token(과 로그인 hand-off)을 위조할 수 있다
+        if self.ENV != Env.LOCAL and self.JWT_SECRET_KEY == LOCAL_JWT_SECRET_KEY:
+            raise ValueError("local 이 아닌 환경에서는 JWT_SECRET_KEY 를 설정해야 합니다")
+        if self.ENV != Env.LOCAL and self.AUTH_HANDOFF_SECRET == LOCAL_AUTH_HANDOFF_SECRET:
+            raise ValueError("local 이 아닌 환경에서는 AUTH_HANDOFF_SECRET 을 설정해야 합니다")
+        return self
@@ -1,6 +1,4 @@
-from fastapi import FastAPI
 from tortoise import Tortoise
-from tortoise.contrib.fastapi import register_tortoise
 
 from app.configs import Config
 
@@ -13,16 +11,28 @@ TORTOISE_APP_MODELS = [
     "aerich.models",
 ]
 
+# primary / replica 공통 커넥션 풀 설정
+POOL_CREDENTIALS = {
+    "minsize": config.DB_POOL_MINSIZE,
+    "maxsize": config.DB_POOL_MAXSIZE,
+    "max_inactive_connection_lifetime": config.DB_POOL_MAX_INACTIVE_CONNECTION_LIFETIME,
+    "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+    "command_timeout": config.DB_COMMAND_TIMEOUT,
+    "server_settings": config.DB_SERVER_SETTINGS,
+}
+
 TORTOISE_ORM = {
     "connections": {
         "default": {
-            "engine": "tortoise.backends.asyncpg",
+            # tortoise.backends.asyncpg + 풀 통계 수집
+            "engine": "app.utils.db_pool",
             "credentials": {
                 "host": config.DB_HOST,
                 "port": config.DB_PORT,
                 "user": config.DB_USER,
                 "password": config.DB_PASSWORD,
                 "database": config.DB_NAME,
+                **POOL_CREDENTIALS,
             },
         },
     },
@@ -33,7 +43,29 @@ TORTOISE_ORM = {
     "timezone": "Asia/Seoul",
 }
 
+if config.DB_REPLICA_HOST:
+    TORTOISE_ORM["connections"]["replica"] = {
+        "engine": "app.utils.db_pool",
+        "credentials": {
+            "host": config.DB_REPLICA_HOST,
+            "port": config.DB_REPLICA_PORT,
+            "user": config.DB_REPLICA_USER or config.DB_USER,
+            "password": config.DB_REPLICA_PASSWORD or config.DB_PASSWORD,
+            "database": config.DB_REPLICA_NAME or config.DB_NAME,
+            **POOL_CREDENTIALS,
+        },
+    }
+    # 읽기 쿼리를 replica 로 보내는 라우터
+    TORTOISE_ORM["routers"] = ["app.utils.db_router.ReplicaRouter"]
+
+
+async def init_tortoise() -> None:
+    """
+    모델 등록(관계 해석)과 DB 연결을 앱 기동(lifespan) 때 한 번에 한다.
+    import 시점에는 하지 않으므로 aerich, asyncpg 같은 모듈도 이때 처음 올라온다.
+    """
+    await Tortoise.init(config=TORTOISE_ORM)
+
 
-def initialize_tortoise(app: FastAPI) -> None:
-    Tortoise.init_models(TORTOISE_APP_MODELS, "models")
-    register_tortoise(app, config=TORTOISE_ORM)
\ No newline at end of file
+async def close_tortoise() -> None:
+    await Tortoise.close_connections()
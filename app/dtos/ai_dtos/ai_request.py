@@ -0,0 +1,18 @@
+from pydantic import BaseModel, field_validator
+from pydantic_core.core_schema import ValidationInfo
+from datetime import datetime
+
+
+# ===== 학습 계획 생성 요청 DTO =====
+class StudyPlanRequest(BaseModel):
+    input_data: str
+    is_challenge: bool = False
+    start_date: datetime
+    end_date: datetime
+
+    @field_validator("end_date")
+    def validate_period(cls, v, info: ValidationInfo):
+        start_date = info.data.get("start_date")
+        if start_date and v < start_date:
+            raise ValueError("학습 종료일은 시작일 이후여야 합니다")
+        return v
@@ -0,0 +1,26 @@
+from typing import Optional
+
+from pydantic import BaseModel
+from datetime import datetime
+
+
+# ===== 학습 계획 응답 DTO =====
+class StudyPlanResponse(BaseModel):
+    id: int
+    is_challenge: bool
+    input_data: str
+    output_data: str
+    start_date: datetime
+    end_date: datetime
+    created_at: datetime
+
+
+# ===== 학습 계획 생성 작업 응답 DTO =====
+class PlanJobResponse(BaseModel):
+    id: int
+    status: str
+    attempts: int
+    error: Optional[str] = None
+    plan: Optional[StudyPlanResponse] = None
+    created_at: datetime
+    updated_at: datetime
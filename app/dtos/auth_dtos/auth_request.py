@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+
+# ===== 토큰 갱신 / 로그아웃 요청 DTO =====
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
+
+
+# ===== 소셜 로그인 hand-off 요청 DTO =====
+class LoginRequest(BaseModel):
+    # 로그인 콜백이 서명해 넘긴 계정 확인 결과
+    assertion: str
+    # 처음 로그인(가입)할 때만 필요
+    nickname: str | None = Field(default=None, min_length=1, max_length=8)
@@ -65,4 +65,12 @@ class StudyPostUpdateRequest(BaseModel):
 class CommentRequest(BaseModel):
     post_id: int
     content: str
-    parent_id: Optional[int] = None
\ No newline at end of file
+    parent_id: Optional[int] = None
+
+
+# ===== 대량 적재용 댓글 DTO (id/parent_id 는 원본 시스템의 식별자) =====
+class BulkCommentRecord(BaseModel):
+    id: int | str
+    author_id: int
+    content: str
+    parent_id: int | str | None = None
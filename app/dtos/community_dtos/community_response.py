@@ -18,6 +18,7 @@ class StudyRecruitmentResponse(BaseModel):
     study_start: datetime
     study_end: datetime
     max_member: int
+    member_count: int = 0
 
 
 class StudyPostResponse(BaseModel):
@@ -26,7 +27,11 @@ class StudyPostResponse(BaseModel):
     content: str
     category: str
     author_id: int
+    author_nickname: Optional[str] = None
+    author_profile_image_url: Optional[str] = None
     views: int
+    like_count: int = 0
+    comment_count: int = 0
     study_recruitment: StudyRecruitmentResponse
     created_at: datetime
     updated_at: datetime
@@ -43,7 +48,11 @@ class FreePostResponse(BaseModel):
     content: str
     category: str
     author_id: int
+    author_nickname: Optional[str] = None
+    author_profile_image_url: Optional[str] = None
     views: int
+    like_count: int = 0
+    comment_count: int = 0
     free_board: FreeBoardResponse
     created_at: datetime
     updated_at: datetime
@@ -60,7 +69,11 @@ class SharePostResponse(BaseModel):
     content: str
     category: str
     author_id: int
+    author_nickname: Optional[str] = None
+    author_profile_image_url: Optional[str] = None
     views: int
+    like_count: int = 0
+    comment_count: int = 0
     data_share: DataShareResponse
     created_at: datetime
     updated_at: datetime
@@ -73,4 +86,90 @@ class CommentResponse(BaseModel):
     author_id: int
     parent_id: Optional[int] = None
     created_at: datetime
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+
+# ===== 게시글 목록 응답 DTO =====
+class PostListItemResponse(BaseModel):
+    id: int
+    title: str
+    category: str
+    author_id: int
+    author_nickname: Optional[str] = None
+    author_profile_image_url: Optional[str] = None
+    views: int
+    like_count: int
+    comment_count: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class PostListResponse(BaseModel):
+    items: list[PostListItemResponse]
+    next_cursor: Optional[str] = None
+
+
+# ===== 게시글 검색 응답 DTO =====
+class PostSearchItemResponse(PostListItemResponse):
+    score: float
+
+
+class PostSearchResponse(BaseModel):
+    items: list[PostSearchItemResponse]
+    next_cursor: Optional[str] = None
+
+
+# ===== 댓글 트리 응답 DTO =====
+class CommentTreeResponse(BaseModel):
+    id: int
+    post_id: int
+    content: str
+    author_id: int
+    author_nickname: Optional[str] = None
+    author_profile_image_url: Optional[str] = None
+    parent_id: Optional[int] = None
+    depth: int
+    reply_count: int
+    replies: list["CommentTreeResponse"] = []
+    created_at: datetime
+    updated_at: datetime
+
+
+class CommentTreeListResponse(BaseModel):
+    items: list[CommentTreeResponse]
+    next_cursor: Optional[str] = None
+
+
+# ===== 좋아요 응답 DTO =====
+class LikeResponse(BaseModel):
+    post_id: int
+    liked: bool
+    like_count: int
+
+
+class LikedPostsResponse(BaseModel):
+    liked_post_ids: list[int]
+
+
+# ===== 스터디 참여 응답 DTO =====
+class StudyJoinResponse(BaseModel):
+    post_id: int
+    status: Optional[str] = None
+    member_count: int
+    max_member: int
+    waitlist_position: Optional[int] = None
+
+
+# ===== 대량 적재 결과 DTO =====
+class BulkIngestErrorResponse(BaseModel):
+    line: int
+    detail: str
+
+
+class BulkIngestResponse(BaseModel):
+    posts: int
+    comments: int
+    chunks: int
+    elapsed_seconds: float
+    posts_per_second: float
+    rows_per_second: float
+    errors: list[BulkIngestErrorResponse]
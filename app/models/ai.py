@@ -1,3 +1,4 @@
+from enum import Enum
 from tortoise import fields, Model
 from app.models.base_model import BaseModel
 
@@ -11,4 +12,26 @@ class AIStudyPlan(Model, BaseModel):
     end_date = fields.DatetimeField(null=False)    # 학습 종료일
 
     class Meta:
-        table = "ai_study_plan"
\ No newline at end of file
+        table = "ai_study_plan"
+
+
+class PlanJobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class AIPlanJobModel(Model, BaseModel):
+    user = fields.ForeignKeyField("models.UserModel", related_name="ai_plan_jobs", on_delete=fields.CASCADE, null=False)
+    status = fields.CharEnumField(PlanJobStatus, default=PlanJobStatus.PENDING, null=False)  # 처리 상태
+    is_challenge = fields.BooleanField(default=False, null=False)
+    input_data = fields.TextField(null=False)      # 사용자 prompt
+    start_date = fields.DatetimeField(null=False)
+    end_date = fields.DatetimeField(null=False)
+    attempts = fields.IntField(default=0, null=False)  # 생성 시도 횟수
+    error = fields.TextField(null=True)            # 마지막 실패 사유
+    plan = fields.ForeignKeyField("models.AIStudyPlan", related_name="jobs", on_delete=fields.SET_NULL, null=True)  # 완료 시 생성된 계획
+
+    class Meta:
+        table = "ai_plan_jobs"
@@ -22,6 +22,7 @@ class PostModel(BaseModel, Model):
     comment_count = fields.BigIntField(null=False, default=0)
     is_active = fields.BooleanField(null=False, default=True)
     deleted_at = fields.DatetimeField(null=True)
+    # search_vector(tsvector) 는 DB 가 계산하는 generated column 이라 모델에 두지 않는다 (migration 15)
     class Meta:
         table = "posts"
 
@@ -65,6 +66,7 @@ class LikeModel(BaseModel, Model):
     )
     class Meta:
         table = "likes"
+        unique_together = (("user", "post"),)
 
 
 class StudyRecruitmentModel(Model):
@@ -79,10 +81,36 @@ class StudyRecruitmentModel(Model):
     study_start = fields.DatetimeField(null=False)
     study_end = fields.DatetimeField(null=False)
     max_member = fields.IntField(null=False)
+    # 참여 확정 인원 (조건부 UPDATE 로만 변경)
+    member_count = fields.IntField(null=False, default=0)
     class Meta:
         table = "study_recruitments"
 
 
+class MemberStatus(str, Enum):
+    JOINED = "joined"
+    WAITING = "waiting"
+
+
+class StudyMemberModel(BaseModel, Model):
+    user = fields.ForeignKeyField(
+        "models.UserModel",
+        related_name="study_memberships",
+        on_delete=fields.CASCADE,
+        null=False
+    )
+    post = fields.ForeignKeyField(
+        "models.PostModel",
+        related_name="study_members",
+        on_delete=fields.CASCADE,
+        null=False
+    )
+    status = fields.CharEnumField(MemberStatus, null=False)
+    class Meta:
+        table = "study_members"
+        unique_together = (("user", "post"),)
+
+
 class FreeBoardModel(Model):
     post = fields.OneToOneField(
         "models.PostModel",
@@ -104,4 +132,89 @@ class DataShareModel(Model):
     )
     file_url = fields.TextField(null=True)
     class Meta:
-        table = "data_shares"
\ No newline at end of file
+        table = "data_shares"
+
+# ===== 보관 테이블 =====
+# soft delete 후 일정 기간이 지난 게시글과 딸린 행을 옮겨 두는 곳 (archive 서비스 참고).
+# 원본 id 를 그대로 유지하고, 원본 테이블이 비워질 수 있도록 FK 는 두지 않는다.
+class PostArchiveModel(Model):
+    id = fields.BigIntField(pk=True, generated=False)
+    user_id = fields.BigIntField(null=False, db_index=True)
+    title = fields.CharField(max_length=20, null=False)
+    content = fields.CharField(max_length=500, null=False)
+    category = fields.CharEnumField(CategoryType, null=False)
+    view_count = fields.BigIntField(null=False)
+    like_count = fields.BigIntField(null=False)
+    comment_count = fields.BigIntField(null=False)
+    is_active = fields.BooleanField(null=False)
+    deleted_at = fields.DatetimeField(null=True)
+    created_at = fields.DatetimeField(null=False)
+    updated_at = fields.DatetimeField(null=False)
+    archived_at = fields.DatetimeField(null=False)
+    class Meta:
+        table = "posts_archive"
+
+
+class CommentArchiveModel(Model):
+    id = fields.BigIntField(pk=True, generated=False)
+    user_id = fields.BigIntField(null=False)
+    post_id = fields.BigIntField(null=False, db_index=True)
+    content = fields.CharField(max_length=50, null=False)
+    parent_comment_id = fields.BigIntField(null=True)
+    created_at = fields.DatetimeField(null=False)
+    updated_at = fields.DatetimeField(null=False)
+    archived_at = fields.DatetimeField(null=False)
+    class Meta:
+        table = "comments_archive"
+
+
+class LikeArchiveModel(Model):
+    id = fields.BigIntField(pk=True, generated=False)
+    user_id = fields.BigIntField(null=False)
+    post_id = fields.BigIntField(null=False, db_index=True)
+    created_at = fields.DatetimeField(null=False)
+    updated_at = fields.DatetimeField(null=False)
+    archived_at = fields.DatetimeField(null=False)
+    class Meta:
+        table = "likes_archive"
+
+
+class StudyRecruitmentArchiveModel(Model):
+    post_id = fields.BigIntField(pk=True, generated=False)
+    recruit_start = fields.DatetimeField(null=False)
+    recruit_end = fields.DatetimeField(null=False)
+    study_start = fields.DatetimeField(null=False)
+    study_end = fields.DatetimeField(null=False)
+    max_member = fields.IntField(null=False)
+    member_count = fields.IntField(null=False)
+    archived_at = fields.DatetimeField(null=False)
+    class Meta:
+        table = "study_recruitments_archive"
+
+
+class StudyMemberArchiveModel(Model):
+    id = fields.BigIntField(pk=True, generated=False)
+    user_id = fields.BigIntField(null=False)
+    post_id = fields.BigIntField(null=False, db_index=True)
+    status = fields.CharEnumField(MemberStatus, null=False)
+    created_at = fields.DatetimeField(null=False)
+    updated_at = fields.DatetimeField(null=False)
+    archived_at = fields.DatetimeField(null=False)
+    class Meta:
+        table = "study_members_archive"
+
+
+class FreeBoardArchiveModel(Model):
+    post_id = fields.BigIntField(pk=True, generated=False)
+    image_url = fields.TextField(null=True)
+    archived_at = fields.DatetimeField(null=False)
+    class Meta:
+        table = "free_boards_archive"
+
+
+class DataShareArchiveModel(Model):
+    post_id = fields.BigIntField(pk=True, generated=False)
+    file_url = fields.TextField(null=True)
+    archived_at = fields.DatetimeField(null=False)
+    class Meta:
+        table = "data_shares_archive"
@@ -34,8 +34,9 @@ class RefreshTokenModel(BaseModel, Model):
         on_delete=fields.CASCADE,
         null=False
     )
-    token = fields.TextField(null=False)
-    expires_at = fields.DatetimeField(null=False)
+    # 원문은 저장하지 않고 sha256 hex 로 찾는다
+    token_hash = fields.CharField(max_length=64, unique=True, null=False)
+    expires_at = fields.DatetimeField(null=False, db_index=True)
     revoked = fields.BooleanField(default=False, null=False)
     class Meta:
         table = "refresh_tokens"
\ No newline at end of file
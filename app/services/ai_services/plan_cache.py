@@ -0,0 +1,207 @@
+import asyncio
+import hashlib
+import re
+import unicodedata
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
+
+from app.configs import config
+from app.services.ai_services.plan_generator import LazyPlanGenerator, PlanGenerator, PlanRequest
+from app.utils.file_cache import FileCacheTier
+from app.utils.lru_cache import TTLLRUCache
+from app.utils.single_flight import SingleFlight
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s.!?~]+$")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """전각/반각, 대소문자, 공백, 끝 문장부호 차이는 같은 요청으로 본다."""
+    text = unicodedata.normalize("NFKC", prompt).casefold()
+    text = _WHITESPACE.sub(" ", text).strip()
+    return _TRAILING_PUNCTUATION.sub("", text)
+
+
+def plan_cache_key(request: PlanRequest) -> str:
+    days = (request.end_date - request.start_date).days
+    source = f"{normalize_prompt(request.prompt)}\0{int(request.is_challenge)}\0{days}"
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+class _SharedStream:
+    """
+    upstream 스트림 하나를 여러 소비자에게 나눠 준다.
+
+    - upstream 은 task 하나가 읽고, 늦게 붙은 소비자는 이미 나온 조각부터 다시 받는다.
+    - 소비자가 모두 떠나면 upstream 도 취소한다. 끝까지 읽은 경우에만 on_complete 로 전체 결과를 넘긴다.
+    """
+
+    def __init__(
+        self,
+        upstream: AsyncIterator[str],
+        on_complete: Callable[[str], None],
+        on_close: Callable[["_SharedStream"], None],
+    ) -> None:
+        self.chunks: list[str] = []
+        self.error: Exception | None = None
+        self.closed = False
+        self.subscribers = 0
+        self._changed = asyncio.Event()
+        self._task = asyncio.create_task(self._pump(upstream, on_complete, on_close))
+
+    async def _pump(
+        self,
+        upstream: AsyncIterator[str],
+        on_complete: Callable[[str], None],
+        on_close: Callable[["_SharedStream"], None],
+    ) -> None:
+        try:
+            async with aclosing(upstream) as chunks:
+                async for chunk in chunks:
+                    self.chunks.append(chunk)
+                    self._wake()
+            on_complete("".join(self.chunks))
+        except Exception as e:
+            self.error = e
+        finally:
+            self.closed = True
+            on_close(self)
+            self._wake()
+
+    def _wake(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def subscribe(self) -> AsyncIterator[str]:
+        self.subscribers += 1
+        sent = 0
+        try:
+            while True:
+                while sent < len(self.chunks):
+                    yield self.chunks[sent]
+                    sent += 1
+                if self.closed:
+                    if self.error is not None:
+                        raise self.error
+                    return
+                await self._changed.wait()
+        finally:
+            self.subscribers -= 1
+            if self.subscribers == 0 and not self.closed:
+                # 새 소비자가 취소 중인 스트림에 붙지 않도록 먼저 닫힌 것으로 표시한다
+                self.closed = True
+                self._task.cancel()
+
+
+class CachingPlanGenerator(PlanGenerator):
+    """
+    생성 결과를 (정규화한 prompt, 챌린지 여부, 기간 일수) 로 캐시하는 생성기.
+
+    - 로컬 LRU(TTL) -> 디스크 계층(재시작 후에도 유지, 같은 호스트의 워커끼리 공유) 순서로 찾는다.
+    - 둘 다 없으면 같은 key 의 동시 요청은 single-flight 로 생성 한 번을 함께 기다린다.
+      stream 도 같은 key 로 진행 중인 upstream 이 있으면 거기서 나오는 조각을 함께 받는다.
+    """
+
+    def __init__(
+        self,
+        generator: PlanGenerator,
+        local: TTLLRUCache[str],
+        disk: FileCacheTier | None,
+        ttl: float,
+    ) -> None:
+        self.generator = generator
+        self.local = local
+        self.disk = disk
+        self.ttl = ttl
+        self.flight: SingleFlight[str] = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.streams_coalesced = 0
+        self._streams: dict[str, _SharedStream] = {}
+
+    def get(self, request: PlanRequest) -> str | None:
+        key = plan_cache_key(request)
+        plan = self.local.get(key)
+        if plan is None and self.disk is not None:
+            found = self.disk.get(key)
+            if found is not None:
+                plan = found[0].decode()
+                self.local.set(key, plan)
+        return plan
+
+    def set(self, request: PlanRequest, plan: str) -> None:
+        key = plan_cache_key(request)
+        self.local.set(key, plan)
+        if self.disk is not None:
+            self.disk.set(key, plan.encode(), self.ttl)
+
+    async def generate(self, request: PlanRequest) -> str:
+        plan = self.get(request)
+        if plan is not None:
+            self.hits += 1
+            return plan
+        self.misses += 1
+
+        async def load() -> str:
+            result = await self.generator.generate(request)
+            self.set(request, result)
+            return result
+
+        return await self.flight.do(plan_cache_key(request), load)
+
+    async def stream(self, request: PlanRequest) -> AsyncIterator[str]:
+        plan = self.get(request)
+        if plan is not None:
+            self.hits += 1
+            yield plan
+            return
+        self.misses += 1
+
+        key = plan_cache_key(request)
+        shared = self._streams.get(key)
+        if shared is None or shared.closed:
+            shared = self._streams[key] = _SharedStream(
+                self.generator.stream(request),
+                on_complete=lambda plan: self.set(request, plan),
+                on_close=lambda closed: self._forget_stream(key, closed),
+            )
+        else:
+            self.streams_coalesced += 1
+        # 소비자가 모두 중간에 닫으면 upstream 생성도 닫는다 (끝까지 생성된 결과만 캐시)
+        async with aclosing(shared.subscribe()) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+    def _forget_stream(self, key: str, shared: _SharedStream) -> None:
+        if self._streams.get(key) is shared:
+            del self._streams[key]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.flight.coalesced,
+            "streams_coalesced": self.streams_coalesced,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "entries": len(self.local),
+            "bytes": self.local.total_bytes,
+        }
+
+    def clear(self) -> None:
+        self.local.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+plan_generator = CachingPlanGenerator(
+    LazyPlanGenerator(config.AI_PLAN_GENERATOR),
+    local=TTLLRUCache(
+        max_entries=config.AI_PLAN_CACHE_MAX_ENTRIES,
+        max_bytes=config.AI_PLAN_CACHE_MAX_BYTES,
+        ttl=config.AI_PLAN_CACHE_TTL,
+        sizeof=lambda plan: len(plan.encode()),
+    ),
+    disk=FileCacheTier(config.AI_PLAN_CACHE_DIR) if config.AI_PLAN_CACHE_DIR else None,
+    ttl=config.AI_PLAN_CACHE_TTL,
+)
@@ -0,0 +1,82 @@
+import asyncio
+import importlib
+import math
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.configs import config
+
+
+@dataclass(frozen=True)
+class PlanRequest:
+    prompt: str
+    is_challenge: bool
+    start_date: datetime
+    end_date: datetime
+
+
+class PlanGenerator(ABC):
+    """
+    학습 계획 생성기.
+
+    결과를 조각(chunk) 단위로 내보내는 stream 하나만 구현하면 된다.
+    CPU 를 오래 쓰는 구현은 이벤트 루프를 막지 않도록 run_in_executor 로 넘겨야 한다.
+    """
+
+    @abstractmethod
+    def stream(self, request: PlanRequest) -> AsyncIterator[str]: ...
+
+    async def generate(self, request: PlanRequest) -> str:
+        return "".join([chunk async for chunk in self.stream(request)])
+
+
+class StubPlanGenerator(PlanGenerator):
+    """외부 모델 없이 같은 입력에 항상 같은 계획을 만드는 생성기 (로컬/테스트용)"""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+
+    async def stream(self, request: PlanRequest) -> AsyncIterator[str]:
+        weeks = max(1, math.ceil((request.end_date - request.start_date).days / 7))
+        kind = "챌린지" if request.is_challenge else "학습"
+        yield f"# {request.prompt.strip()} ({weeks}주 {kind} 계획)\n"
+        for week in range(1, weeks + 1):
+            await asyncio.sleep(self.delay)
+            yield f"- {week}주차: {request.prompt.strip()} {week}/{weeks} 단계\n"
+
+
+class LazyPlanGenerator(PlanGenerator):
+    """
+    처음 생성할 때 spec 의 생성기를 만든다.
+    외부 모델 SDK 같은 무거운 모듈을 앱 import / 기동 시간에 물리지 않기 위해 쓴다.
+    """
+
+    def __init__(self, spec: str = config.AI_PLAN_GENERATOR) -> None:
+        self.spec = spec
+        self._generator: PlanGenerator | None = None
+
+    @property
+    def generator(self) -> PlanGenerator:
+        if self._generator is None:
+            self._generator = create_plan_generator(self.spec)
+        return self._generator
+
+    def stream(self, request: PlanRequest) -> AsyncIterator[str]:
+        return self.generator.stream(request)
+
+    async def generate(self, request: PlanRequest) -> str:
+        return await self.generator.generate(request)
+
+
+def create_plan_generator(spec: str = config.AI_PLAN_GENERATOR) -> PlanGenerator:
+    """
+    "stub" 또는 "패키지.모듈:클래스" 형식으로 생성기를 고른다.
+    클래스는 인자 없이 만들 수 있어야 한다.
+    """
+    if spec == "stub":
+        return StubPlanGenerator(delay=config.AI_PLAN_STUB_DELAY)
+    module_name, _, class_name = spec.partition(":")
+    generator_class = getattr(importlib.import_module(module_name), class_name)
+    return generator_class()
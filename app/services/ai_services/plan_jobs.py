@@ -0,0 +1,212 @@
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from datetime import timedelta
+
+from tortoise import timezone
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+
+from app.configs import config
+from app.models.ai import AIPlanJobModel, AIStudyPlan, PlanJobStatus
+from app.services.ai_services.plan_cache import plan_generator
+from app.services.ai_services.plan_generator import PlanGenerator, PlanRequest
+from app.utils.db_router import use_primary
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = frozenset({PlanJobStatus.SUCCEEDED, PlanJobStatus.FAILED})
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class PlanJobQueue:
+    """
+    학습 계획 생성 작업 큐.
+
+    작업 상태는 ai_plan_jobs 테이블에 남기고, 실제 생성은 workers 개의 asyncio task 가 나눠 처리한다.
+    - 동시성: 생성은 최대 workers 개까지만 동시에 돌고, 생성 중에는 DB 커넥션을 잡지 않는다.
+    - backpressure: 처리 대기 작업이 max_pending 개면 새 요청을 받지 않는다 (QueueFullError).
+    - 재시도: 실패/시간 초과 시 retry_backoff * 2^(시도-1) 초 뒤 max_attempts 번까지 다시 시도한다.
+    - 여러 워커 프로세스가 같은 테이블을 봐도 PENDING -> RUNNING 조건부 UPDATE 로 한 곳에서만 처리한다.
+    """
+
+    def __init__(
+        self,
+        generator: PlanGenerator,
+        workers: int,
+        max_pending: int,
+        max_attempts: int,
+        retry_backoff: float,
+        timeout: float,
+    ) -> None:
+        self.generator = generator
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.timeout = timeout
+        self._queue: asyncio.Queue[int] = asyncio.Queue(maxsize=max_pending)
+        self._tasks: set[asyncio.Task] = set()
+        self._watchers: defaultdict[int, set[asyncio.Event]] = defaultdict(set)
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    async def enqueue(self, user_id: int, request: PlanRequest) -> AIPlanJobModel:
+        if self._queue.full():
+            raise QueueFullError()
+        job = await AIPlanJobModel.create(
+            user_id=user_id,
+            is_challenge=request.is_challenge,
+            input_data=request.prompt,
+            start_date=request.start_date,
+            end_date=request.end_date,
+        )
+        try:
+            self._queue.put_nowait(job.id)
+        except asyncio.QueueFull:
+            # 확인 후 INSERT 하는 사이 다른 요청이 자리를 채웠다
+            await job.delete()
+            raise QueueFullError()
+        return job
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        for _ in range(self.workers):
+            self._spawn(self._run())
+        self._spawn(self._recover())
+
+    async def stop(self) -> None:
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _recover(self) -> None:
+        # 처리 도중 프로세스가 내려가 RUNNING 으로 남은 작업은 시간 초과가 지나면 다시 대기시킨다
+        stale_before = timezone.now() - timedelta(seconds=self.timeout * 2)
+        await AIPlanJobModel.filter(status=PlanJobStatus.RUNNING, updated_at__lt=stale_before).update(
+            status=PlanJobStatus.PENDING
+        )
+        with use_primary():
+            job_ids = await AIPlanJobModel.filter(status=PlanJobStatus.PENDING).order_by("id").values_list(
+                "id", flat=True
+            )
+        for job_id in job_ids:
+            await self._queue.put(job_id)
+
+    async def _run(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._process(job_id)
+            except asyncio.CancelledError:
+                # 종료 중 처리하던 작업은 다음 기동 때 다시 처리
+                await AIPlanJobModel.filter(id=job_id, status=PlanJobStatus.RUNNING).update(
+                    status=PlanJobStatus.PENDING
+                )
+                raise
+            except Exception:
+                logger.exception("학습 계획 작업 처리 실패 (job_id=%s)", job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job_id: int) -> None:
+        claimed = await AIPlanJobModel.filter(id=job_id, status=PlanJobStatus.PENDING).update(
+            status=PlanJobStatus.RUNNING, attempts=F("attempts") + 1, updated_at=timezone.now()
+        )
+        if not claimed:
+            return
+        with use_primary():
+            job = await AIPlanJobModel.get(id=job_id)
+        self._notify(job_id)
+
+        request = PlanRequest(job.input_data, job.is_challenge, job.start_date, job.end_date)
+        try:
+            output = await asyncio.wait_for(self.generator.generate(request), self.timeout)
+        except Exception as e:
+            await self._fail(job, e)
+            return
+
+        async with in_transaction(AIPlanJobModel._meta.default_connection):
+            plan = await AIStudyPlan.create(
+                user_id=job.user_id,
+                is_challenge=job.is_challenge,
+                input_data=job.input_data,
+                output_data=output,
+                start_date=job.start_date,
+                end_date=job.end_date,
+            )
+            job.status = PlanJobStatus.SUCCEEDED
+            job.plan = plan
+            job.error = None
+            await job.save(update_fields=["status", "plan_id", "error", "updated_at"])
+        self._notify(job_id)
+
+    async def _fail(self, job: AIPlanJobModel, error: Exception) -> None:
+        job.error = f"{type(error).__name__}: {error}"[:1000]
+        retry = job.attempts < self.max_attempts
+        job.status = PlanJobStatus.PENDING if retry else PlanJobStatus.FAILED
+        await job.save(update_fields=["status", "error", "updated_at"])
+        self._notify(job.id)
+        if retry:
+            self._spawn(self._retry_later(job.id, self.retry_backoff * 2 ** (job.attempts - 1)))
+
+    async def _retry_later(self, job_id: int, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._queue.put(job_id)
+
+    def _notify(self, job_id: int) -> None:
+        for event in self._watchers.get(job_id, ()):
+            event.set()
+
+    async def watch(self, job_id: int, poll_interval: float = 1.0) -> AsyncIterator[AIPlanJobModel]:
+        """
+        상태가 바뀔 때마다 작업을 돌려주고 완료/실패하면 끝난다.
+
+        이 프로세스가 처리하는 작업은 바로 알림을 받고, 다른 프로세스가 처리하는 작업은 poll_interval 마다 확인한다.
+        """
+        event = asyncio.Event()
+        self._watchers[job_id].add(event)
+        try:
+            last = None
+            while True:
+                event.clear()
+                with use_primary():
+                    job = await AIPlanJobModel.get_or_none(id=job_id)
+                if job is None:
+                    return
+                if (job.status, job.attempts) != last:
+                    last = (job.status, job.attempts)
+                    yield job
+                if job.status in TERMINAL_STATUSES:
+                    return
+                try:
+                    await asyncio.wait_for(event.wait(), poll_interval)
+                except TimeoutError:
+                    pass
+        finally:
+            self._watchers[job_id].discard(event)
+            if not self._watchers[job_id]:
+                del self._watchers[job_id]
+
+
+plan_job_queue = PlanJobQueue(
+    plan_generator,
+    workers=config.AI_PLAN_WORKERS,
+    max_pending=config.AI_PLAN_MAX_PENDING,
+    max_attempts=config.AI_PLAN_MAX_ATTEMPTS,
+    retry_backoff=config.AI_PLAN_RETRY_BACKOFF,
+    timeout=config.AI_PLAN_TIMEOUT,
+)
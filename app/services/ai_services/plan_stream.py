@@ -0,0 +1,101 @@
+import logging
+import time
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
+from app.configs import config
+from app.models.ai import AIStudyPlan
+from app.services.ai_services.plan_cache import plan_generator
+from app.services.ai_services.plan_generator import PlanGenerator, PlanRequest
+from app.utils.metrics import Histogram, registry
+from app.utils.sse import SSE_OPEN, sse_event
+
+logger = logging.getLogger(__name__)
+
+
+class TooManyStreamsError(Exception):
+    pass
+
+
+STREAM_ERROR_DETAIL = "학습 계획을 생성하지 못했습니다. 잠시 후 다시 시도해 주세요"
+
+
+class _StreamSlot:
+    """스트림 하나가 잡은 자리. 스트림이 끝날 때와 GC 될 때 양쪽에서 부르므로 한 번만 돌려준다."""
+
+    def __init__(self, streamer: "PlanStreamer") -> None:
+        self.streamer = streamer
+        self.released = False
+
+    def release(self) -> None:
+        if not self.released:
+            self.released = True
+            self.streamer.active -= 1
+
+
+class PlanStreamer:
+    """
+    학습 계획을 생성되는 대로 SSE 로 흘려보낸다.
+
+    - 응답 헤더와 첫 바이트는 생성 시작 전에 바로 보내고, 조각이 나오면 기다리지 않고 전송한다.
+    - 스트리밍 중에는 DB 커넥션을 잡지 않고, 끝까지 생성된 경우에만 마지막에 AIStudyPlan 을 한 번 저장한다.
+    - 클라이언트가 끊으면 응답 task 가 취소되면서 upstream 생성도 같이 취소/정리된다.
+    """
+
+    def __init__(self, generator: PlanGenerator, max_streams: int) -> None:
+        self.generator = generator
+        self.max_streams = max_streams
+        self.active = 0
+        self.time_to_first_chunk = Histogram()
+
+    def open(self, user_id: int, request: PlanRequest) -> AsyncIterator[bytes]:
+        # 동시에 여러 요청이 open 해도 max_streams 를 넘지 않도록 자리는 여기서 바로 잡는다
+        if self.active >= self.max_streams:
+            raise TooManyStreamsError()
+        self.active += 1
+        slot = _StreamSlot(self)
+        stream = self._stream(slot, user_id, request)
+        # 응답이 시작되지 못하고 버려진 스트림(한 번도 돌지 않아 finally 가 없다)은 GC 될 때 자리를 돌려준다
+        weakref.finalize(stream, slot.release)
+        return stream
+
+    async def _stream(self, slot: "_StreamSlot", user_id: int, request: PlanRequest) -> AsyncIterator[bytes]:
+        started = time.perf_counter()
+        try:
+            yield SSE_OPEN
+            chunks: list[str] = []
+            try:
+                async with aclosing(self.generator.stream(request)) as upstream:
+                    async for chunk in upstream:
+                        if not chunks:
+                            self.time_to_first_chunk.observe(time.perf_counter() - started)
+                        chunks.append(chunk)
+                        yield sse_event("chunk", {"text": chunk})
+            except Exception:
+                # 예외 내용(내부 주소, upstream 응답 등)은 로그에만 남긴다
+                logger.exception("학습 계획 스트리밍 실패")
+                yield sse_event("error", {"detail": STREAM_ERROR_DETAIL})
+                return
+
+            plan = await AIStudyPlan.create(
+                user_id=user_id,
+                is_challenge=request.is_challenge,
+                input_data=request.prompt,
+                output_data="".join(chunks),
+                start_date=request.start_date,
+                end_date=request.end_date,
+            )
+            yield sse_event("done", {"plan_id": plan.id})
+        finally:
+            slot.release()
+
+    def stats(self) -> dict:
+        return {"active": self.active, "time_to_first_chunk": self.time_to_first_chunk.snapshot()}
+
+
+plan_streamer = PlanStreamer(plan_generator, max_streams=config.AI_PLAN_MAX_STREAMS)
+
+registry.register_histogram(
+    "ai_plan_stream_first_chunk_seconds", "학습 계획 스트림 첫 조각까지 걸린 시간", plan_streamer.time_to_first_chunk
+)
@@ -0,0 +1,71 @@
+"""
+소셜 로그인 hand-off.
+
+OAuth 처리(제공자 리다이렉트, code 교환, 사용자 정보 조회)는 앞단의 로그인 콜백이 하고,
+확인한 계정을 AUTH_HANDOFF_SECRET 으로 서명한 짧은 JWT(assertion)로 넘긴다.
+
+    {"provider": "google", "provider_id": "...", "email": "...", "exp": <발급 후 1~2분>}
+
+여기서는 서명만 확인하고 계정을 찾거나(처음이면 nickname 으로 가입) access / refresh token 을 발급한다.
+"""
+from tortoise.exceptions import IntegrityError
+from tortoise.transactions import in_transaction
+
+from app.configs import config
+from app.models.user import ProviderType, SocialAccountModel, UserModel
+from app.services.auth_services.tokens import TokenPair, issue_tokens
+from app.utils import jwt
+from app.utils.db_router import use_primary
+
+
+class InvalidHandoffError(Exception):
+    pass
+
+
+class SignupRequiredError(Exception):
+    """처음 로그인하는 계정인데 nickname 이 없다"""
+
+
+class AccountConflictError(Exception):
+    """닉네임이나 이메일이 이미 다른 사용자의 것이다"""
+
+
+class InactiveUserError(Exception):
+    pass
+
+
+async def login_with_handoff(assertion: str, nickname: str | None = None) -> TokenPair:
+    try:
+        claims = jwt.decode(assertion, config.AUTH_HANDOFF_SECRET)
+        provider = ProviderType(claims["provider"])
+        provider_id, email = str(claims["provider_id"]), str(claims["email"])
+    except (jwt.InvalidTokenError, KeyError, ValueError) as e:
+        raise InvalidHandoffError(str(e))
+
+    with use_primary():
+        user = await UserModel.filter(
+            social_account__provider=provider, social_account__provider_id=provider_id
+        ).first()
+    if user is None:
+        user = await _sign_up(provider, provider_id, email, nickname)
+    if not user.is_active:
+        raise InactiveUserError()
+    return await issue_tokens(user.id)
+
+
+async def _sign_up(provider: ProviderType, provider_id: str, email: str, nickname: str | None) -> UserModel:
+    if not nickname:
+        raise SignupRequiredError()
+    try:
+        async with in_transaction(UserModel._meta.default_connection):
+            account = await SocialAccountModel.create(provider=provider, provider_id=provider_id, email=email)
+            return await UserModel.create(social_account=account, nickname=nickname)
+    except IntegrityError:
+        # 같은 계정의 가입이 동시에 들어온 경우 먼저 만들어진 사용자로 로그인한다
+        with use_primary():
+            user = await UserModel.filter(
+                social_account__provider=provider, social_account__provider_id=provider_id
+            ).first()
+        if user is None:
+            raise AccountConflictError()
+        return user
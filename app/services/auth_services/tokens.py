@@ -0,0 +1,199 @@
+import asyncio
+import hashlib
+import logging
+import secrets
+import time
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+
+from app.configs import config
+from app.models.user import RefreshTokenModel, UserModel
+from app.utils import jwt
+from app.utils.db_router import use_primary
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidRefreshTokenError(Exception):
+    pass
+
+
+class TokenPair(NamedTuple):
+    access_token: str
+    refresh_token: str
+    expires_in: int
+
+
+class AccessClaims(NamedTuple):
+    user_id: int
+    session_id: int
+
+
+def hash_refresh_token(token: str) -> str:
+    # 충분히 긴 난수라 salt 없이 sha256 만으로 저장해도 되고, 그래서 해시로 바로 찾을 수 있다
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class RevocationIndex:
+    """
+    폐기된 refresh token(=세션) id 목록을 메모리에 들고 있다.
+
+    access token 은 서명만 확인하고 DB 를 보지 않으므로, 로그아웃한 세션의 access token 은 여기서 거른다.
+    - access token 수명이 지난 세션은 어차피 거를 필요가 없어 access_ttl 이 지나면 목록에서 뺀다.
+    - 다른 워커에서 폐기한 세션은 sync_interval 마다 updated_at 이후 바뀐 행만 읽어 반영한다.
+    """
+
+    def __init__(self, access_ttl: float, sync_interval: float) -> None:
+        self.access_ttl = access_ttl
+        self.sync_interval = sync_interval
+        # 세션 id -> 폐기 시각
+        self._revoked: dict[int, datetime] = {}
+        self._synced_until: datetime | None = None
+        self._task: asyncio.Task | None = None
+
+    def __contains__(self, session_id: int) -> bool:
+        return session_id in self._revoked
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def add(self, session_id: int, revoked_at: datetime) -> None:
+        self._revoked[session_id] = revoked_at
+
+    async def sync(self) -> None:
+        now = timezone.now()
+        window_start = now - timedelta(seconds=self.access_ttl)
+        since = window_start
+        if self._synced_until is not None:
+            # 늦게 커밋된 트랜잭션이 빠지지 않도록 조금 겹쳐 읽는다
+            since = max(window_start, self._synced_until - timedelta(seconds=self.sync_interval))
+        with use_primary():
+            rows = await RefreshTokenModel.filter(revoked=True, updated_at__gt=since).values_list("id", "updated_at")
+        for session_id, revoked_at in rows:
+            self._revoked[session_id] = revoked_at
+        self._revoked = {sid: at for sid, at in self._revoked.items() if at > window_start}
+        self._synced_until = now
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sync()
+            except Exception:
+                logger.exception("폐기된 토큰 목록 동기화 실패")
+            await asyncio.sleep(self.sync_interval)
+
+    def clear(self) -> None:
+        self._revoked.clear()
+        self._synced_until = None
+
+
+revocation_index = RevocationIndex(config.JWT_ACCESS_TOKEN_TTL, config.TOKEN_REVOCATION_SYNC_INTERVAL)
+
+
+def create_access_token(user_id: int, session_id: int) -> str:
+    now = int(time.time())
+    claims = {"sub": str(user_id), "sid": session_id, "iat": now, "exp": now + config.JWT_ACCESS_TOKEN_TTL}
+    return jwt.encode(claims, config.JWT_SECRET_KEY)
+
+
+def verify_access_token(token: str) -> AccessClaims:
+    """서명/만료 확인과 폐기 목록 확인만 한다 (DB 조회 없음). 실패하면 jwt.InvalidTokenError."""
+    claims = jwt.decode(token, config.JWT_SECRET_KEY)
+    try:
+        user_id, session_id = int(claims["sub"]), int(claims["sid"])
+    except (KeyError, TypeError, ValueError):
+        raise jwt.InvalidTokenError("토큰 형식이 잘못되었습니다")
+    if session_id in revocation_index:
+        raise jwt.InvalidTokenError("로그아웃된 세션입니다")
+    return AccessClaims(user_id, session_id)
+
+
+async def issue_tokens(user_id: int) -> TokenPair:
+    """로그인 성공 시 새 세션(refresh token 행)을 만들고 토큰 쌍을 발급한다"""
+    refresh_token = secrets.token_urlsafe(32)
+    session = await RefreshTokenModel.create(
+        user_id=user_id,
+        token_hash=hash_refresh_token(refresh_token),
+        expires_at=timezone.now() + timedelta(seconds=config.JWT_REFRESH_TOKEN_TTL),
+    )
+    return TokenPair(create_access_token(user_id, session.id), refresh_token, config.JWT_ACCESS_TOKEN_TTL)
+
+
+async def _revoke(token_hash: str) -> RefreshTokenModel | None:
+    # 폐기되지 않았고 만료되지 않은 토큰만 조건부 UPDATE 로 폐기 (동시에 같은 토큰으로 갱신해도 한 번만 성공)
+    now = timezone.now()
+    with use_primary():
+        session = await RefreshTokenModel.get_or_none(token_hash=token_hash, revoked=False, expires_at__gt=now)
+    if session is None:
+        return None
+    updated = await RefreshTokenModel.filter(id=session.id, revoked=False).update(revoked=True, updated_at=now)
+    if not updated:
+        return None
+    # 폐기 목록(revocation_index) 반영은 커밋된 뒤에 호출한 쪽에서 한다
+    session.revoked = True
+    session.updated_at = now
+    return session
+
+
+async def rotate_refresh_token(refresh_token: str) -> TokenPair:
+    """refresh token 을 한 번 쓰면 폐기하고 새 세션으로 바꿔 발급한다"""
+    async with in_transaction(RefreshTokenModel._meta.default_connection):
+        session = await _revoke(hash_refresh_token(refresh_token))
+        if session is None:
+            raise InvalidRefreshTokenError()
+        if not await UserModel.filter(id=session.user_id, is_active=True).exists():
+            raise InvalidRefreshTokenError()
+        tokens = await issue_tokens(session.user_id)
+    # 롤백되면 여기까지 오지 않으므로 폐기 목록과 DB 가 어긋나지 않는다
+    revocation_index.add(session.id, session.updated_at)
+    return tokens
+
+
+async def revoke_refresh_token(refresh_token: str) -> bool:
+    session = await _revoke(hash_refresh_token(refresh_token))
+    if session is None:
+        return False
+    revocation_index.add(session.id, session.updated_at)
+    return True
+
+
+async def purge_expired(batch_size: int = config.REFRESH_TOKEN_PURGE_BATCH_SIZE) -> int:
+    """만료된 refresh token 행을 batch_size 개씩 지운다 (한 번에 지워 테이블 잠금이 길어지지 않도록)"""
+    purged = 0
+    while True:
+        ids = await RefreshTokenModel.filter(expires_at__lt=timezone.now()).limit(batch_size).values_list(
+            "id", flat=True
+        )
+        if not ids:
+            return purged
+        purged += await RefreshTokenModel.filter(id__in=ids).delete()
+        if len(ids) < batch_size:
+            return purged
+
+
+async def purge_expired_forever(interval: float = config.REFRESH_TOKEN_PURGE_INTERVAL) -> None:
+    while True:
+        try:
+            purged = await purge_expired()
+            if purged:
+                logger.info("만료된 refresh token %d 개 삭제", purged)
+        except Exception:
+            logger.exception("만료된 refresh token 삭제 실패")
+        await asyncio.sleep(interval)
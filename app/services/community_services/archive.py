@@ -0,0 +1,225 @@
+"""
+soft delete 된 게시글 보관.
+
+deleted_at 이 after_days 일보다 오래된 게시글을 댓글/좋아요/스터디 참여/카테고리 확장 행과 함께
+*_archive 테이블로 옮긴다. batch_size 개 게시글씩 트랜잭션 하나로 처리해 잠금과 WAL 을 작게 유지한다.
+
+    python -m app.services.community_services.archive --after-days 30 --dry-run
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from tortoise import BaseDBAsyncClient, Tortoise, timezone
+from tortoise.transactions import in_transaction
+
+from app.configs import config
+from app.models.community import PostArchiveModel, PostModel
+from app.utils.sql import SqlParams
+
+logger = logging.getLogger(__name__)
+
+# (원본 테이블, 게시글 id 컬럼, 옮길 컬럼) - 자식 테이블부터 (FK 때문에 posts 는 마지막)
+ARCHIVE_TABLES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ("comments", "post_id", ("id", "user_id", "post_id", "content", "parent_comment_id", "created_at", "updated_at")),
+    ("likes", "post_id", ("id", "user_id", "post_id", "created_at", "updated_at")),
+    ("study_members", "post_id", ("id", "user_id", "post_id", "status", "created_at", "updated_at")),
+    (
+        "study_recruitments",
+        "post_id",
+        ("post_id", "recruit_start", "recruit_end", "study_start", "study_end", "max_member", "member_count"),
+    ),
+    ("free_boards", "post_id", ("post_id", "image_url")),
+    ("data_shares", "post_id", ("post_id", "file_url")),
+    (
+        "posts",
+        "id",
+        (
+            "id", "user_id", "title", "content", "category", "view_count", "like_count", "comment_count",
+            "is_active", "deleted_at", "created_at", "updated_at",
+        ),
+    ),
+)
+
+
+@dataclass
+class ArchiveReport:
+    dry_run: bool = False
+    batches: int = 0
+    # 테이블별 옮긴(dry_run 이면 옮길) 행 수
+    rows: dict[str, int] = field(default_factory=lambda: {table: 0 for table, _, _ in ARCHIVE_TABLES})
+    elapsed_seconds: float = 0.0
+
+    @property
+    def posts(self) -> int:
+        return self.rows["posts"]
+
+
+async def archive_deleted_posts(
+    after_days: int = config.ARCHIVE_AFTER_DAYS,
+    batch_size: int = config.ARCHIVE_BATCH_SIZE,
+    dry_run: bool = False,
+    max_batches: int | None = None,
+    pause: float = 0.0,
+    progress: Callable[[ArchiveReport], None] | None = None,
+) -> ArchiveReport:
+    """
+    보관 대상이 없을 때까지(또는 max_batches 번) 옮긴다. batch 가 끝날 때마다 progress(report) 를 부른다.
+
+    postgres 에서는 테이블마다 DELETE ... RETURNING 을 INSERT 로 바로 넘기는 statement 한 번이고,
+    대상 게시글은 FOR UPDATE SKIP LOCKED 로 잡아 여러 워커가 동시에 돌아도 겹치지 않는다.
+    dry_run 이면 아무것도 바꾸지 않고 옮길 행 수만 센다.
+    """
+    report = ArchiveReport(dry_run=dry_run)
+    started = time.perf_counter()
+    cutoff = timezone.now() - timedelta(days=after_days)
+
+    if dry_run:
+        await _count_candidates(PostModel._meta.db, cutoff, report)
+        report.batches = -(-report.posts // batch_size)
+        report.elapsed_seconds = time.perf_counter() - started
+        if progress is not None:
+            progress(report)
+        return report
+
+    while max_batches is None or report.batches < max_batches:
+        async with in_transaction(PostModel._meta.default_connection) as tx:
+            post_ids = await _claim_batch(tx, cutoff, batch_size)
+            if not post_ids:
+                break
+            archived_at = timezone.now()
+            for table, key, columns in ARCHIVE_TABLES:
+                report.rows[table] += await _move_rows(tx, table, key, columns, post_ids, archived_at)
+        report.batches += 1
+        report.elapsed_seconds = time.perf_counter() - started
+        if progress is not None:
+            progress(report)
+        if len(post_ids) < batch_size:
+            break
+        if pause:
+            # replica 지연과 I/O 가 몰리지 않도록 batch 사이에 쉰다
+            await asyncio.sleep(pause)
+
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+def _db_datetime(value):
+    # sqlite 는 문자열로 비교하므로 저장된 것과 같은 형태로 바꾼다 (postgres 는 그대로)
+    return PostArchiveModel._meta.fields_map["archived_at"].to_db_value(value, None)
+
+
+def _in_posts(p: SqlParams, column: str, post_ids: list[int]) -> str:
+    if p.is_postgres:
+        return f'"{column}" = ANY({p(post_ids, "bigint[]")})'
+    return f'"{column}" IN ({", ".join(p(post_id) for post_id in post_ids)})'
+
+
+async def _claim_batch(conn: BaseDBAsyncClient, cutoff, batch_size: int) -> list[int]:
+    p = SqlParams(conn)
+    sql = (
+        f'SELECT "id" FROM "posts" WHERE "deleted_at" < {p(_db_datetime(cutoff))} '
+        f'ORDER BY "deleted_at", "id" LIMIT {p(batch_size)}'
+    )
+    if p.is_postgres:
+        sql += " FOR UPDATE SKIP LOCKED"
+    rows = await conn.execute_query_dict(sql, p.values)
+    return [row["id"] for row in rows]
+
+
+async def _move_rows(
+    conn: BaseDBAsyncClient, table: str, key: str, columns: tuple[str, ...], post_ids: list[int], archived_at
+) -> int:
+    names = ", ".join(f'"{column}"' for column in columns)
+    p = SqlParams(conn)
+    if p.is_postgres:
+        rows = await conn.execute_query_dict(
+            f"""
+            WITH moved AS (
+                DELETE FROM "{table}" WHERE {_in_posts(p, key, post_ids)} RETURNING {names}
+            ), archived AS (
+                INSERT INTO "{table}_archive" ({names}, "archived_at")
+                SELECT {names}, {p(archived_at, "timestamptz")} FROM moved
+            )
+            SELECT COUNT(*) AS count FROM moved
+            """,
+            p.values,
+        )
+        return rows[0]["count"]
+
+    # sqlite 는 CTE 안의 DELETE ... RETURNING 을 지원하지 않으므로 같은 트랜잭션 안에서 복사 후 삭제
+    # sqlite 의 ? 는 위치 순서대로 값이 들어가므로 SQL 에 나오는 순서대로 추가
+    archived = p(_db_datetime(archived_at))
+    condition = _in_posts(p, key, post_ids)
+    count, _ = await conn.execute_query(
+        f'INSERT INTO "{table}_archive" ({names}, "archived_at") SELECT {names}, {archived} FROM "{table}" '
+        f"WHERE {condition}",
+        p.values,
+    )
+    delete = SqlParams(conn)
+    await conn.execute_query(f'DELETE FROM "{table}" WHERE {_in_posts(delete, key, post_ids)}', delete.values)
+    return count
+
+
+async def _count_candidates(conn: BaseDBAsyncClient, cutoff, report: ArchiveReport) -> None:
+    for table, key, _ in ARCHIVE_TABLES:
+        p = SqlParams(conn)
+        candidates = f'SELECT "id" FROM "posts" WHERE "deleted_at" < {p(_db_datetime(cutoff))}'
+        rows = await conn.execute_query_dict(
+            f'SELECT COUNT(*) AS count FROM "{table}" WHERE "{key}" IN ({candidates})', p.values
+        )
+        report.rows[table] = rows[0]["count"]
+
+
+async def archive_forever(interval: float = config.ARCHIVE_INTERVAL) -> None:
+    while True:
+        try:
+            report = await archive_deleted_posts(pause=config.ARCHIVE_BATCH_PAUSE)
+            if report.posts:
+                logger.info("게시글 %d 개 보관 (%s)", report.posts, report.rows)
+        except Exception:
+            logger.exception("게시글 보관 실패")
+        await asyncio.sleep(interval)
+
+
+def _print_progress(report: ArchiveReport) -> None:
+    prefix = "[dry-run] " if report.dry_run else ""
+    rows = " ".join(f"{table}={count}" for table, count in report.rows.items())
+    print(f"{prefix}batch={report.batches} {rows} elapsed={report.elapsed_seconds:.2f}s", file=sys.stderr)
+
+
+async def _run(args: argparse.Namespace) -> ArchiveReport:
+    from app.configs.tortoise_config import TORTOISE_ORM
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        return await archive_deleted_posts(
+            after_days=args.after_days,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+            max_batches=args.max_batches,
+            pause=args.pause,
+            progress=_print_progress,
+        )
+    finally:
+        await Tortoise.close_connections()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="soft delete 된 게시글 보관")
+    parser.add_argument("--after-days", type=int, default=config.ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--batch-size", type=int, default=config.ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--max-batches", type=int, help="이 횟수만큼만 처리하고 멈춘다")
+    parser.add_argument("--pause", type=float, default=config.ARCHIVE_BATCH_PAUSE, help="batch 사이 대기(초)")
+    parser.add_argument("--dry-run", action="store_true", help="옮기지 않고 대상 행 수만 센다")
+    report = asyncio.run(_run(parser.parse_args()))
+    print(f"posts={report.posts} batches={report.batches} elapsed={report.elapsed_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
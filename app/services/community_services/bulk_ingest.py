@@ -0,0 +1,303 @@
+"""
+게시글/댓글 대량 적재.
+
+NDJSON 한 줄이 게시글 하나(카테고리별 확장 정보 + 댓글 목록)이다.
+
+    {"author_id": 1, "category": "study", "title": "...", "content": "...", "recruit_start": "...", ...,
+     "comments": [{"id": "c1", "author_id": 2, "content": "..."},
+                  {"id": "c2", "author_id": 1, "content": "...", "parent_id": "c1"}]}
+
+댓글의 id/parent_id 는 원본 시스템의 식별자이고, 같은 게시글 안에서 새 id 로 바꿔 저장한다.
+
+    python -m app.services.community_services.bulk_ingest posts.ndjson
+"""
+import argparse
+import asyncio
+import sys
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import orjson
+from pydantic import BaseModel, ValidationError
+from tortoise import BaseDBAsyncClient, Tortoise, timezone
+from tortoise.transactions import in_transaction
+
+from app.configs import config
+from app.dtos.community_dtos.community_request import (
+    BulkCommentRecord,
+    FreePostRequest,
+    SharePostRequest,
+    StudyPostRequest,
+)
+from app.models.community import CategoryType, CommentModel, PostModel
+
+_REQUEST_BY_CATEGORY: dict[str, type[BaseModel]] = {
+    CategoryType.STUDY.value: StudyPostRequest,
+    CategoryType.FREE.value: FreePostRequest,
+    CategoryType.SHARE.value: SharePostRequest,
+}
+
+_POST_COLUMNS = (
+    "id", "user_id", "title", "content", "category",
+    "view_count", "like_count", "comment_count", "is_active", "created_at", "updated_at",
+)
+_EXTENSION_COLUMNS = {
+    CategoryType.STUDY.value: (
+        "study_recruitments",
+        ("post_id", "recruit_start", "recruit_end", "study_start", "study_end", "max_member", "member_count"),
+    ),
+    CategoryType.FREE.value: ("free_boards", ("post_id", "image_url")),
+    CategoryType.SHARE.value: ("data_shares", ("post_id", "file_url")),
+}
+_COMMENT_COLUMNS = ("id", "user_id", "post_id", "content", "parent_comment_id", "created_at", "updated_at")
+
+# 요청 DTO 는 길이를 검사하지 않으므로, 긴 값 하나가 COPY chunk 전체를 실패시키지 않도록 줄마다 모델 길이로 검사한다
+_POST_MAX_LENGTHS = {name: PostModel._meta.fields_map[name].max_length for name in ("title", "content")}
+_COMMENT_MAX_LENGTH = CommentModel._meta.fields_map["content"].max_length
+
+
+@dataclass
+class ParsedPost:
+    line: int
+    author_id: int
+    body: StudyPostRequest | FreePostRequest | SharePostRequest
+    comments: list[BulkCommentRecord]
+
+
+@dataclass
+class IngestReport:
+    posts: int = 0
+    comments: int = 0
+    chunks: int = 0
+    elapsed_seconds: float = 0.0
+    # (NDJSON 줄 번호, 사유) - 검증 실패 줄과 실패한 chunk 의 줄들
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def posts_per_second(self) -> float:
+        return self.posts / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return (self.posts + self.comments) / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def parse_line(line_no: int, line: bytes | str) -> ParsedPost:
+    """기존 요청 DTO 로 한 줄을 검증한다. 잘못된 줄은 ValueError."""
+    try:
+        data = orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"JSON 형식 오류: {e}")
+    if not isinstance(data, dict):
+        raise ValueError("게시글은 JSON 객체여야 합니다")
+
+    request = _REQUEST_BY_CATEGORY.get(data.get("category"))
+    if request is None:
+        raise ValueError("category 는 study, free, share 중 하나여야 합니다")
+    author_id = data.get("author_id")
+    if not isinstance(author_id, int):
+        raise ValueError("author_id 가 필요합니다")
+
+    comments = [BulkCommentRecord.model_validate(comment) for comment in data.get("comments") or []]
+    source_ids = {comment.id for comment in comments}
+    if len(source_ids) != len(comments):
+        raise ValueError("댓글 id 가 중복됩니다")
+    for comment in comments:
+        if comment.parent_id is not None and comment.parent_id not in source_ids:
+            raise ValueError(f"댓글 {comment.id} 의 원 댓글 {comment.parent_id} 이 없습니다")
+        if len(comment.content) > _COMMENT_MAX_LENGTH:
+            raise ValueError(f"댓글 {comment.id} 의 content 는 {_COMMENT_MAX_LENGTH}자 이하여야 합니다")
+
+    body = request.model_validate(data)
+    for name, max_length in _POST_MAX_LENGTHS.items():
+        if len(getattr(body, name)) > max_length:
+            raise ValueError(f"{name} 은 {max_length}자 이하여야 합니다")
+    return ParsedPost(line_no, author_id, body, _parents_first(comments))
+
+
+def _parents_first(comments: list[BulkCommentRecord]) -> list[BulkCommentRecord]:
+    # 원 댓글이 답글보다 먼저 들어가도록 정렬 (행마다 FK 를 검사하는 DB 대비)
+    children: dict[int | str | None, list[BulkCommentRecord]] = {}
+    for comment in comments:
+        children.setdefault(comment.parent_id, []).append(comment)
+    ordered = []
+    stack = list(reversed(children.get(None, [])))
+    while stack:
+        comment = stack.pop()
+        ordered.append(comment)
+        stack.extend(reversed(children.get(comment.id, [])))
+    if len(ordered) != len(comments):
+        raise ValueError("댓글의 원 댓글 관계가 순환합니다")
+    return ordered
+
+
+async def ingest(lines: AsyncIterable[bytes | str], chunk_size: int = config.BULK_INGEST_CHUNK_SIZE) -> IngestReport:
+    """
+    NDJSON 을 chunk_size 개 게시글씩 끊어 chunk 마다 트랜잭션 하나로 적재한다.
+
+    postgres 에서는 id 를 시퀀스에서 미리 받아 두고 asyncpg copy_records_to_table 로 테이블마다 COPY 한 번,
+    그 밖의 DB 에서는 executemany INSERT 로 넣는다.
+    검증에 실패한 줄과 DB 에서 실패한 chunk 는 건너뛰고 errors 에 남긴다.
+    """
+    report = IngestReport()
+    started = time.perf_counter()
+    chunk: list[ParsedPost] = []
+
+    async def flush() -> None:
+        try:
+            await _write_chunk(chunk)
+        except Exception as e:
+            report.errors.extend((post.line, f"적재 실패: {e}") for post in chunk)
+        else:
+            report.posts += len(chunk)
+            report.comments += sum(len(post.comments) for post in chunk)
+            report.chunks += 1
+        chunk.clear()
+
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            chunk.append(parse_line(line_no, line))
+        except (ValueError, ValidationError) as e:
+            report.errors.append((line_no, str(e)))
+            continue
+        if len(chunk) >= chunk_size:
+            await flush()
+    if chunk:
+        await flush()
+
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+async def _write_chunk(chunk: list[ParsedPost]) -> None:
+    now = timezone.now()
+    comment_total = sum(len(post.comments) for post in chunk)
+
+    async with in_transaction(PostModel._meta.default_connection) as tx:
+        post_ids = await _allocate_ids(tx, "posts", len(chunk))
+        comment_ids = iter(await _allocate_ids(tx, "comments", comment_total))
+
+        posts: list[tuple] = []
+        extensions: dict[str, list[tuple]] = {category: [] for category in _EXTENSION_COLUMNS}
+        comments: list[tuple] = []
+        for post_id, post in zip(post_ids, chunk):
+            body = post.body
+            posts.append((
+                post_id, post.author_id, body.title, body.content, body.category,
+                0, 0, len(post.comments), True, now, now,
+            ))
+            if isinstance(body, StudyPostRequest):
+                extensions[body.category].append((
+                    post_id, _aware(body.recruit_start), _aware(body.recruit_end),
+                    _aware(body.study_start), _aware(body.study_end), body.max_member, 0,
+                ))
+            elif isinstance(body, FreePostRequest):
+                extensions[body.category].append((post_id, body.image_url))
+            else:
+                extensions[body.category].append((post_id, body.file_url))
+
+            # 원본 댓글 id -> 새 id (답글이 원 댓글보다 먼저 나와도 되도록 먼저 모두 배정)
+            remap = {comment.id: next(comment_ids) for comment in post.comments}
+            for comment in post.comments:
+                parent_id = remap[comment.parent_id] if comment.parent_id is not None else None
+                comments.append((
+                    remap[comment.id], comment.author_id, post_id, comment.content, parent_id, now, now,
+                ))
+
+        await _write_rows(tx, "posts", _POST_COLUMNS, posts)
+        for category, (table, columns) in _EXTENSION_COLUMNS.items():
+            await _write_rows(tx, table, columns, extensions[category])
+        await _write_rows(tx, "comments", _COMMENT_COLUMNS, comments)
+
+
+def _aware(value: datetime) -> datetime:
+    # ORM 으로 저장할 때와 같이 naive datetime 은 기본 타임존으로 해석 (COPY 는 UTC 로 보낸다)
+    return timezone.make_aware(value) if timezone.is_naive(value) else value
+
+
+async def _allocate_ids(conn: BaseDBAsyncClient, table: str, count: int) -> list[int]:
+    if count == 0:
+        return []
+    if conn.capabilities.dialect == "postgres":
+        rows = await conn.execute_query_dict(
+            f"SELECT nextval(pg_get_serial_sequence('{table}', 'id')) AS id FROM generate_series(1, $1)",
+            [count],
+        )
+        return [row["id"] for row in rows]
+    # sqlite 는 쓰기 트랜잭션이 직렬화되므로 MAX(id) 다음 번호를 써도 겹치지 않는다
+    rows = await conn.execute_query_dict(f'SELECT COALESCE(MAX("id"), 0) AS id FROM "{table}"')
+    start = rows[0]["id"] + 1
+    return list(range(start, start + count))
+
+
+async def _write_rows(conn: BaseDBAsyncClient, table: str, columns: tuple[str, ...], rows: list[tuple]) -> None:
+    if not rows:
+        return
+    if conn.capabilities.dialect == "postgres":
+        async with conn.acquire_connection() as connection:
+            await connection.copy_records_to_table(table, records=rows, columns=columns)
+        return
+    placeholders = ", ".join("?" for _ in columns)
+    names = ", ".join(f'"{column}"' for column in columns)
+    await conn.execute_many(f'INSERT INTO "{table}" ({names}) VALUES ({placeholders})', rows)
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """HTTP 요청 본문 스트림을 줄 단위로 (본문 전체를 메모리에 올리지 않는다)"""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+async def _read_file(paths: Iterable[str]) -> AsyncIterator[bytes]:
+    for path in paths:
+        if path == "-":
+            for line in sys.stdin.buffer:
+                yield line
+            continue
+        with open(path, "rb") as f:
+            for line in f:
+                yield line
+
+
+async def _run(paths: list[str], chunk_size: int) -> IngestReport:
+    from app.configs.tortoise_config import TORTOISE_ORM
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        return await ingest(_read_file(paths), chunk_size=chunk_size)
+    finally:
+        await Tortoise.close_connections()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="게시글/댓글 NDJSON 대량 적재")
+    parser.add_argument("paths", nargs="+", help="NDJSON 파일 경로 ('-' 는 표준 입력)")
+    parser.add_argument("--chunk-size", type=int, default=config.BULK_INGEST_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    report = asyncio.run(_run(args.paths, args.chunk_size))
+    for line, detail in report.errors:
+        print(f"line {line}: {detail}", file=sys.stderr)
+    print(
+        f"posts={report.posts} comments={report.comments} chunks={report.chunks} "
+        f"errors={len(report.errors)} elapsed={report.elapsed_seconds:.2f}s "
+        f"posts/s={report.posts_per_second:.0f} rows/s={report.rows_per_second:.0f}"
+    )
+    if report.errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
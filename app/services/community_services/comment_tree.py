@@ -0,0 +1,109 @@
+from datetime import datetime
+
+from app.models.community import CommentModel
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.db_router import get_read_connection
+from app.utils.sql import SqlParams
+
+_DATETIME_FIELDS = ("created_at", "updated_at")
+
+
+async def load_comment_tree(
+    post_id: int,
+    parent_id: int | None,
+    cursor: str | None,
+    limit: int,
+    child_limit: int,
+    max_depth: int,
+) -> tuple[list[dict], str | None]:
+    """
+    댓글 트리를 recursive CTE 한 번으로 읽어 메모리에서 O(n) 으로 조립한다.
+
+    - parent_id 가 없으면 최상위 댓글, 있으면 그 댓글의 답글이 페이지 단위(limit)로 기준 레벨이 된다.
+    - 기준 레벨부터 max_depth 단계 아래까지 읽고, 각 노드의 답글은 SQL 에서 child_limit 개까지만 읽는다.
+      나머지 답글은 parent_id + cursor 로 같은 엔드포인트에서 이어서 조회한다.
+    """
+    conn = get_read_connection(CommentModel)
+    p = SqlParams(conn)
+
+    anchor_filters = [f"post_id = {p(post_id)}"]
+    if parent_id is None:
+        anchor_filters.append("parent_comment_id IS NULL")
+    else:
+        anchor_filters.append(f"parent_comment_id = {p(parent_id)}")
+    if cursor is not None:
+        created_at, comment_id = _parse_cursor(cursor)
+        anchor_filters.append(f"(created_at, id) > ({p(created_at)}, {p(comment_id)})")
+
+    query = f"""
+        WITH RECURSIVE anchor AS (
+            SELECT id FROM comments
+            WHERE {" AND ".join(anchor_filters)}
+            ORDER BY created_at, id
+            LIMIT {p(limit + 1)}
+        ), tree AS (
+            SELECT c.id, c.post_id, c.user_id, c.content, c.parent_comment_id,
+                   c.created_at, c.updated_at, 0 AS depth
+            FROM comments c JOIN anchor a ON c.id = a.id
+            UNION ALL
+            SELECT c.id, c.post_id, c.user_id, c.content, c.parent_comment_id,
+                   c.created_at, c.updated_at, t.depth + 1
+            FROM tree t JOIN comments c ON c.id IN (
+                -- 노드마다 앞쪽 답글 child_limit 개만 (idx_comments_post_parent_created 범위 스캔),
+                -- 나머지 답글과 그 아래는 읽지 않는다
+                SELECT r.id FROM comments r
+                WHERE r.post_id = t.post_id AND r.parent_comment_id = t.id
+                ORDER BY r.created_at, r.id
+                LIMIT {p(child_limit)}
+            )
+            WHERE t.depth < {p(max_depth)}
+        )
+        SELECT t.*, (
+            SELECT COUNT(*) FROM comments r
+            WHERE r.post_id = t.post_id AND r.parent_comment_id = t.id
+        ) AS reply_count
+        FROM tree t
+        ORDER BY t.depth, t.created_at, t.id
+    """
+    rows = await conn.execute_query_dict(query, p.values)
+
+    fields_map = CommentModel._meta.fields_map
+    nodes: dict[int, dict] = {}
+    anchors: list[dict] = []
+    for row in rows:
+        for field in _DATETIME_FIELDS:
+            row[field] = fields_map[field].to_python_value(row[field])
+        node = {
+            "id": row["id"],
+            "post_id": row["post_id"],
+            "content": row["content"],
+            "author_id": row["user_id"],
+            "parent_id": row["parent_comment_id"],
+            "depth": row["depth"],
+            "reply_count": row["reply_count"],
+            "replies": [],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+        nodes[node["id"]] = node
+        # depth, 작성순으로 정렬돼 있으므로 부모가 항상 먼저 나온다
+        if row["depth"] == 0:
+            anchors.append(node)
+        else:
+            nodes[node["parent_id"]]["replies"].append(node)
+
+    next_cursor = None
+    if len(anchors) > limit:
+        anchors = anchors[:limit]
+        last = anchors[-1]
+        next_cursor = encode_cursor(last["created_at"].isoformat(), last["id"])
+    return anchors, next_cursor
+
+
+def _parse_cursor(cursor: str) -> tuple[datetime, int]:
+    values = decode_cursor(cursor)
+    try:
+        created_at, comment_id = values
+        return datetime.fromisoformat(created_at), int(comment_id)
+    except (TypeError, ValueError):
+        raise ValueError("잘못된 커서입니다")
@@ -0,0 +1,86 @@
+"""
+워커 간 공유 카운터 집계 프로세스.
+
+    python -m app.services.community_services.counter_aggregator [--path SOCKET_PATH]
+
+COUNTER_BACKEND=unix 로 띄운 워커들은 이 프로세스에 증가분을 보내고,
+각 워커의 CounterReconciler 가 drain 해서 posts 테이블에 반영한다.
+RATE_LIMIT_BACKEND=unix 로 띄운 워커들의 쓰기 요청 제한도 여기서 함께 센다.
+"""
+import argparse
+import asyncio
+import os
+
+import orjson
+
+from app.configs import config
+from app.services.community_services.counter_store import InProcessCounterStore
+from app.utils.rate_limit import GcraLimiter, RateLimit
+
+
+class CounterAggregator:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.store = InProcessCounterStore()
+        self.limiter = GcraLimiter(config.RATE_LIMIT_MAX_KEYS)
+        self._server: asyncio.AbstractServer | None = None
+
+    async def _dispatch(self, request: dict):
+        op = request["op"]
+        if op == "incr":
+            return await self.store.incr(request["post_id"], request["field"], request["amount"])
+        if op == "pending":
+            return await self.store.pending(request["post_id"], request["field"])
+        if op == "drain":
+            deltas = await self.store.drain()
+            return [[post_id, field, amount] for (post_id, field), amount in deltas.items()]
+        if op == "restore":
+            await self.store.restore({(post_id, field): amount for post_id, field, amount in request["rows"]})
+            return None
+        if op == "clear":
+            await self.store.clear()
+            return None
+        if op == "throttle":
+            return self.limiter.check(request["key"], RateLimit(request["rate"], request["burst"]))
+        if op == "throttle_clear":
+            self.limiter.clear()
+            return None
+        raise ValueError(f"알 수 없는 요청입니다: {op}")
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                result = await self._dispatch(orjson.loads(line))
+                writer.write(orjson.dumps({"result": result}) + b"\n")
+                await writer.drain()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> None:
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="게시글 카운터 집계 프로세스")
+    parser.add_argument("--path", default=config.COUNTER_SOCKET_PATH)
+    args = parser.parse_args()
+    asyncio.run(CounterAggregator(args.path).serve_forever())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Callable
+
+from app.configs import config
+from app.models.community import PostModel
+from app.services.community_services.counter_store import (
+    COUNTER_FIELDS,
+    CounterKey,
+    CounterStore,
+    counter_store,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CounterReconciler:
+    """
+    카운터 저장소의 증가분을 주기적으로 posts 테이블에 합쳐 넣는다.
+
+    요청마다 카운터 컬럼을 UPDATE 하지 않으므로 인기 게시글도
+    flush 주기당 한 번의 batch UPDATE 로 끝나고 행 잠금 경합이 생기지 않는다.
+    """
+
+    def __init__(self, store: CounterStore, flush_interval: float, batch_size: int) -> None:
+        self.store = store
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._task: asyncio.Task | None = None
+        self._flush_listeners: list[Callable[[dict[int, dict[str, int]]], None]] = []
+
+    def add_flush_listener(self, listener: Callable[[dict[int, dict[str, int]]], None]) -> None:
+        """DB 에 반영된 {post_id: {카운터 컬럼: 증가분}} 을 받는 콜백 (캐시 갱신 등)"""
+        if listener not in self._flush_listeners:
+            self._flush_listeners.append(listener)
+
+    async def flush(self) -> int:
+        """증가분을 DB 에 반영하고 반영된 post 수를 돌려준다."""
+        deltas = await self.store.drain()
+        if not deltas:
+            return 0
+
+        per_post: defaultdict[int, dict[str, int]] = defaultdict(dict)
+        for (post_id, field), amount in deltas.items():
+            per_post[post_id][field] = amount
+
+        items = list(per_post.items())
+        flushed = 0
+        try:
+            for i in range(0, len(items), self.batch_size):
+                batch = items[i : i + self.batch_size]
+                await self._write_batch(batch)
+                flushed += len(batch)
+                for listener in self._flush_listeners:
+                    listener(dict(batch))
+        except Exception:
+            # 실패한 나머지는 저장소로 되돌려 다음 flush 때 다시 시도
+            failed: dict[CounterKey, int] = {
+                (post_id, field): amount
+                for post_id, fields in items[flushed:]
+                for field, amount in fields.items()
+            }
+            await self.store.restore(failed)
+            raise
+        return flushed
+
+    async def _write_batch(self, batch: list[tuple[int, dict[str, int]]]) -> None:
+        conn = PostModel._meta.db
+        width = len(COUNTER_FIELDS) + 1
+        if conn.capabilities.dialect == "postgres":
+            rows = ", ".join(
+                "(" + ", ".join(f"${i * width + j + 1}::bigint" for j in range(width)) + ")"
+                for i in range(len(batch))
+            )
+        else:
+            rows = ", ".join("(" + ", ".join("?" for _ in range(width)) + ")" for _ in batch)
+
+        columns = ", ".join(COUNTER_FIELDS)
+        assignments = ", ".join(f'"{field}" = "posts"."{field}" + v.{field}' for field in COUNTER_FIELDS)
+        query = (
+            f"WITH v(id, {columns}) AS (VALUES {rows}) "
+            f'UPDATE "posts" SET {assignments} FROM v WHERE "posts"."id" = v.id'
+        )
+        values = [
+            value
+            for post_id, fields in batch
+            for value in (post_id, *(fields.get(field, 0) for field in COUNTER_FIELDS))
+        ]
+        await conn.execute_query(query, values)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("카운터 반영 실패")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 task 를 멈추고 남은 증가분을 모두 반영한다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+counter_reconciler = CounterReconciler(
+    counter_store,
+    flush_interval=config.COUNTER_FLUSH_INTERVAL,
+    batch_size=config.COUNTER_FLUSH_BATCH_SIZE,
+)
@@ -0,0 +1,149 @@
+import asyncio
+from abc import ABC, abstractmethod
+from collections import defaultdict
+
+import orjson
+
+from app.configs import Config, config
+
+# 저장소를 거쳐 posts 테이블에 합쳐 넣는 비정규화 카운터 컬럼
+# like_count 는 좋아요 토글이 likes 행과 같은 트랜잭션에서 직접 갱신하므로 여기 두지 않는다
+COUNTER_FIELDS = ("view_count", "comment_count")
+
+CounterKey = tuple[int, str]
+
+
+class CounterStore(ABC):
+    """
+    게시글 카운터 증가분 저장소.
+
+    라우터는 이 인터페이스로만 카운터를 증가시키고,
+    CounterReconciler 가 drain 한 증가분을 posts 테이블에 합쳐 넣는다.
+    """
+
+    @abstractmethod
+    async def incr(self, post_id: int, field: str, amount: int = 1) -> int:
+        """증가시키고, 증가 후 아직 DB 에 반영되지 않은 증가분을 돌려준다"""
+
+    @abstractmethod
+    async def pending(self, post_id: int, field: str) -> int:
+        """아직 DB 에 반영되지 않은 증가분"""
+
+    @abstractmethod
+    async def drain(self) -> dict[CounterKey, int]:
+        """쌓인 증가분을 모두 꺼내고 비운다"""
+
+    @abstractmethod
+    async def restore(self, deltas: dict[CounterKey, int]) -> None:
+        """반영에 실패한 증가분을 되돌려 놓는다"""
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+    async def close(self) -> None:
+        pass
+
+
+class InProcessCounterStore(CounterStore):
+    """워커 프로세스 메모리에만 쌓는 저장소 (단일 워커, 테스트용)"""
+
+    def __init__(self) -> None:
+        self._deltas: defaultdict[CounterKey, int] = defaultdict(int)
+
+    async def incr(self, post_id: int, field: str, amount: int = 1) -> int:
+        self._deltas[(post_id, field)] += amount
+        return self._deltas[(post_id, field)]
+
+    async def pending(self, post_id: int, field: str) -> int:
+        return self._deltas.get((post_id, field), 0)
+
+    async def drain(self) -> dict[CounterKey, int]:
+        deltas, self._deltas = self._deltas, defaultdict(int)
+        return dict(deltas)
+
+    async def restore(self, deltas: dict[CounterKey, int]) -> None:
+        for key, amount in deltas.items():
+            self._deltas[key] += amount
+
+    async def clear(self) -> None:
+        self._deltas.clear()
+
+
+class UnixSocketClient:
+    """
+    같은 호스트의 uvicorn 워커들이 공유하는 집계 프로세스(counter_aggregator) 클라이언트.
+
+    요청/응답은 한 줄짜리 JSON 이며 워커마다 연결 하나를 재사용한다.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+
+    async def _call(self, op: str, **params):
+        async with self._lock:
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_unix_connection(self.path)
+            try:
+                self._writer.write(orjson.dumps({"op": op, **params}) + b"\n")
+                await self._writer.drain()
+                line = await self._reader.readline()
+            except BaseException:
+                # 취소 등으로 응답을 다 읽지 못한 연결을 다시 쓰면 다음 호출이 이 응답을 받으므로 버린다
+                self._abort()
+                raise
+            if not line:
+                await self._disconnect()
+                raise ConnectionError("카운터 집계 프로세스와의 연결이 끊어졌습니다")
+            return orjson.loads(line)["result"]
+
+    def _abort(self) -> None:
+        # 취소 중에도 부를 수 있도록 기다리지 않고 닫는다
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def _disconnect(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        self._reader = self._writer = None
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._disconnect()
+
+
+class UnixSocketCounterStore(UnixSocketClient, CounterStore):
+    """drain 은 집계 프로세스에서 원자적으로 처리되므로 어느 워커가 reconcile 해도 중복 반영되지 않는다."""
+
+    async def incr(self, post_id: int, field: str, amount: int = 1) -> int:
+        return await self._call("incr", post_id=post_id, field=field, amount=amount)
+
+    async def pending(self, post_id: int, field: str) -> int:
+        return await self._call("pending", post_id=post_id, field=field)
+
+    async def drain(self) -> dict[CounterKey, int]:
+        rows = await self._call("drain")
+        return {(post_id, field): amount for post_id, field, amount in rows}
+
+    async def restore(self, deltas: dict[CounterKey, int]) -> None:
+        rows = [[post_id, field, amount] for (post_id, field), amount in deltas.items()]
+        await self._call("restore", rows=rows)
+
+    async def clear(self) -> None:
+        await self._call("clear")
+
+
+def create_counter_store(config: Config) -> CounterStore:
+    if config.COUNTER_BACKEND == "unix":
+        return UnixSocketCounterStore(config.COUNTER_SOCKET_PATH)
+    return InProcessCounterStore()
+
+
+counter_store = create_counter_store(config)
@@ -0,0 +1,170 @@
+"""
+게시글/댓글 NDJSON 내보내기 (분석용).
+
+(updated_at, id) 순서로 읽고, fetch 한 번마다 다음 위치를 checkpoint 줄로 알려준다.
+checkpoint 를 since 로 다시 주면 그 뒤에 추가/수정된 행을 이어서 내보낸다.
+
+- updated_at 은 앱이 저장할 때 정한 시각이라 커밋 순서와 다를 수 있다. 이어서 읽을 때는
+  EXPORT_CHECKPOINT_OVERLAP_SECONDS 만큼 앞에서부터 다시 읽으므로, 받는 쪽은 id 기준으로 덮어써야(upsert) 한다.
+- 카운터 컬럼(view/like/comment_count)은 updated_at(사용자에게 보이는 수정 시각)을 바꾸지 않고 갱신되므로
+  증분 내보내기에 변경으로 잡히지 않는다. 내보낸 카운터 값은 그 행을 읽은 시점의 값이고,
+  최신 카운터가 필요하면 since 없이 전체를 내보낸다.
+
+    python -m app.services.community_services.export posts --out posts.ndjson --checkpoint-file posts.ckpt
+"""
+import argparse
+import asyncio
+import os
+import sys
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+
+import orjson
+from tortoise import Model, Tortoise
+
+from app.configs import config
+from app.models.community import CommentModel, PostModel
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.db_router import get_read_connection
+from app.utils.sql import SqlParams
+
+# 내보낼 모델과 컬럼 (search_vector 같은 DB 전용 컬럼은 제외)
+EXPORTS: dict[str, tuple[type[Model], tuple[str, ...]]] = {
+    "posts": (
+        PostModel,
+        (
+            "id", "user_id", "title", "content", "category", "view_count", "like_count", "comment_count",
+            "is_active", "deleted_at", "created_at", "updated_at",
+        ),
+    ),
+    "comments": (
+        CommentModel,
+        ("id", "post_id", "user_id", "content", "parent_comment_id", "created_at", "updated_at"),
+    ),
+}
+_DATETIME_FIELDS = ("deleted_at", "created_at", "updated_at")
+
+
+async def iter_batches(
+    kind: str,
+    position: tuple[datetime, int] | None,
+    fetch_size: int,
+    overlap: float = config.EXPORT_CHECKPOINT_OVERLAP_SECONDS,
+) -> AsyncIterator[list[dict]]:
+    """
+    fetch_size 개씩 읽은 행 묶음을 차례로 돌려준다. 테이블 크기와 상관없이 메모리에는 한 묶음만 있다.
+
+    postgres 에서는 REPEATABLE READ 트랜잭션 안의 서버 측 커서로 한 스냅샷을 끝까지 읽고,
+    그 밖의 DB 에서는 (updated_at, id) keyset 으로 끊어 읽는다.
+    position 이 있으면 그 updated_at 보다 overlap 초 앞부터 읽는다 (한 번 실행 안에서는 같은 행이 두 번 나오지 않는다).
+    """
+    if position is not None and overlap:
+        position = (position[0] - timedelta(seconds=overlap), 0)
+    model, columns = EXPORTS[kind]
+    conn = get_read_connection(model)
+    fields_map = model._meta.fields_map
+    datetime_fields = [field for field in _DATETIME_FIELDS if field in columns]
+
+    def to_rows(records) -> list[dict]:
+        rows = [dict(record) for record in records]
+        for row in rows:
+            for field in datetime_fields:
+                row[field] = fields_map[field].to_python_value(row[field])
+        return rows
+
+    if conn.capabilities.dialect == "postgres":
+        p = SqlParams(conn)
+        sql = _select(model, columns, p, position)
+        async with conn.acquire_connection() as connection:
+            async with connection.transaction(isolation="repeatable_read", readonly=True):
+                cursor = await connection.cursor(sql, *p.values)
+                while records := await cursor.fetch(fetch_size):
+                    yield to_rows(records)
+        return
+
+    while True:
+        p = SqlParams(conn)
+        sql = f"{_select(model, columns, p, position)} LIMIT {p(fetch_size)}"
+        rows = to_rows(await conn.execute_query_dict(sql, p.values))
+        if not rows:
+            return
+        yield rows
+        last = rows[-1]
+        position = (last["updated_at"], last["id"])
+
+
+def _select(model: type[Model], columns: tuple[str, ...], p: SqlParams, position: tuple[datetime, int] | None) -> str:
+    names = ", ".join(f'"{column}"' for column in columns)
+    sql = f'SELECT {names} FROM "{model._meta.db_table}"'
+    if position is not None:
+        updated_at, row_id = position
+        # DB 에 저장된 것과 같은 형태로 비교 (sqlite 는 문자열 비교)
+        updated_at = model._meta.fields_map["updated_at"].to_db_value(updated_at, None)
+        sql += f' WHERE ("updated_at", "id") > ({p(updated_at)}, {p(row_id)})'
+    return sql + ' ORDER BY "updated_at", "id"'
+
+
+def checkpoint_of(row: dict) -> str:
+    return encode_cursor(row["updated_at"].isoformat(), row["id"])
+
+
+def parse_checkpoint(checkpoint: str) -> tuple[datetime, int]:
+    values = decode_cursor(checkpoint)
+    try:
+        updated_at, row_id = values
+        return datetime.fromisoformat(updated_at), int(row_id)
+    except (TypeError, ValueError):
+        raise ValueError("잘못된 checkpoint 입니다")
+
+
+async def ndjson_stream(
+    kind: str, position: tuple[datetime, int] | None, fetch_size: int
+) -> AsyncIterator[bytes]:
+    """행마다 한 줄, 묶음이 끝날 때마다 {"checkpoint": ...} 한 줄"""
+    async for rows in iter_batches(kind, position, fetch_size):
+        yield b"".join(orjson.dumps(row) + b"\n" for row in rows)
+        yield orjson.dumps({"checkpoint": checkpoint_of(rows[-1])}) + b"\n"
+
+
+async def _run(kind: str, out: str | None, checkpoint_file: str | None, fetch_size: int) -> int:
+    from app.configs.tortoise_config import TORTOISE_ORM
+
+    position = None
+    if checkpoint_file and os.path.exists(checkpoint_file):
+        with open(checkpoint_file) as f:
+            checkpoint = f.read().strip()
+        position = parse_checkpoint(checkpoint) if checkpoint else None
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    exported = 0
+    output = open(out, "ab") if out else sys.stdout.buffer
+    try:
+        async for rows in iter_batches(kind, position, fetch_size):
+            output.write(b"".join(orjson.dumps(row) + b"\n" for row in rows))
+            output.flush()
+            exported += len(rows)
+            # 출력이 디스크에 쓰인 뒤에 checkpoint 를 옮겨야 중단돼도 빠지는 행이 없다
+            if checkpoint_file:
+                with open(checkpoint_file, "w") as f:
+                    f.write(checkpoint_of(rows[-1]))
+    finally:
+        if out:
+            output.close()
+        await Tortoise.close_connections()
+    return exported
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="게시글/댓글 NDJSON 내보내기")
+    parser.add_argument("kind", choices=sorted(EXPORTS))
+    parser.add_argument("--out", help="출력 파일 (이어 쓰기, 기본값은 표준 출력)")
+    parser.add_argument("--checkpoint-file", help="이어서 내보낼 위치를 읽고 저장할 파일")
+    parser.add_argument("--fetch-size", type=int, default=config.EXPORT_FETCH_SIZE)
+    args = parser.parse_args()
+
+    exported = asyncio.run(_run(args.kind, args.out, args.checkpoint_file, args.fetch_size))
+    print(f"{args.kind}: {exported} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
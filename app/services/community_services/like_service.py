@@ -0,0 +1,72 @@
+from tortoise.exceptions import IntegrityError
+from tortoise.transactions import in_transaction
+
+from app.models.community import LikeModel, PostModel
+from app.utils.sql import SqlParams
+
+
+class PostNotFoundError(Exception):
+    pass
+
+
+async def like_post(user_id: int, post_id: int) -> int:
+    """
+    좋아요 (멱등). 변경 후 like_count 를 돌려준다.
+
+    (user_id, post_id) 유니크 인덱스 + ON CONFLICT DO NOTHING 으로 중복 요청을 걸러내고,
+    실제로 행이 추가됐을 때만 같은 statement(postgres) 또는 트랜잭션 안에서 카운터를 올린다.
+    """
+    insert = (
+        'INSERT INTO "likes" ("user_id", "post_id") VALUES ({user_id}, {post_id}) '
+        'ON CONFLICT ("user_id", "post_id") DO NOTHING RETURNING "post_id"'
+    )
+    try:
+        like_count = await _toggle(insert, "+", user_id, post_id)
+    except IntegrityError:
+        raise PostNotFoundError()
+    return like_count
+
+
+async def unlike_post(user_id: int, post_id: int) -> int:
+    delete = 'DELETE FROM "likes" WHERE "user_id" = {user_id} AND "post_id" = {post_id} RETURNING "post_id"'
+    return await _toggle(delete, "-", user_id, post_id)
+
+
+async def _toggle(statement: str, op: str, user_id: int, post_id: int) -> int:
+    conn = PostModel._meta.db
+    p = SqlParams(conn)
+    statement = statement.format(user_id=p(user_id), post_id=p(post_id))
+
+    if p.is_postgres:
+        # 한 statement 로 묶어서 충돌(변경 없음)이면 posts 행은 잠그지도 않는다
+        rows = await conn.execute_query_dict(
+            f'WITH changed AS ({statement}) '
+            f'UPDATE "posts" SET "like_count" = "posts"."like_count" {op} 1 '
+            f'FROM changed WHERE "posts"."id" = changed."post_id" RETURNING "posts"."like_count"',
+            p.values,
+        )
+    else:
+        async with in_transaction(PostModel._meta.default_connection) as tx:
+            rows = await tx.execute_query_dict(statement, p.values)
+            if rows:
+                q = SqlParams(tx)
+                rows = await tx.execute_query_dict(
+                    f'UPDATE "posts" SET "like_count" = "like_count" {op} 1 '
+                    f'WHERE "id" = {q(post_id)} RETURNING "like_count"',
+                    q.values,
+                )
+
+    if rows:
+        return rows[0]["like_count"]
+    # 이미 좋아요/취소된 상태: 현재 값만 읽는다
+    like_count = await PostModel.filter(id=post_id).first().values_list("like_count", flat=True)
+    if like_count is None:
+        raise PostNotFoundError()
+    return like_count
+
+
+async def get_liked_post_ids(user_id: int, post_ids: list[int]) -> list[int]:
+    """피드용 '내가 좋아요 한 글' 일괄 조회 (쿼리 한 번)"""
+    if not post_ids:
+        return []
+    return await LikeModel.filter(user_id=user_id, post_id__in=post_ids).values_list("post_id", flat=True)
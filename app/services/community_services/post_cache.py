@@ -0,0 +1,208 @@
+import logging
+import math
+import random
+import struct
+import time
+from collections.abc import Awaitable, Callable
+from typing import NamedTuple
+
+from pydantic import BaseModel
+
+from app.configs import config
+from app.utils import fast_json
+from app.utils.file_cache import FileCacheTier
+from app.utils.lru_cache import TTLLRUCache
+from app.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# 공유 계층 값 앞부분: 캐시 시점의 posts.view_count, 만료 시각(unix time), 다시 만드는 데 걸린 초
+_META = struct.Struct("<qdd")
+
+
+def _shared_key(post_id: int) -> str:
+    # 값 앞부분 형식이 바뀌면 접두어도 바꿔 이전 형식 파일을 읽지 않게 한다
+    return f"post:{post_id}"
+
+
+class CachedPost(NamedTuple):
+    body: bytes  # views 를 뺀 직렬화 결과
+    view_count: int  # 캐시 시점의 DB 조회수
+    version: tuple[int, int] | None  # 공유 계층 버전 (공유 계층이 없으면 None)
+    expires_at: float = math.inf  # unix time
+    delta: float = 0.0  # DB 조회 + 직렬화에 걸린 초 (미리 갱신할 확률 계산용)
+
+
+class PostResponseCache:
+    """
+    게시글 상세 응답 캐시 (로컬 LRU + 선택적 공유 계층).
+
+    직렬화된 ORJSON bytes 를 그대로 저장하므로 hit 이면 DB 조회와 pydantic 검증/직렬화를 모두 건너뛴다.
+    자주 바뀌는 조회수는 본문에서 빼고 응답할 때 with_views 로 덧붙인다.
+
+    get_or_load 는 캐시 stampede 를 막는다.
+    - 같은 게시글의 miss 는 single-flight 로 묶어 워커마다 DB 조회 한 번만 한다.
+    - 만료 직전에는 요청 하나가 확률적으로 먼저 다시 만들어(XFetch) 만료 순간 miss 가 몰리지 않게 한다.
+    """
+
+    def __init__(
+        self,
+        local: TTLLRUCache[CachedPost],
+        shared: FileCacheTier | None,
+        ttl: float,
+        early_refresh_beta: float = 0.0,
+    ) -> None:
+        self.local = local
+        self.shared = shared
+        self.ttl = ttl
+        self.early_refresh_beta = early_refresh_beta
+        self.flight: SingleFlight[CachedPost | None] = SingleFlight()
+        self.loads = 0
+        self.early_refreshes = 0
+
+    def get(self, post_id: int) -> CachedPost | None:
+        entry = self.local.get(post_id)
+        if entry is not None:
+            # 다른 워커가 무효화/갱신했으면 공유 계층 버전이 바뀐다
+            if self.shared is None or self.shared.version(_shared_key(post_id)) == entry.version:
+                return entry
+            self.local.delete(post_id)
+
+        if self.shared is not None:
+            found = self.shared.get(_shared_key(post_id))
+            if found is not None:
+                payload, version = found
+                view_count, expires_at, delta = _META.unpack_from(payload)
+                entry = CachedPost(payload[_META.size :], view_count, version, expires_at, delta)
+                self.local.set(post_id, entry)
+                return entry
+        return None
+
+    def set(self, post_id: int, body: bytes, view_count: int, delta: float = 0.0) -> CachedPost:
+        expires_at = time.time() + self.ttl
+        version = None
+        if self.shared is not None:
+            version = self.shared.set(
+                _shared_key(post_id), _META.pack(view_count, expires_at, delta) + body, self.ttl
+            )
+        entry = CachedPost(body, view_count, version, expires_at, delta)
+        self.local.set(post_id, entry)
+        return entry
+
+    def should_refresh(self, entry: CachedPost) -> bool:
+        """만료가 가까울수록, 다시 만드는 데 오래 걸릴수록 높은 확률로 True"""
+        if not self.early_refresh_beta or not entry.delta:
+            return False
+        # 1 - random() 은 (0, 1] 이라 log 가 항상 정의된다
+        jitter = -entry.delta * self.early_refresh_beta * math.log(1.0 - random.random())
+        return time.time() + jitter >= entry.expires_at
+
+    async def get_or_load(
+        self,
+        post_id: int,
+        load: Callable[[], Awaitable[tuple[bytes, int] | None]],
+        timeout: float | None = None,
+    ) -> CachedPost | None:
+        """
+        캐시 항목을 돌려주고, 없거나 미리 갱신할 때면 load() 의 (본문, DB 조회수) 로 채운다.
+        load 가 None 이면 게시글이 없는 것이고 캐시하지 않는다.
+
+        같은 게시글을 동시에 기다리는 요청은 load 한 번의 결과(또는 예외)를 함께 받는다.
+        timeout 안에 끝나지 않으면 TimeoutError 이지만 load 는 계속 돌아 다음 요청을 위해 캐시를 채운다.
+        미리 갱신하다 실패하면 아직 만료되지 않은 기존 항목을 그대로 쓴다.
+        """
+        entry = self.get(post_id)
+        if entry is not None:
+            if not self.should_refresh(entry):
+                return entry
+            self.early_refreshes += 1
+
+        async def fill() -> CachedPost | None:
+            started = time.perf_counter()
+            self.loads += 1
+            loaded = await load()
+            if loaded is None:
+                return None
+            body, view_count = loaded
+            delta = time.perf_counter() - started
+            if not self.flight.is_current(post_id):
+                # 읽는 도중 이 글이 무효화됐으면(detach) 결과는 이미 기다리던 요청에만 주고 캐시에는 넣지 않는다
+                return CachedPost(body, view_count, None, time.time(), delta)
+            return self.set(post_id, body, view_count, delta)
+
+        try:
+            return await self.flight.do(post_id, fill, timeout)
+        except Exception:
+            if entry is None:
+                raise
+            logger.warning("게시글 캐시 미리 갱신 실패 (post_id=%s)", post_id, exc_info=True)
+            return entry
+
+    def invalidate(self, post_id: int) -> None:
+        # 무효화 전에 시작한 조회 결과를 이후 요청이 받지 않도록 떼어 낸다
+        self.flight.detach(post_id)
+        self.local.delete(post_id)
+        if self.shared is not None:
+            self.shared.delete(_shared_key(post_id))
+
+    def apply_counter_flush(self, flushed: dict[int, dict[str, int]]) -> None:
+        """
+        카운터 증가분이 DB 에 반영된 뒤 호출된다.
+
+        본문에 들어 있는 좋아요/댓글 수가 바뀐 글만 무효화한다.
+        조회수는 본문 밖(캐시 시점 조회수 + 반영 전 증가분)이므로, 반영된 만큼 로컬 항목의 캐시 시점 조회수로 옮겨 본문을 계속 쓴다.
+        """
+        for post_id, fields in flushed.items():
+            if any(amount for field, amount in fields.items() if field != "view_count"):
+                self.invalidate(post_id)
+            elif fields.get("view_count"):
+                self._add_views(post_id, fields["view_count"])
+
+    def _add_views(self, post_id: int, amount: int) -> None:
+        # 공유 계층 값을 읽고 고쳐 쓰면 같은 글을 동시에 반영하는 다른 워커의 증가분을 덮어쓰므로 로컬 항목만 고친다.
+        # 공유 계층의 캐시 시점 조회수는 만료 뒤 DB 에서 다시 채울 때 맞춰진다. 버전은 그대로라 로컬 항목도 계속 쓴다.
+        entry = self.get(post_id)
+        if entry is None:
+            return
+        remaining = entry.expires_at - time.time()
+        if remaining <= 0:
+            return
+        self.local.set(post_id, entry._replace(view_count=entry.view_count + amount), remaining)
+
+    def clear(self) -> None:
+        self.local.clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self.local),
+            "bytes": self.local.total_bytes,
+            "hit_ratio": self.local.hit_ratio,
+            "loads": self.loads,
+            "coalesced": self.flight.coalesced,
+            "early_refreshes": self.early_refreshes,
+        }
+
+
+def encode_post_body(response_model: type[BaseModel], data: dict) -> bytes:
+    """views 를 뺀 응답 본문 bytes"""
+    return fast_json.encode(response_model, data, exclude=("views",))
+
+
+def with_views(body: bytes, views: int) -> bytes:
+    # body 는 항상 JSON 객체이므로 마지막 '}' 앞에 필드를 덧붙인다
+    return body[:-1] + b',"views":' + str(views).encode() + b"}"
+
+
+post_cache = PostResponseCache(
+    local=TTLLRUCache(
+        max_entries=config.POST_CACHE_MAX_ENTRIES,
+        max_bytes=config.POST_CACHE_MAX_BYTES,
+        ttl=config.POST_CACHE_TTL,
+        sizeof=lambda entry: len(entry.body),
+    ),
+    shared=FileCacheTier(config.POST_CACHE_SHARED_DIR) if config.POST_CACHE_SHARED_DIR else None,
+    ttl=config.POST_CACHE_TTL,
+    early_refresh_beta=config.POST_CACHE_EARLY_REFRESH_BETA,
+)
@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+
+from app.models.community import CategoryType, PostModel
+from app.utils.cursor import decode_cursor, encode_cursor
+
+
+async def list_posts(
+    category: CategoryType | None,
+    is_active: bool,
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[PostModel], str | None]:
+    """
+    (created_at, id) 기준 keyset 페이지네이션.
+
+    OFFSET 없이 마지막으로 본 행 다음부터 읽으므로 몇 번째 페이지든
+    idx_posts_feed / idx_posts_category_feed 인덱스 범위 스캔 한 번으로 끝난다.
+    """
+    # 작성자는 응답을 만들 때 ProfileLoader 로 한 번에 (대부분 프로필 캐시에서) 채운다
+    posts = await feed_query(category, is_active, cursor).limit(limit + 1)
+
+    next_cursor = None
+    if len(posts) > limit:
+        posts = posts[:limit]
+        last = posts[-1]
+        next_cursor = encode_cursor(last.created_at.isoformat(), last.id)
+    return posts, next_cursor
+
+
+def feed_query(category: CategoryType | None, is_active: bool, cursor: str | None) -> QuerySet[PostModel]:
+    query = PostModel.filter(is_active=is_active, deleted_at__isnull=True)
+    if category is not None:
+        query = query.filter(category=category)
+    if cursor is not None:
+        created_at, post_id = _parse_cursor(cursor)
+        # OR 조건만으로는 인덱스 범위의 시작점을 정하지 못하므로(매 페이지 맨 앞부터 훑는다)
+        # 같은 뜻의 created_at <= 조건을 AND 로 더해 범위 스캔이 커서 위치에서 시작하게 한다
+        query = query.filter(created_at__lte=created_at).filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=post_id)
+        )
+    return query.order_by("-created_at", "-id")
+
+
+def _parse_cursor(cursor: str) -> tuple[datetime, int]:
+    values = decode_cursor(cursor)
+    try:
+        created_at, post_id = values
+        return datetime.fromisoformat(created_at), int(post_id)
+    except (TypeError, ValueError):
+        raise ValueError("잘못된 커서입니다")
@@ -0,0 +1,143 @@
+from datetime import datetime
+
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+
+from app.dtos.community_dtos.community_request import (
+    FreePostRequest,
+    SharePostRequest,
+    StudyPostRequest,
+    StudyPostUpdateRequest,
+)
+from app.models.community import (
+    CategoryType,
+    DataShareModel,
+    FreeBoardModel,
+    PostModel,
+    StudyRecruitmentModel,
+)
+from app.services.community_services.study_membership import resize_study
+
+# 게시글 + 작성자 + 카테고리별 확장 테이블을 LEFT JOIN 한 번으로 읽는다
+POST_RELATIONS = ("user", "study_recruitment", "free_board", "data_share")
+
+
+async def get_post(post_id: int) -> PostModel | None:
+    return (
+        await PostModel.filter(id=post_id, deleted_at__isnull=True)
+        .select_related(*POST_RELATIONS)
+        .first()
+    )
+
+
+async def get_posts(post_ids: list[int]) -> dict[int, PostModel]:
+    """목록용 batch 로딩: post 수와 상관없이 쿼리 한 번"""
+    if not post_ids:
+        return {}
+    posts = await PostModel.filter(id__in=post_ids, deleted_at__isnull=True).select_related(*POST_RELATIONS)
+    return {post.id: post for post in posts}
+
+
+async def create_post(
+    author_id: int, body: StudyPostRequest | FreePostRequest | SharePostRequest
+) -> PostModel:
+    # 카테고리는 요청 본문이 아니라 엔드포인트(요청 DTO 종류)로 정한다
+    if isinstance(body, StudyPostRequest):
+        category = CategoryType.STUDY
+    elif isinstance(body, FreePostRequest):
+        category = CategoryType.FREE
+    else:
+        category = CategoryType.SHARE
+
+    async with in_transaction(PostModel._meta.default_connection):
+        post = await PostModel.create(
+            user_id=author_id,
+            title=body.title,
+            content=body.content,
+            category=category,
+        )
+        if isinstance(body, StudyPostRequest):
+            await StudyRecruitmentModel.create(
+                post=post,
+                recruit_start=body.recruit_start,
+                recruit_end=body.recruit_end,
+                study_start=body.study_start,
+                study_end=body.study_end,
+                max_member=body.max_member,
+            )
+        elif isinstance(body, FreePostRequest):
+            await FreeBoardModel.create(post=post, image_url=body.image_url)
+        else:
+            await DataShareModel.create(post=post, file_url=body.file_url)
+    return await get_post(post.id)
+
+
+async def apply_study_post_update(post: PostModel, body: StudyPostUpdateRequest) -> PostModel:
+    """get_post 로 읽은 스터디 글에 변경된 항목만 반영한다."""
+    changes = body.model_dump(exclude_unset=True, exclude_none=True)
+    post_changes = {key: changes.pop(key) for key in ("title", "content") if key in changes}
+    recruitment = post.study_recruitment
+
+    merged = {
+        key: _aware(changes.get(key, getattr(recruitment, key)))
+        for key in ("recruit_start", "recruit_end", "study_start", "study_end")
+    }
+    if merged["study_end"] < merged["study_start"]:
+        raise ValueError("스터디 종료일은 시작일 이후여야 합니다")
+    if merged["recruit_end"] < merged["recruit_start"]:
+        raise ValueError("구인 마감일은 시작일 이후여야 합니다")
+
+    max_member = changes.pop("max_member", None)
+    async with in_transaction(PostModel._meta.default_connection) as tx:
+        if post_changes:
+            post.update_from_dict(post_changes)
+            await post.save(update_fields=[*post_changes, "updated_at"])
+        if changes:
+            recruitment.update_from_dict(changes)
+            await recruitment.save(update_fields=list(changes))
+        if max_member is not None:
+            member_count = await resize_study(tx, post.id, max_member)
+            if member_count is None:
+                # 트랜잭션을 되돌리도록 안에서 던진다
+                raise ValueError("최대 인원은 현재 참여 인원보다 적을 수 없습니다")
+            recruitment.max_member = max_member
+            recruitment.member_count = member_count
+    return post
+
+
+def _aware(value: datetime) -> datetime:
+    # 요청의 naive datetime 은 DB 에 저장될 때와 같은 기본 타임존으로 해석
+    return timezone.make_aware(value) if timezone.is_naive(value) else value
+
+
+def to_post_response(post: PostModel, views: int) -> dict:
+    """select_related 로 읽은 게시글을 카테고리별 응답 DTO 형태로 만든다."""
+    data = {
+        "id": post.id,
+        "title": post.title,
+        "content": post.content,
+        "category": post.category.value,
+        "author_id": post.user_id,
+        "author_nickname": post.user.nickname,
+        "author_profile_image_url": post.user.profile_image_url,
+        "views": views,
+        "like_count": post.like_count,
+        "comment_count": post.comment_count,
+        "created_at": post.created_at,
+        "updated_at": post.updated_at,
+    }
+    if post.category == CategoryType.STUDY:
+        recruitment = post.study_recruitment
+        data["study_recruitment"] = {
+            "recruit_start": recruitment.recruit_start,
+            "recruit_end": recruitment.recruit_end,
+            "study_start": recruitment.study_start,
+            "study_end": recruitment.study_end,
+            "max_member": recruitment.max_member,
+            "member_count": recruitment.member_count,
+        }
+    elif post.category == CategoryType.FREE:
+        data["free_board"] = {"image_url": post.free_board.image_url}
+    else:
+        data["data_share"] = {"file_url": post.data_share.file_url}
+    return data
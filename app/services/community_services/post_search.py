@@ -0,0 +1,100 @@
+from app.models.community import CategoryType, PostModel
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.db_router import get_read_connection
+from app.utils.sql import SqlParams
+
+_DATETIME_FIELDS = ("created_at", "updated_at")
+
+# idx_posts_search_trgm_live 인덱스 식과 똑같아야 인덱스를 탄다 (deleted_at IS NULL AND is_active 조건도 함께)
+_SEARCH_TEXT = "(p.title || ' ' || p.content)"
+
+
+async def search_posts(
+    query: str,
+    category: CategoryType | None,
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[dict], str | None]:
+    """
+    제목/본문 검색. (score, id) 내림차순 keyset 페이지네이션.
+
+    postgres 에서는 두 인덱스를 함께 쓴다.
+    - search_vector(generated tsvector) GIN: 단어 단위 full-text 매칭과 ts_rank 점수
+    - pg_trgm GIN: 짧은 한국어 부분 문자열(ILIKE)과 오타 허용(word_similarity) 매칭
+    그 밖의 DB(테스트용 sqlite)에서는 LIKE 매칭만 하고 점수는 0 이다.
+    """
+    conn = get_read_connection(PostModel)
+    p = SqlParams(conn)
+
+    filters = ['p."deleted_at" IS NULL', 'p."is_active"']
+    if category is not None:
+        filters.append(f'p."category" = {p(category.value)}')
+
+    pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    if p.is_postgres:
+        tsquery = f"websearch_to_tsquery('simple', {p(query)})"
+        score = (
+            f"ts_rank(p.search_vector, {tsquery})::float8 "
+            f"+ word_similarity({p(query)}, {_SEARCH_TEXT})::float8"
+        )
+        filters.append(
+            f"(p.search_vector @@ {tsquery} "
+            f"OR {_SEARCH_TEXT} ILIKE {p(pattern)} ESCAPE '\\' "
+            f"OR {p(query)} <% {_SEARCH_TEXT})"
+        )
+    else:
+        score = "0.0"
+        filters.append(f"{_SEARCH_TEXT} LIKE {p(pattern)} ESCAPE '\\'")
+
+    page_filter = ""
+    if cursor is not None:
+        last_score, last_id = _parse_cursor(cursor)
+        page_filter = f"WHERE (s.score, s.id) < ({p(last_score)}, {p(last_id)})"
+
+    sql = f"""
+        SELECT s.* FROM (
+            SELECT p.id, p.title, p.category, p.user_id,
+                   p.view_count, p.like_count, p.comment_count, p.created_at, p.updated_at,
+                   {score} AS score
+            FROM posts p
+            WHERE {" AND ".join(filters)}
+        ) s
+        {page_filter}
+        ORDER BY s.score DESC, s.id DESC
+        LIMIT {p(limit + 1)}
+    """
+    rows = await conn.execute_query_dict(sql, p.values)
+
+    fields_map = PostModel._meta.fields_map
+    items = []
+    for row in rows:
+        for field in _DATETIME_FIELDS:
+            row[field] = fields_map[field].to_python_value(row[field])
+        items.append({
+            "id": row["id"],
+            "title": row["title"],
+            "category": row["category"],
+            "author_id": row["user_id"],
+            "views": row["view_count"],
+            "like_count": row["like_count"],
+            "comment_count": row["comment_count"],
+            "score": float(row["score"]),
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        })
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(last["score"], last["id"])
+    return items, next_cursor
+
+
+def _parse_cursor(cursor: str) -> tuple[float, int]:
+    values = decode_cursor(cursor)
+    try:
+        score, post_id = values
+        return float(score), int(post_id)
+    except (TypeError, ValueError):
+        raise ValueError("잘못된 커서입니다")
@@ -0,0 +1,171 @@
+from typing import NamedTuple
+
+from tortoise import BaseDBAsyncClient, timezone
+from tortoise.transactions import in_transaction
+
+from app.models.community import MemberStatus, PostModel, StudyMemberModel, StudyRecruitmentModel
+from app.utils.db_router import use_primary
+from app.utils.sql import SqlParams
+
+
+class StudyNotFoundError(Exception):
+    pass
+
+
+class RecruitClosedError(Exception):
+    pass
+
+
+class MembershipState(NamedTuple):
+    status: MemberStatus | None  # 탈퇴했거나 참여하지 않았으면 None
+    member_count: int
+    max_member: int
+    waitlist_position: int | None  # 대기 중일 때만 1부터
+
+
+async def join_study(user_id: int, post_id: int) -> MembershipState:
+    """
+    스터디 참여 (멱등). 정원이 차 있으면 대기열 끝에 선다.
+
+    정원 확인은 SELECT ... FOR UPDATE 대신
+    member_count < max_member 조건부 UPDATE 한 번으로 하므로 동시에 몰려도 정원을 넘지 않고,
+    study_recruitments 행은 그 UPDATE 부터 커밋까지만 잠긴다.
+    """
+    recruitment = await _get_recruitment(post_id)
+    now = timezone.now()
+    if now > recruitment.recruit_end:
+        raise RecruitClosedError("구인 기간이 끝난 스터디는 참여할 수 없습니다")
+    if now < recruitment.recruit_start:
+        raise RecruitClosedError("구인 기간이 시작되지 않은 스터디입니다")
+
+    async with in_transaction(PostModel._meta.default_connection) as tx:
+        p = SqlParams(tx)
+        inserted = await tx.execute_query_dict(
+            'INSERT INTO "study_members" ("user_id", "post_id", "status") '
+            f"VALUES ({p(user_id)}, {p(post_id)}, {p(MemberStatus.WAITING.value)}) "
+            'ON CONFLICT ("user_id", "post_id") DO NOTHING RETURNING "id"',
+            p.values,
+        )
+        if inserted:
+            q = SqlParams(tx)
+            seat = await tx.execute_query_dict(
+                'UPDATE "study_recruitments" SET "member_count" = "member_count" + 1 '
+                f'WHERE "post_id" = {q(post_id)} AND "member_count" < "max_member" RETURNING "member_count"',
+                q.values,
+            )
+            if seat:
+                await _set_status(tx, inserted[0]["id"], MemberStatus.JOINED)
+
+    with use_primary():
+        return await get_membership(user_id, post_id)
+
+
+async def leave_study(user_id: int, post_id: int) -> MembershipState:
+    """
+    참여/대기 취소 (멱등). 참여자가 빠지면 대기열 맨 앞 사람이 그 자리를 바로 넘겨받는다.
+
+    자리를 member_count 감소 없이 넘기므로 대기열보다 늦게 온 참여 요청이 끼어들 수 없다.
+    """
+    await _get_recruitment(post_id)
+
+    async with in_transaction(PostModel._meta.default_connection) as tx:
+        p = SqlParams(tx)
+        removed = await tx.execute_query_dict(
+            f'DELETE FROM "study_members" WHERE "user_id" = {p(user_id)} AND "post_id" = {p(post_id)} '
+            'RETURNING "status"',
+            p.values,
+        )
+        if removed and removed[0]["status"] == MemberStatus.JOINED.value:
+            if not await _promote_next(tx, post_id):
+                r = SqlParams(tx)
+                await tx.execute_query(
+                    'UPDATE "study_recruitments" SET "member_count" = "member_count" - 1 '
+                    f'WHERE "post_id" = {r(post_id)}',
+                    r.values,
+                )
+
+    with use_primary():
+        return await get_membership(user_id, post_id)
+
+
+async def resize_study(conn: BaseDBAsyncClient, post_id: int, max_member: int) -> int | None:
+    """
+    정원 변경 (conn 의 트랜잭션 안에서). 새 member_count 를, 현재 참여 인원보다 작게 줄이려 하면 None 을 돌려준다.
+
+    정원 확인과 변경을 조건부 UPDATE 한 번으로 하므로 동시에 들어온 참여 요청과 섞여도 정원을 넘지 않고,
+    늘어난 자리는 leave_study 와 같은 방식으로 대기열 맨 앞 사람부터 넘겨받는다.
+    """
+    p = SqlParams(conn)
+    resized = await conn.execute_query_dict(
+        f'UPDATE "study_recruitments" SET "max_member" = {p(max_member)} '
+        f'WHERE "post_id" = {p(post_id)} AND "member_count" <= {p(max_member)} RETURNING "member_count"',
+        p.values,
+    )
+    if not resized:
+        return None
+
+    member_count = resized[0]["member_count"]
+    promoted = 0
+    while member_count + promoted < max_member and await _promote_next(conn, post_id):
+        promoted += 1
+    if promoted:
+        q = SqlParams(conn)
+        await conn.execute_query(
+            f'UPDATE "study_recruitments" SET "member_count" = "member_count" + {q(promoted)} '
+            f'WHERE "post_id" = {q(post_id)}',
+            q.values,
+        )
+    return member_count + promoted
+
+
+async def get_membership(user_id: int, post_id: int) -> MembershipState:
+    recruitment = await _get_recruitment(post_id)
+    member = await StudyMemberModel.filter(user_id=user_id, post_id=post_id).first()
+
+    position = None
+    if member is not None and member.status == MemberStatus.WAITING:
+        # 대기 순서는 id(가입 요청 순) 기준, idx_study_members_waitlist 로 센다
+        ahead = await StudyMemberModel.filter(
+            post_id=post_id, status=MemberStatus.WAITING, id__lt=member.id
+        ).count()
+        position = ahead + 1
+
+    return MembershipState(
+        status=member.status if member is not None else None,
+        member_count=recruitment.member_count,
+        max_member=recruitment.max_member,
+        waitlist_position=position,
+    )
+
+
+async def _get_recruitment(post_id: int) -> StudyRecruitmentModel:
+    recruitment = await StudyRecruitmentModel.filter(post_id=post_id, post__deleted_at__isnull=True).first()
+    if recruitment is None:
+        raise StudyNotFoundError()
+    return recruitment
+
+
+async def _promote_next(conn: BaseDBAsyncClient, post_id: int) -> bool:
+    """대기열 맨 앞 사람을 참여로 바꾼다. 대기 중인 사람이 없으면 False."""
+    p = SqlParams(conn)
+    # 다른 요청이 승격/취소 중인 대기 행은 건너뛴다
+    skip_locked = " FOR UPDATE SKIP LOCKED" if p.is_postgres else ""
+    promoted = await conn.execute_query_dict(
+        f'UPDATE "study_members" SET "status" = {p(MemberStatus.JOINED.value)}, '
+        '"updated_at" = CURRENT_TIMESTAMP '
+        'WHERE "id" = ('
+        f'SELECT "id" FROM "study_members" WHERE "post_id" = {p(post_id)} '
+        f'AND "status" = {p(MemberStatus.WAITING.value)} ORDER BY "id" LIMIT 1{skip_locked}'
+        ') RETURNING "id"',
+        p.values,
+    )
+    return bool(promoted)
+
+
+async def _set_status(conn: BaseDBAsyncClient, member_id: int, status: MemberStatus) -> None:
+    p = SqlParams(conn)
+    await conn.execute_query(
+        f'UPDATE "study_members" SET "status" = {p(status.value)}, "updated_at" = CURRENT_TIMESTAMP '
+        f'WHERE "id" = {p(member_id)}',
+        p.values,
+    )
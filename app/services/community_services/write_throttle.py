@@ -0,0 +1,91 @@
+import logging
+from abc import ABC, abstractmethod
+
+from app.configs import Config, config
+from app.services.community_services.counter_store import UnixSocketClient
+from app.utils.metrics import registry
+from app.utils.rate_limit import GcraLimiter, RateLimit
+
+logger = logging.getLogger(__name__)
+
+LIMITED_REQUESTS = registry.counter("write_requests_limited_total", "요청 제한으로 거절한 쓰기 요청 수")
+
+
+def write_limits(config: Config) -> dict[str, RateLimit]:
+    """제한 범위(scope)별 한도. 게시글 작성은 카테고리와 상관없이 한 범위로 센다."""
+    return {
+        "post": RateLimit(config.RATE_LIMIT_POST_PER_MINUTE / 60, config.RATE_LIMIT_POST_BURST),
+        "comment": RateLimit(config.RATE_LIMIT_COMMENT_PER_MINUTE / 60, config.RATE_LIMIT_COMMENT_BURST),
+        "join": RateLimit(config.RATE_LIMIT_JOIN_PER_MINUTE / 60, config.RATE_LIMIT_JOIN_BURST),
+    }
+
+
+class WriteThrottle(ABC):
+    """
+    사용자별 쓰기 요청 제한.
+
+    check 는 허용하면 0, 아니면 다시 시도할 수 있을 때까지 남은 초를 돌려준다.
+    """
+
+    def __init__(self, limits: dict[str, RateLimit]) -> None:
+        self.limits = limits
+
+    @abstractmethod
+    async def check(self, key: str, limit: RateLimit) -> float: ...
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+    async def close(self) -> None:
+        pass
+
+    async def retry_after(self, scope: str, user_id: int) -> float:
+        if not config.RATE_LIMIT_ENABLED:
+            return 0.0
+        try:
+            retry_after = await self.check(f"{scope}:{user_id}", self.limits[scope])
+        except (ConnectionError, OSError):
+            # 제한 저장소가 죽었다고 쓰기까지 막지는 않는다
+            logger.warning("요청 제한 저장소에 연결할 수 없어 제한 없이 처리합니다", exc_info=True)
+            return 0.0
+        if retry_after:
+            LIMITED_REQUESTS.inc()
+        return retry_after
+
+
+class InProcessWriteThrottle(WriteThrottle):
+    """워커 프로세스마다 따로 세는 제한 (워커가 N 개면 실제 한도는 최대 N 배)"""
+
+    def __init__(self, limits: dict[str, RateLimit], max_keys: int) -> None:
+        super().__init__(limits)
+        self.limiter = GcraLimiter(max_keys)
+
+    async def check(self, key: str, limit: RateLimit) -> float:
+        return self.limiter.check(key, limit)
+
+    async def clear(self) -> None:
+        self.limiter.clear()
+
+
+class UnixSocketWriteThrottle(UnixSocketClient, WriteThrottle):
+    """카운터 집계 프로세스(counter_aggregator) 하나에서 모든 워커의 요청을 함께 센다"""
+
+    def __init__(self, limits: dict[str, RateLimit], path: str) -> None:
+        UnixSocketClient.__init__(self, path)
+        WriteThrottle.__init__(self, limits)
+
+    async def check(self, key: str, limit: RateLimit) -> float:
+        return await self._call("throttle", key=key, rate=limit.rate, burst=limit.burst)
+
+    async def clear(self) -> None:
+        await self._call("throttle_clear")
+
+
+def create_write_throttle(config: Config) -> WriteThrottle:
+    limits = write_limits(config)
+    if config.RATE_LIMIT_BACKEND == "unix":
+        return UnixSocketWriteThrottle(limits, config.COUNTER_SOCKET_PATH)
+    return InProcessWriteThrottle(limits, config.RATE_LIMIT_MAX_KEYS)
+
+
+write_throttle = create_write_throttle(config)
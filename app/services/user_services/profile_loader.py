@@ -0,0 +1,129 @@
+import asyncio
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from tortoise.signals import post_delete, post_save
+
+from app.configs import config
+from app.models.user import UserModel
+from app.utils.db_router import get_read_connection
+from app.utils.lru_cache import TTLLRUCache
+from app.utils.sql import SqlParams
+
+
+class UserProfile(NamedTuple):
+    id: int
+    nickname: str
+    profile_image_url: str | None
+
+
+# 자주 보이는 작성자 프로필 (프로세스 전체 공유, 다른 워커에서 바뀐 프로필은 TTL 안에 반영)
+profile_cache: TTLLRUCache[UserProfile] = TTLLRUCache(
+    max_entries=config.USER_PROFILE_CACHE_MAX_ENTRIES,
+    max_bytes=config.USER_PROFILE_CACHE_MAX_BYTES,
+    ttl=config.USER_PROFILE_CACHE_TTL,
+    sizeof=lambda profile: len(profile.nickname) + len(profile.profile_image_url or ""),
+)
+
+
+@post_save(UserModel)
+async def _invalidate_on_save(sender, instance: UserModel, created, using_db, update_fields) -> None:
+    profile_cache.delete(instance.id)
+
+
+@post_delete(UserModel)
+async def _invalidate_on_delete(sender, instance: UserModel, using_db) -> None:
+    profile_cache.delete(instance.id)
+
+
+class ProfileLoader:
+    """
+    요청 하나 동안 쓰는 작성자 프로필 batch 로더 (DataLoader 방식).
+
+    같은 이벤트 루프 tick 안에 load 된 id 를 모아 캐시에 없는 것만 쿼리 한 번으로 읽는다.
+    한 번 읽은 프로필은 요청이 끝날 때까지 다시 읽지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self._loaded: dict[int, UserProfile | None] = {}
+        self._pending: dict[int, asyncio.Future[UserProfile | None]] = {}
+        self._dispatch_task: asyncio.Task | None = None
+        self.queries = 0
+
+    def load(self, user_id: int) -> asyncio.Future[UserProfile | None]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if user_id in self._loaded:
+            future.set_result(self._loaded[user_id])
+            return future
+        if user_id in self._pending:
+            return self._pending[user_id]
+
+        cached = profile_cache.get(user_id)
+        if cached is not None:
+            self._loaded[user_id] = cached
+            future.set_result(cached)
+            return future
+
+        if not self._pending:
+            # 지금 실행 중인 코드가 양보할 때까지 들어온 load 를 모아 한 번에 읽는다
+            self._dispatch_task = asyncio.create_task(self._dispatch())
+        self._pending[user_id] = future
+        return future
+
+    async def load_many(self, user_ids: Iterable[int]) -> dict[int, UserProfile | None]:
+        ids = list(dict.fromkeys(user_ids))
+        profiles = await asyncio.gather(*(self.load(user_id) for user_id in ids))
+        return dict(zip(ids, profiles))
+
+    async def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        try:
+            profiles = await _fetch_profiles(list(pending))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self.queries += 1
+        for user_id, future in pending.items():
+            profile = profiles.get(user_id)
+            self._loaded[user_id] = profile
+            if profile is not None:
+                profile_cache.set(user_id, profile)
+            if not future.done():
+                future.set_result(profile)
+
+    async def attach_authors(self, items: list[dict]) -> list[dict]:
+        """author_id 가 있는 응답 dict (replies 안의 답글 포함) 에 작성자 닉네임/프로필 이미지를 채운다"""
+        nodes = []
+        stack = list(items)
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.get("replies", ()))
+
+        profiles = await self.load_many(node["author_id"] for node in nodes)
+        for node in nodes:
+            profile = profiles[node["author_id"]]
+            node["author_nickname"] = profile.nickname if profile else None
+            node["author_profile_image_url"] = profile.profile_image_url if profile else None
+        return items
+
+
+async def _fetch_profiles(user_ids: list[int]) -> dict[int, UserProfile]:
+    conn = get_read_connection(UserModel)
+    p = SqlParams(conn)
+    if p.is_postgres:
+        condition = f"id = ANY({p(user_ids, 'bigint[]')})"
+    else:
+        condition = f"id IN ({', '.join(p(user_id) for user_id in user_ids)})"
+    rows = await conn.execute_query_dict(
+        f"SELECT id, nickname, profile_image_url FROM users WHERE {condition}", p.values
+    )
+    return {row["id"]: UserProfile(row["id"], row["nickname"], row["profile_image_url"]) for row in rows}
+
+
+def get_profile_loader() -> ProfileLoader:
+    """요청마다 새 로더 (FastAPI 의존성)"""
+    return ProfileLoader()
@@ -0,0 +1,114 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from datetime import datetime, timedelta
+
+from app.services.ai_services.plan_cache import CachingPlanGenerator, normalize_prompt, plan_cache_key
+from app.services.ai_services.plan_generator import PlanGenerator, PlanRequest
+from app.utils.file_cache import FileCacheTier
+from app.utils.lru_cache import TTLLRUCache
+
+START = datetime(2025, 1, 1)
+
+
+def request(prompt: str, days: int = 90, is_challenge: bool = False) -> PlanRequest:
+    return PlanRequest(prompt, is_challenge, START, START + timedelta(days=days))
+
+
+class CountingGenerator(PlanGenerator):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def stream(self, request: PlanRequest) -> AsyncIterator[str]:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        yield f"plan {self.calls}"
+
+
+class SlowStreamGenerator(PlanGenerator):
+    """release 될 때까지 두 번째 조각을 내지 않는 생성기"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.closed = 0
+        self.release = asyncio.Event()
+
+    async def stream(self, request: PlanRequest) -> AsyncIterator[str]:
+        self.calls += 1
+        try:
+            yield "첫 조각 "
+            await self.release.wait()
+            yield "나머지"
+        finally:
+            self.closed += 1
+
+
+async def read_all(stream: AsyncIterator[str]) -> str:
+    return "".join([chunk async for chunk in stream])
+
+
+def make_cache(generator: PlanGenerator, disk: FileCacheTier | None = None) -> CachingPlanGenerator:
+    return CachingPlanGenerator(generator, TTLLRUCache(max_entries=10, max_bytes=1024, ttl=60), disk, ttl=60)
+
+
+class TestPlanCache:
+    def test_key_normalization(self):
+        """공백/대소문자/끝 문장부호 차이는 같은 key, 기간이나 챌린지 여부가 다르면 다른 key"""
+        assert normalize_prompt("  3개월   Python 스터디 계획!! ") == "3개월 python 스터디 계획"
+        assert plan_cache_key(request("Python 계획")) == plan_cache_key(request("python  계획."))
+        assert plan_cache_key(request("Python 계획")) != plan_cache_key(request("Python 계획", days=30))
+        assert plan_cache_key(request("Python 계획")) != plan_cache_key(request("Python 계획", is_challenge=True))
+
+    async def test_concurrent_identical_requests_share_generation(self):
+        generator = CountingGenerator()
+        cache = make_cache(generator)
+
+        plans = await asyncio.gather(*(cache.generate(request("파이썬 계획")) for _ in range(5)))
+        again = await cache.generate(request("파이썬  계획"))
+
+        assert generator.calls == 1
+        assert set(plans) == {again}
+        stats = cache.stats()
+        assert stats["coalesced"] == 4
+        assert stats["hits"] == 1
+
+    async def test_concurrent_identical_streams_share_upstream(self):
+        """진행 중인 스트림에 늦게 붙은 요청도 upstream 호출 하나에서 처음부터 같은 조각을 받는다"""
+        generator = SlowStreamGenerator()
+        cache = make_cache(generator)
+
+        first = asyncio.create_task(read_all(cache.stream(request("러스트 계획"))))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(read_all(cache.stream(request("러스트  계획"))))
+        await asyncio.sleep(0.01)
+        generator.release.set()
+
+        assert await asyncio.gather(first, second) == ["첫 조각 나머지", "첫 조각 나머지"]
+        assert generator.calls == 1
+        assert cache.stats()["streams_coalesced"] == 1
+        assert cache.get(request("러스트 계획")) == "첫 조각 나머지"
+
+    async def test_shared_stream_closes_upstream_after_last_consumer(self):
+        generator = SlowStreamGenerator()
+        cache = make_cache(generator)
+
+        async with aclosing(cache.stream(request("고 계획"))) as first:
+            async with aclosing(cache.stream(request("고 계획"))) as second:
+                assert await first.__anext__() == await second.__anext__() == "첫 조각 "
+            # 한 소비자가 떠나도 나머지 소비자의 upstream 은 그대로 돈다
+            await asyncio.sleep(0)
+            assert generator.closed == 0
+        await asyncio.sleep(0)
+
+        assert generator.closed == 1
+        assert cache.get(request("고 계획")) is None
+
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        first = make_cache(CountingGenerator(), FileCacheTier(str(tmp_path)))
+        plan = await first.generate(request("자바 계획"))
+
+        restarted_generator = CountingGenerator()
+        restarted = make_cache(restarted_generator, FileCacheTier(str(tmp_path)))
+
+        assert await restarted.generate(request("자바 계획")) == plan
+        assert restarted_generator.calls == 0
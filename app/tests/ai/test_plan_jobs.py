@@ -0,0 +1,108 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+
+from app.models.ai import AIPlanJobModel, AIStudyPlan, PlanJobStatus
+from app.services.ai_services.plan_generator import PlanGenerator, PlanRequest, StubPlanGenerator
+from app.services.ai_services.plan_jobs import PlanJobQueue, QueueFullError, plan_job_queue
+
+START = datetime(2025, 1, 1)
+REQUEST = PlanRequest("파이썬 기초", False, START, START + timedelta(days=21))
+
+
+class FlakyGenerator(PlanGenerator):
+    """처음 failures 번은 실패하는 생성기"""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    async def stream(self, request: PlanRequest) -> AsyncIterator[str]:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("upstream error")
+        yield "계획"
+
+
+def make_queue(generator: PlanGenerator, **kwargs) -> PlanJobQueue:
+    options = {"workers": 2, "max_pending": 10, "max_attempts": 3, "retry_backoff": 0.0, "timeout": 5.0}
+    return PlanJobQueue(generator, **{**options, **kwargs})
+
+
+async def wait_finished(job_id: int) -> AIPlanJobModel:
+    for _ in range(200):
+        job = await AIPlanJobModel.get(id=job_id)
+        if job.status in (PlanJobStatus.SUCCEEDED, PlanJobStatus.FAILED):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("작업이 끝나지 않았습니다")
+
+
+@pytest.fixture
+async def running_queue():
+    plan_job_queue.start()
+    yield plan_job_queue
+    await plan_job_queue.stop()
+
+
+class TestPlanJobQueue:
+    async def test_stub_generator_is_deterministic(self):
+        generator = StubPlanGenerator()
+        assert await generator.generate(REQUEST) == await generator.generate(REQUEST)
+        assert "3주차" in await generator.generate(REQUEST)
+
+    async def test_retries_then_succeeds(self, user):
+        """실패하면 다시 대기시켰다가 재시도하고, 성공하면 AIStudyPlan 을 남긴다"""
+        generator = FlakyGenerator(failures=2)
+        queue = make_queue(generator)
+        queue.start()
+        try:
+            job = await queue.enqueue(user.id, REQUEST)
+            job = await wait_finished(job.id)
+        finally:
+            await queue.stop()
+
+        assert job.status == PlanJobStatus.SUCCEEDED
+        assert job.attempts == 3
+        assert (await AIStudyPlan.get(id=job.plan_id)).output_data == "계획"
+
+    async def test_gives_up_after_max_attempts(self, user):
+        queue = make_queue(FlakyGenerator(failures=10), max_attempts=2)
+        queue.start()
+        try:
+            job = await wait_finished((await queue.enqueue(user.id, REQUEST)).id)
+        finally:
+            await queue.stop()
+
+        assert job.status == PlanJobStatus.FAILED
+        assert job.attempts == 2
+        assert "upstream error" in job.error
+
+    async def test_backpressure(self, user):
+        """처리 대기열이 가득 차면 새 작업을 받지 않는다"""
+        queue = make_queue(StubPlanGenerator(), max_pending=1)
+        await queue.enqueue(user.id, REQUEST)
+
+        with pytest.raises(QueueFullError):
+            await queue.enqueue(user.id, REQUEST)
+
+    async def test_job_endpoints(self, async_client, running_queue):
+        response = await async_client.post("/api/ai/plans/jobs", json={
+            "input_data": "알고리즘",
+            "start_date": START.isoformat(),
+            "end_date": (START + timedelta(days=7)).isoformat(),
+        })
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+
+        async with async_client.stream("GET", f"/api/ai/plans/jobs/{job_id}/events") as events:
+            lines = [line async for line in events.aiter_lines() if line.startswith("data: ")]
+        last = orjson.loads(lines[-1].removeprefix("data: "))
+        assert last["status"] == "succeeded"
+        assert "알고리즘" in last["plan"]["output_data"]
+
+        polled = await async_client.get(f"/api/ai/plans/jobs/{job_id}")
+        assert polled.json()["plan"]["id"] == last["plan"]["id"]
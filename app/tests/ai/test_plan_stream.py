@@ -0,0 +1,133 @@
+import asyncio
+import gc
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+
+from app.models.ai import AIStudyPlan
+from app.services.ai_services.plan_generator import PlanGenerator, PlanRequest
+from app.services.ai_services.plan_stream import (
+    STREAM_ERROR_DETAIL,
+    PlanStreamer,
+    TooManyStreamsError,
+    plan_streamer,
+)
+
+START = datetime(2025, 1, 1)
+REQUEST = PlanRequest("자료구조", False, START, START + timedelta(days=14))
+
+
+class BlockingGenerator(PlanGenerator):
+    """첫 조각 뒤에 release 될 때까지 멈춰 있는 생성기"""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.closed = False
+
+    async def stream(self, request: PlanRequest) -> AsyncIterator[str]:
+        try:
+            yield "첫 조각"
+            await self.release.wait()
+            yield "나머지"
+        finally:
+            self.closed = True
+
+
+class BrokenGenerator(PlanGenerator):
+    async def stream(self, request: PlanRequest) -> AsyncIterator[str]:
+        yield "시작"
+        raise RuntimeError("upstream error")
+
+
+def parse_events(body: bytes) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.split(b"\n\n"):
+        if not block.startswith(b"event: "):
+            continue
+        event, data = block.split(b"\n", 1)
+        events.append((event.removeprefix(b"event: ").decode(), orjson.loads(data.removeprefix(b"data: "))))
+    return events
+
+
+class TestPlanStream:
+    async def test_first_byte_before_generation(self, user):
+        """생성기가 첫 조각을 내기 전에 열림 주석부터 보낸다"""
+        generator = BlockingGenerator()
+        stream = PlanStreamer(generator, max_streams=1).open(user.id, REQUEST)
+        assert (await stream.__anext__()).startswith(b":")
+        assert parse_events(await stream.__anext__()) == [("chunk", {"text": "첫 조각"})]
+        await stream.aclose()
+
+    async def test_disconnect_cancels_upstream(self, user):
+        """중간에 닫히면 upstream 도 닫히고 저장하지 않는다"""
+        generator = BlockingGenerator()
+        streamer = PlanStreamer(generator, max_streams=1)
+        stream = streamer.open(user.id, REQUEST)
+        await stream.__anext__()
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert generator.closed
+        assert streamer.active == 0
+        assert await AIStudyPlan.filter(user_id=user.id).count() == 0
+
+    async def test_saves_once_at_end(self, user):
+        generator = BlockingGenerator()
+        generator.release.set()
+        body = b"".join([chunk async for chunk in PlanStreamer(generator, max_streams=1).open(user.id, REQUEST)])
+
+        events = parse_events(body)
+        assert [event for event, _ in events] == ["chunk", "chunk", "done"]
+        plan = await AIStudyPlan.get(id=events[-1][1]["plan_id"])
+        assert plan.output_data == "첫 조각나머지"
+
+    async def test_upstream_error(self, user):
+        body = b"".join([chunk async for chunk in PlanStreamer(BrokenGenerator(), max_streams=1).open(user.id, REQUEST)])
+
+        event, data = parse_events(body)[-1]
+        assert event == "error"
+        # 예외 내용은 클라이언트에 보내지 않는다
+        assert data == {"detail": STREAM_ERROR_DETAIL}
+        assert await AIStudyPlan.filter(user_id=user.id).count() == 0
+
+    async def test_stream_limit(self, user):
+        streamer = PlanStreamer(BlockingGenerator(), max_streams=1)
+        stream = streamer.open(user.id, REQUEST)
+        await stream.__anext__()
+        try:
+            with pytest.raises(TooManyStreamsError):
+                streamer.open(user.id, REQUEST)
+        finally:
+            await stream.aclose()
+        assert streamer.active == 0
+
+    async def test_stream_limit_counts_streams_not_yet_started(self, user):
+        """open 만 하고 아직 돌지 않은 스트림도 자리를 차지하고, 버려지면 자리를 돌려준다"""
+        streamer = PlanStreamer(BlockingGenerator(), max_streams=1)
+        stream = streamer.open(user.id, REQUEST)
+        with pytest.raises(TooManyStreamsError):
+            streamer.open(user.id, REQUEST)
+
+        del stream
+        gc.collect()
+        assert streamer.active == 0
+        await streamer.open(user.id, REQUEST).aclose()
+        assert streamer.active == 0
+
+    async def test_stream_endpoint(self, async_client):
+        async with async_client.stream("POST", "/api/ai/plans/stream", json={
+            "input_data": "운영체제",
+            "start_date": START.isoformat(),
+            "end_date": (START + timedelta(days=7)).isoformat(),
+        }) as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            assert response.headers["x-accel-buffering"] == "no"
+            body = await response.aread()
+
+        events = parse_events(body)
+        assert events[-1][0] == "done"
+        text = "".join(data["text"] for event, data in events if event == "chunk")
+        assert (await AIStudyPlan.get(id=events[-1][1]["plan_id"])).output_data == text
+        assert plan_streamer.stats()["time_to_first_chunk"]["count"] >= 1
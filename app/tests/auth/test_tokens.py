@@ -0,0 +1,183 @@
+import time
+from datetime import timedelta
+
+import httpx
+import pytest
+from pydantic import ValidationError
+from tortoise import timezone
+
+from app import app
+from app.configs import Config, config
+from app.models.user import RefreshTokenModel
+from app.services.auth_services.tokens import (
+    InvalidRefreshTokenError,
+    hash_refresh_token,
+    issue_tokens,
+    purge_expired,
+    revocation_index,
+    rotate_refresh_token,
+    verify_access_token,
+)
+from app.utils import jwt
+
+SECRET = "test-secret"
+
+
+@pytest.fixture
+async def client():
+    # conftest 의 async_client 와 달리 인증 의존성을 바꾸지 않는다
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+def bearer(access_token: str) -> dict:
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+class TestJwt:
+    def test_round_trip(self):
+        claims = {"sub": "1", "exp": int(time.time()) + 60}
+        assert jwt.decode(jwt.encode(claims, SECRET), SECRET) == claims
+
+    def test_rejects_tampered_and_expired(self):
+        token = jwt.encode({"sub": "1", "exp": int(time.time()) + 60}, SECRET)
+        header, payload, signature = token.split(".")
+        forged = jwt.encode({"sub": "2", "exp": int(time.time()) + 60}, SECRET).split(".")[1]
+
+        with pytest.raises(jwt.InvalidTokenError):
+            jwt.decode(token, "other-secret")
+        with pytest.raises(jwt.InvalidTokenError):
+            jwt.decode(f"{header}.{forged}.{signature}", SECRET)
+        with pytest.raises(jwt.InvalidTokenError):
+            jwt.decode(jwt.encode({"sub": "1", "exp": int(time.time()) - 1}, SECRET), SECRET)
+        with pytest.raises(jwt.InvalidTokenError):
+            jwt.decode("not-a-token", SECRET)
+
+
+    def test_non_local_env_requires_secret(self, monkeypatch):
+        monkeypatch.delenv("JWT_SECRET_KEY", raising=False)
+        monkeypatch.delenv("AUTH_HANDOFF_SECRET", raising=False)
+        with pytest.raises(ValidationError):
+            Config(ENV="prod", _env_file=None)
+        with pytest.raises(ValidationError):
+            Config(ENV="prod", JWT_SECRET_KEY="prod-secret", _env_file=None)
+        prod = Config(ENV="prod", JWT_SECRET_KEY="prod-secret", AUTH_HANDOFF_SECRET="prod-handoff", _env_file=None)
+        assert prod.JWT_SECRET_KEY == "prod-secret"
+        Config(ENV="local", _env_file=None)
+
+
+class TestTokens:
+    async def test_refresh_token_is_stored_hashed(self, user):
+        tokens = await issue_tokens(user.id)
+
+        session = await RefreshTokenModel.get(user_id=user.id)
+        assert session.token_hash == hash_refresh_token(tokens.refresh_token)
+        assert tokens.refresh_token not in session.token_hash
+        assert verify_access_token(tokens.access_token).user_id == user.id
+
+    async def test_rotation_is_single_use(self, user):
+        tokens = await issue_tokens(user.id)
+        rotated = await rotate_refresh_token(tokens.refresh_token)
+
+        assert verify_access_token(rotated.access_token).user_id == user.id
+        with pytest.raises(InvalidRefreshTokenError):
+            await rotate_refresh_token(tokens.refresh_token)
+        # 이전 세션의 access token 도 폐기 목록으로 걸러진다
+        with pytest.raises(jwt.InvalidTokenError):
+            verify_access_token(tokens.access_token)
+
+    async def test_rolled_back_rotation_keeps_session(self, user):
+        """갱신이 롤백되면 DB 와 폐기 목록 모두 세션을 그대로 둔다"""
+        tokens = await issue_tokens(user.id)
+        session_id = verify_access_token(tokens.access_token).session_id
+        user.is_active = False
+        await user.save(update_fields=["is_active"])
+
+        with pytest.raises(InvalidRefreshTokenError):
+            await rotate_refresh_token(tokens.refresh_token)
+        assert session_id not in revocation_index
+        assert not (await RefreshTokenModel.get(id=session_id)).revoked
+
+    async def test_sync_picks_up_revocations_from_other_workers(self, user):
+        tokens = await issue_tokens(user.id)
+        session_id = verify_access_token(tokens.access_token).session_id
+        await revocation_index.sync()
+
+        # 다른 워커에서 폐기된 경우 (이 프로세스의 목록에는 바로 들어오지 않는다)
+        await RefreshTokenModel.filter(id=session_id).update(revoked=True, updated_at=timezone.now())
+        assert session_id not in revocation_index
+        await revocation_index.sync()
+        assert session_id in revocation_index
+
+    async def test_purge_expired(self, user):
+        tokens = await issue_tokens(user.id)
+        expired = await issue_tokens(user.id)
+        await RefreshTokenModel.filter(token_hash=hash_refresh_token(expired.refresh_token)).update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        assert await purge_expired(batch_size=1) == 1
+        assert await RefreshTokenModel.filter(user_id=user.id).count() == 1
+        with pytest.raises(InvalidRefreshTokenError):
+            await rotate_refresh_token(expired.refresh_token)
+        await rotate_refresh_token(tokens.refresh_token)
+
+
+class TestAuthEndpoints:
+    async def test_requires_bearer_token(self, client):
+        response = await client.get("/api/community/posts/likes", params={"post_ids": 1})
+        assert response.status_code == 401
+        assert response.headers["www-authenticate"] == "Bearer"
+
+    async def test_refresh_and_logout(self, client, user):
+        tokens = await issue_tokens(user.id)
+        response = await client.post("/api/auth/refresh", json={"refresh_token": tokens.refresh_token})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["expires_in"] == config.JWT_ACCESS_TOKEN_TTL
+
+        authed = await client.get("/api/community/posts/likes", params={"post_ids": 1}, headers=bearer(body["access_token"]))
+        assert authed.status_code == 200
+
+        assert (await client.post("/api/auth/logout", json={"refresh_token": body["refresh_token"]})).status_code == 204
+        after = await client.get("/api/community/posts/likes", params={"post_ids": 1}, headers=bearer(body["access_token"]))
+        assert after.status_code == 401
+        reused = await client.post("/api/auth/refresh", json={"refresh_token": body["refresh_token"]})
+        assert reused.status_code == 401
+
+
+def handoff(provider_id: str, secret: str | None = None, **claims) -> str:
+    return jwt.encode({
+        "provider": "google",
+        "provider_id": provider_id,
+        "email": f"{provider_id}@example.com",
+        "exp": int(time.time()) + 60,
+        **claims,
+    }, secret or config.AUTH_HANDOFF_SECRET)
+
+
+class TestLogin:
+    async def test_login_then_write(self, client):
+        """hand-off 로 가입/로그인해 받은 access token 으로 글을 쓴다"""
+        first = await client.post("/api/auth/login", json={"assertion": handoff("login-1"), "nickname": "로그인"})
+        assert first.status_code == 200
+
+        created = await client.post(
+            "/api/community/post/free", json={"title": "첫 글", "content": "내용"},
+            headers=bearer(first.json()["access_token"]),
+        )
+        assert created.status_code == 200
+
+        # 다시 로그인하면 같은 사용자 (nickname 없이)
+        again = await client.post("/api/auth/login", json={"assertion": handoff("login-1")})
+        assert again.status_code == 200
+        assert verify_access_token(again.json()["access_token"]).user_id == created.json()["author_id"]
+
+    async def test_login_rejects_bad_handoff(self, client):
+        forged = await client.post("/api/auth/login", json={"assertion": handoff("login-2", secret=SECRET)})
+        assert forged.status_code == 401
+        expired = await client.post("/api/auth/login", json={"assertion": handoff("login-2", exp=int(time.time()) - 1)})
+        assert expired.status_code == 401
+        # 처음 로그인하는 계정은 nickname 이 있어야 가입된다
+        no_nickname = await client.post("/api/auth/login", json={"assertion": handoff("login-2")})
+        assert no_nickname.status_code == 422
@@ -0,0 +1,53 @@
+from datetime import timedelta
+
+import httpx
+from tortoise import timezone
+
+from app import app
+from app.dtos.community_dtos.community_request import FreePostRequest, StudyPostRequest
+from app.services.community_services.post_repository import create_post
+from benchmarks.load import SCENARIOS, run_load
+from benchmarks.results import compare, percentile, summarize
+
+
+class TestResults:
+    def test_percentile_and_summary(self):
+        values = [i / 1000 for i in range(1, 101)]
+        assert percentile(values, 0.5) == 0.0505
+        assert percentile([], 0.99) == 0.0
+
+        summary = summarize(values, errors=2, elapsed=2.0)
+        assert (summary["count"], summary["errors"], summary["throughput_rps"]) == (100, 2, 50.0)
+        assert round(summary["p99_ms"], 2) == 99.01
+
+    def test_compare_flags_regressions_beyond_threshold(self):
+        def result(p95_ms: float, rps: float, ns_per_op: float) -> dict:
+            return {
+                "scenarios": {"detail": {"p95_ms": p95_ms, "throughput_rps": rps}},
+                "micro": {"x": {"ns_per_op": ns_per_op}},
+            }
+
+        baseline = result(10.0, 1000.0, 100.0)
+        within = result(10.5, 950.0, 105.0)
+        worse = result(12.0, 800.0, 130.0)
+
+        assert compare(baseline, within, threshold=0.1) == []
+        assert len(compare(baseline, worse, threshold=0.1)) == 3
+
+
+class TestLoad:
+    async def test_runs_all_scenarios_in_process(self, user):
+        now = timezone.now()
+        for _ in range(2):
+            await create_post(user.id, StudyPostRequest(
+                title="모집", content="내용", recruit_start=now, recruit_end=now + timedelta(days=7),
+                study_start=now + timedelta(days=8), study_end=now + timedelta(days=30), max_member=3,
+            ))
+        await create_post(user.id, FreePostRequest(title="자유", content="내용"))
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            results = await run_load(client, list(SCENARIOS), requests=5, concurrency=2, seed=1)
+
+        assert set(results) == set(SCENARIOS)
+        for summary in results.values():
+            assert (summary["count"], summary["errors"]) == (5, 0)
@@ -0,0 +1,30 @@
+from app.services.ai_services.plan_cache import plan_generator
+from app.services.ai_services.plan_generator import LazyPlanGenerator, StubPlanGenerator
+from benchmarks.import_time import measure, parse_importtime
+
+
+class TestImportTime:
+    def test_parse_importtime(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     app.configs.base_config\n"
+            "import time:      2000 |       5300 |   app.configs\n"
+            "import time:       500 |       9000 | app\n"
+        )
+        entries = parse_importtime(stderr)
+        assert [(entry.module, entry.depth) for entry in entries] == [
+            ("app.configs.base_config", 2), ("app.configs", 1), ("app", 0),
+        ]
+        assert (entries[-1].self_ms, entries[-1].cumulative_ms) == (0.5, 9.0)
+
+    def test_app_import_is_lazy(self):
+        # 시간 예산(ms)은 머신마다 흔들리므로 테스트에서는 보지 않고 python -m benchmarks.import_time 으로 잰다
+        _, _, loaded = measure("app", repeat=1)
+        # DB 드라이버 / 마이그레이션 도구 / 배치 작업은 lifespan 에서 처음 올라와야 한다
+        assert loaded == []
+
+    def test_plan_generator_is_created_on_first_use(self):
+        lazy = LazyPlanGenerator("stub")
+        assert lazy._generator is None
+        assert isinstance(lazy.generator, StubPlanGenerator)
+        assert isinstance(plan_generator.generator, LazyPlanGenerator)
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+
+from conftest import create_test_user
+from tortoise import timezone
+
+from app.models.community import (
+    CategoryType,
+    CommentArchiveModel,
+    CommentModel,
+    LikeArchiveModel,
+    LikeModel,
+    PostArchiveModel,
+    PostModel,
+    StudyRecruitmentArchiveModel,
+    StudyRecruitmentModel,
+)
+from app.services.community_services.archive import archive_deleted_posts
+
+
+async def create_deleted_post(user, days_ago: int) -> PostModel:
+    post = await PostModel.create(user=user, title="지난 스터디", content="내용", category=CategoryType.STUDY)
+    await StudyRecruitmentModel.create(
+        post=post,
+        recruit_start=datetime(2025, 1, 1),
+        recruit_end=datetime(2025, 1, 7),
+        study_start=datetime(2025, 1, 8),
+        study_end=datetime(2025, 2, 8),
+        max_member=4,
+    )
+    parent = await CommentModel.create(post=post, user=user, content="원 댓글")
+    await CommentModel.create(post=post, user=user, content="답글", parent_comment=parent)
+    await LikeModel.create(post=post, user=await create_test_user())
+    post.deleted_at = timezone.now() - timedelta(days=days_ago)
+    await post.save(update_fields=["deleted_at"])
+    return post
+
+
+class TestArchive:
+    async def test_moves_old_deleted_posts_with_children(self, user):
+        old = [await create_deleted_post(user, days_ago=40) for _ in range(3)]
+        recent = await create_deleted_post(user, days_ago=1)
+        live = await PostModel.create(user=user, title="살아 있는 글", content="내용", category=CategoryType.FREE)
+
+        progress = []
+        report = await archive_deleted_posts(after_days=30, batch_size=2, progress=lambda r: progress.append(r.posts))
+
+        assert report.batches == 2
+        assert progress == [2, 3]
+        assert report.rows["comments"] == 6
+        assert report.rows["likes"] == 3
+        assert report.rows["study_recruitments"] == 3
+
+        old_ids = [post.id for post in old]
+        assert not await PostModel.filter(id__in=old_ids).exists()
+        assert not await CommentModel.filter(post_id__in=old_ids).exists()
+        assert await PostModel.filter(id__in=[recent.id, live.id]).count() == 2
+
+        archived = await PostArchiveModel.get(id=old[0].id)
+        assert archived.title == "지난 스터디"
+        assert archived.deleted_at is not None
+        assert await CommentArchiveModel.filter(post_id=old[0].id, parent_comment_id__isnull=False).count() == 1
+        assert await LikeArchiveModel.filter(post_id__in=old_ids).count() == 3
+        assert (await StudyRecruitmentArchiveModel.get(post_id=old[0].id)).max_member == 4
+
+    async def test_dry_run_changes_nothing(self, user):
+        post = await create_deleted_post(user, days_ago=40)
+
+        report = await archive_deleted_posts(after_days=30, batch_size=10, dry_run=True)
+
+        assert report.dry_run
+        assert (report.posts, report.rows["comments"], report.batches) == (1, 2, 1)
+        assert await PostModel.filter(id=post.id).exists()
+        assert not await PostArchiveModel.exists()
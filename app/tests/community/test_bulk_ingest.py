@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+import orjson
+from tortoise import timezone
+
+from app.models.community import CommentModel, PostModel, StudyRecruitmentModel
+from app.services.community_services.bulk_ingest import ingest
+
+
+async def lines_of(records: list) -> bytes:
+    for record in records:
+        yield record if isinstance(record, bytes) else orjson.dumps(record)
+
+
+class TestBulkIngest:
+    async def test_ingest_posts_and_comment_tree(self, user):
+        """카테고리별 확장 정보와 댓글(원 댓글 id 재매핑)을 chunk 단위로 적재"""
+        now = datetime.now()
+        records = [
+            {
+                "author_id": user.id, "category": "study", "title": "스터디", "content": "내용",
+                "recruit_start": now.isoformat(), "recruit_end": (now + timedelta(days=7)).isoformat(),
+                "study_start": (now + timedelta(days=10)).isoformat(),
+                "study_end": (now + timedelta(days=20)).isoformat(), "max_member": 4,
+                "comments": [
+                    {"id": "reply", "author_id": user.id, "content": "답글", "parent_id": "root"},
+                    {"id": "root", "author_id": user.id, "content": "댓글"},
+                ],
+            },
+            {"author_id": user.id, "category": "free", "title": "자유", "content": "내용"},
+            b"{not json",
+            {"author_id": user.id, "category": "share", "title": "공유", "content": "파일 없음"},
+            {"author_id": user.id, "category": "share", "title": "공유", "content": "내용", "file_url": "a.pdf"},
+        ]
+
+        report = await ingest(lines_of(records), chunk_size=2)
+
+        assert (report.posts, report.chunks) == (3, 2)
+        assert report.comments == 2
+        assert [line for line, _ in report.errors] == [3, 4]
+
+        study = await PostModel.get(title="스터디")
+        assert study.comment_count == 2
+        recruitment = await StudyRecruitmentModel.get(post_id=study.id)
+        assert recruitment.max_member == 4
+        # naive datetime 은 ORM 저장과 같이 기본 타임존 시각으로 저장된다
+        assert recruitment.recruit_start == timezone.make_aware(now)
+        root = await CommentModel.get(post_id=study.id, content="댓글")
+        reply = await CommentModel.get(post_id=study.id, content="답글")
+        assert reply.parent_comment_id == root.id
+
+    async def test_too_long_values_fail_only_their_line(self, user):
+        """모델 길이 제한을 넘는 줄만 줄 번호와 함께 빠지고, 같은 chunk 의 다른 줄은 적재된다"""
+        records = [
+            {"author_id": user.id, "category": "free", "title": "제" * 21, "content": "내용"},
+            {"author_id": user.id, "category": "free", "title": "정상", "content": "내용"},
+            {
+                "author_id": user.id, "category": "free", "title": "댓글", "content": "내용",
+                "comments": [{"id": 1, "author_id": user.id, "content": "댓" * 51}],
+            },
+        ]
+
+        report = await ingest(lines_of(records), chunk_size=10)
+
+        assert (report.posts, report.chunks) == (1, 1)
+        assert [line for line, _ in report.errors] == [1, 3]
+        assert "title" in report.errors[0][1]
+        assert await PostModel.filter(title="정상").exists()
+
+    async def test_bulk_endpoint_requires_superuser(self, async_client, user):
+        body = orjson.dumps({"author_id": user.id, "category": "free", "title": "자유", "content": "내용"})
+
+        forbidden = await async_client.post("/api/community/bulk", content=body)
+        assert forbidden.status_code == 403
+
+        user.is_superuser = True
+        await user.save(update_fields=["is_superuser"])
+        response = await async_client.post("/api/community/bulk", content=body + b"\n" + body)
+        assert response.status_code == 200
+        assert response.json()["posts"] == 2
+        assert response.json()["errors"] == []
@@ -1,15 +1,24 @@
 import pytest
 from datetime import datetime
 from httpx import AsyncClient
+from starlette.status import HTTP_200_OK, HTTP_404_NOT_FOUND
+
+from app.models.community import CategoryType, CommentModel, PostModel
+from app.services.community_services import comment_tree
+from app.services.community_services.comment_tree import load_comment_tree
+
+
+@pytest.fixture
+async def post(user):
+    return await PostModel.create(user=user, title="댓글 테스트", content="내용", category=CategoryType.FREE)
+
 
 @pytest.mark.asyncio
 class TestComment:
-    endpoint = "/api/community/post/1/comment"
-
-    async def test_create_comment(self, async_client: AsyncClient):
+    async def test_create_comment(self, async_client: AsyncClient, post):
         """일반 댓글 생성"""
-        response = await async_client.post(self.endpoint, json={
-            "post_id": 1,
+        response = await async_client.post(f"/api/community/post/{post.id}/comment", json={
+            "post_id": post.id,
             "content": "첫 댓글입니다"
         })
         assert response.status_code == 200
@@ -17,14 +26,99 @@ class TestComment:
         assert data["content"] == "첫 댓글입니다"
         assert data["parent_id"] is None
 
-    async def test_create_reply(self, async_client: AsyncClient):
+    async def test_create_reply(self, async_client: AsyncClient, post, user):
         """대댓글 생성"""
-        response = await async_client.post(self.endpoint, json={
-            "post_id": 1,
+        parent = await CommentModel.create(post=post, user=user, content="원 댓글")
+        response = await async_client.post(f"/api/community/post/{post.id}/comment", json={
+            "post_id": post.id,
             "content": "대댓글입니다",
-            "parent_id": 1
+            "parent_id": parent.id
         })
         assert response.status_code == 200
         data = response.json()
         assert data["content"] == "대댓글입니다"
-        assert data["parent_id"] == 1
+        assert data["parent_id"] == parent.id
+
+    async def test_create_comment_on_missing_post(self, async_client: AsyncClient):
+        response = await async_client.post("/api/community/post/999999/comment", json={
+            "post_id": 999999,
+            "content": "없는 글"
+        })
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+class TestCommentTree:
+    async def test_tree_with_depth_and_child_limit(self, async_client: AsyncClient, post, user):
+        """한 번의 조회로 답글 트리를 만들고 깊이/답글 수를 제한"""
+        root = await CommentModel.create(post=post, user=user, content="루트")
+        replies = [
+            await CommentModel.create(post=post, user=user, content=f"답글{i}", parent_comment=root)
+            for i in range(3)
+        ]
+        nested = await CommentModel.create(post=post, user=user, content="답답글", parent_comment=replies[0])
+        await CommentModel.create(post=post, user=user, content="너무 깊음", parent_comment=nested)
+
+        response = await async_client.get(
+            f"/api/community/post/{post.id}/comments", params={"child_limit": 2, "max_depth": 2}
+        )
+
+        assert response.status_code == HTTP_200_OK
+        [tree] = response.json()["items"]
+        assert tree["id"] == root.id
+        assert tree["reply_count"] == 3
+        assert [reply["id"] for reply in tree["replies"]] == [replies[0].id, replies[1].id]
+        [nested_node] = tree["replies"][0]["replies"]
+        assert nested_node["id"] == nested.id
+        assert nested_node["depth"] == 2
+        assert nested_node["reply_count"] == 1
+        assert nested_node["replies"] == []
+
+    async def test_paginate_roots_and_replies(self, async_client: AsyncClient, post, user):
+        """최상위 댓글과 특정 댓글의 답글을 커서로 이어서 조회"""
+        roots = [await CommentModel.create(post=post, user=user, content=f"루트{i}") for i in range(3)]
+        replies = [
+            await CommentModel.create(post=post, user=user, content=f"답글{i}", parent_comment=roots[0])
+            for i in range(3)
+        ]
+        endpoint = f"/api/community/post/{post.id}/comments"
+
+        page1 = (await async_client.get(endpoint, params={"limit": 2, "child_limit": 0})).json()
+        page2 = (await async_client.get(endpoint, params={"limit": 2, "cursor": page1["next_cursor"]})).json()
+        assert [item["id"] for item in page1["items"]] == [roots[0].id, roots[1].id]
+        assert [item["id"] for item in page2["items"]] == [roots[2].id]
+        assert page2["next_cursor"] is None
+
+        reply_page = (await async_client.get(endpoint, params={"parent_id": roots[0].id, "limit": 2})).json()
+        more = (await async_client.get(
+            endpoint, params={"parent_id": roots[0].id, "limit": 2, "cursor": reply_page["next_cursor"]}
+        )).json()
+        assert [item["id"] for item in reply_page["items"] + more["items"]] == [reply.id for reply in replies]
+
+    async def test_child_limit_is_applied_in_sql(self, post, user, monkeypatch):
+        """child_limit 밖의 답글과 그 아래 답글은 DB 에서 읽지도 않는다"""
+        root = await CommentModel.create(post=post, user=user, content="루트")
+        for i in range(5):
+            reply = await CommentModel.create(post=post, user=user, content=f"답글{i}", parent_comment=root)
+            await CommentModel.create(post=post, user=user, content=f"답답글{i}", parent_comment=reply)
+
+        fetched = []
+        get_read_connection = comment_tree.get_read_connection
+
+        class RecordingConnection:
+            def __init__(self, conn) -> None:
+                self.conn = conn
+                self.capabilities = conn.capabilities
+
+            async def execute_query_dict(self, query, values):
+                rows = await self.conn.execute_query_dict(query, values)
+                fetched.extend(rows)
+                return rows
+
+        monkeypatch.setattr(comment_tree, "get_read_connection", lambda model: RecordingConnection(get_read_connection(model)))
+        [tree], _ = await load_comment_tree(post.id, None, None, limit=10, child_limit=2, max_depth=2)
+
+        assert [reply["content"] for reply in tree["replies"]] == ["답글0", "답글1"]
+        assert tree["reply_count"] == 5
+        # 루트 + 답글 2 + 답글마다 답답글 1
+        assert len(fetched) == 5
@@ -1,4 +1,8 @@
-from starlette.status import HTTP_200_OK
+from starlette.status import HTTP_200_OK, HTTP_401_UNAUTHORIZED
+
+from app import app
+from app.apis.auth_router import get_current_user_id
+from app.models.community import PostModel
 
 class TestCommunityRouter:
     endpoint = "/api/community/post"
@@ -58,3 +62,13 @@ class TestCommunityRouter:
         data = response.json()
         assert data["category"] == "share"
         assert data["data_share"]["file_url"].endswith(".pdf")
+
+    async def test_author_comes_from_token(self, async_client, user):
+        """작성자는 토큰의 사용자이고, 토큰이 없으면 글을 만들지 않는다"""
+        response = await async_client.post(f"{self.endpoint}/free", json={"title": "작성자", "content": "확인"})
+        assert response.json()["author_id"] == user.id
+
+        del app.dependency_overrides[get_current_user_id]
+        response = await async_client.post(f"{self.endpoint}/free", json={"title": "익명", "content": "거절"})
+        assert response.status_code == HTTP_401_UNAUTHORIZED
+        assert not await PostModel.filter(title="익명").exists()
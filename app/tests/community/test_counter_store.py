@@ -0,0 +1,138 @@
+import asyncio
+import os
+import tempfile
+
+import orjson
+import pytest
+
+from app.models.community import CategoryType, PostModel
+from app.services.community_services.counter_aggregator import CounterAggregator
+from app.services.community_services.counter_reconciler import CounterReconciler
+from app.services.community_services.counter_store import (
+    InProcessCounterStore,
+    UnixSocketCounterStore,
+)
+
+
+@pytest.fixture
+async def aggregator_path():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "counters.sock")
+        aggregator = CounterAggregator(path)
+        await aggregator.start()
+        yield path
+        await aggregator.stop()
+
+
+class TestCounterStore:
+    async def test_in_process_store_drain(self):
+        """drain 하면 쌓인 증가분을 꺼내고 비운다"""
+        store = InProcessCounterStore()
+        await store.incr(1, "view_count")
+        await store.incr(1, "view_count", 2)
+        await store.incr(1, "like_count")
+
+        assert await store.pending(1, "view_count") == 3
+        assert await store.drain() == {(1, "view_count"): 3, (1, "like_count"): 1}
+        assert await store.pending(1, "view_count") == 0
+
+    async def test_unix_socket_store_shared_between_workers(self, aggregator_path):
+        """워커(클라이언트)가 달라도 같은 집계 값을 본다"""
+        worker_a = UnixSocketCounterStore(aggregator_path)
+        worker_b = UnixSocketCounterStore(aggregator_path)
+        try:
+            assert await worker_a.incr(7, "view_count") == 1
+            assert await worker_b.incr(7, "view_count", 4) == 5
+
+            assert await worker_a.pending(7, "view_count") == 5
+            assert await worker_b.drain() == {(7, "view_count"): 5}
+            assert await worker_a.drain() == {}
+
+            await worker_a.restore({(7, "comment_count"): 2})
+            assert await worker_b.pending(7, "comment_count") == 2
+        finally:
+            await worker_a.close()
+            await worker_b.close()
+
+    async def test_incr_returns_pending_in_one_round_trip(self, aggregator_path, monkeypatch):
+        """조회수 증가와 반영 전 증가분 조회가 집계 프로세스 왕복 한 번으로 끝난다"""
+        store = UnixSocketCounterStore(aggregator_path)
+        ops = []
+        call = store._call
+
+        async def recording_call(op, **params):
+            ops.append(op)
+            return await call(op, **params)
+
+        monkeypatch.setattr(store, "_call", recording_call)
+        try:
+            await store.incr(3, "view_count", 2)
+            assert await store.incr(3, "view_count") == 3
+            assert ops == ["incr", "incr"]
+        finally:
+            await store.close()
+
+    async def test_cancelled_call_does_not_leave_reply_for_next_call(self):
+        """응답을 기다리다 취소된 호출의 응답을 다음 호출이 받지 않는다"""
+        async def handle(reader, writer):
+            # 첫 요청만 늦게 답하고, 결과로 요청한 op 이름을 돌려준다
+            first = True
+            while line := await reader.readline():
+                if first:
+                    await asyncio.sleep(0.05)
+                    first = False
+                writer.write(orjson.dumps({"result": orjson.loads(line)["op"]}) + b"\n")
+                await writer.drain()
+            writer.close()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "slow.sock")
+            server = await asyncio.start_unix_server(handle, path=path)
+            store = UnixSocketCounterStore(path)
+            try:
+                call = asyncio.create_task(store.drain())
+                await asyncio.sleep(0.01)
+                call.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await call
+
+                assert await store.pending(1, "view_count") == "pending"
+            finally:
+                await store.close()
+                server.close()
+                await server.wait_closed()
+
+
+class TestCounterReconciler:
+    async def test_flush_folds_counters_into_posts(self, user):
+        """여러 카운터 증가분이 batch UPDATE 로 posts 에 반영"""
+        post = await PostModel.create(user=user, title="카운터", content="반영", category=CategoryType.STUDY)
+        other = await PostModel.create(user=user, title="카운터2", content="반영", category=CategoryType.FREE)
+        store = InProcessCounterStore()
+        reconciler = CounterReconciler(store, flush_interval=60, batch_size=1)
+
+        for _ in range(3):
+            await store.incr(post.id, "view_count")
+        await store.incr(post.id, "comment_count")
+        await store.incr(other.id, "comment_count", 2)
+
+        assert await reconciler.flush() == 2
+
+        await post.refresh_from_db()
+        await other.refresh_from_db()
+        assert (post.view_count, post.comment_count) == (3, 1)
+        assert (other.view_count, other.comment_count) == (0, 2)
+        assert await store.drain() == {}
+
+    async def test_stop_drains_pending(self, user):
+        """종료 시 남은 증가분을 모두 반영"""
+        post = await PostModel.create(user=user, title="종료", content="drain", category=CategoryType.STUDY)
+        store = InProcessCounterStore()
+        reconciler = CounterReconciler(store, flush_interval=60, batch_size=100)
+        reconciler.start()
+        await store.incr(post.id, "view_count", 5)
+
+        await reconciler.stop()
+
+        await post.refresh_from_db()
+        assert post.view_count == 5
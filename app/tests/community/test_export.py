@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+import orjson
+
+from app.dtos.community_dtos.community_request import FreePostRequest
+from app.models.community import CommentModel, PostModel
+from app.services.community_services.export import iter_batches, parse_checkpoint
+from app.services.community_services.post_repository import create_post
+
+
+class TestExport:
+    async def test_batches_resume_from_checkpoint(self, user):
+        """fetch_size 단위로 읽고, 마지막 행의 checkpoint 이후 수정된 행만 이어서 읽는다"""
+        posts = [await create_post(user.id, FreePostRequest(title=f"글 {i}", content="내용")) for i in range(5)]
+
+        batches = [rows async for rows in iter_batches("posts", None, fetch_size=2)]
+        assert [len(rows) for rows in batches] == [2, 2, 1]
+        assert [row["id"] for rows in batches for row in rows] == [post.id for post in posts]
+
+        last = batches[-1][-1]
+        posts[1].title = "수정됨"
+        await posts[1].save()
+        checkpoint = (last["updated_at"], last["id"])
+        resumed = [row async for rows in iter_batches("posts", checkpoint, 2, overlap=0) for row in rows]
+
+        assert [row["title"] for row in resumed] == ["수정됨"]
+
+    async def test_resume_rereads_overlap_window(self, user):
+        """checkpoint 보다 이른 updated_at 으로 늦게 커밋된 행도 overlap 안이면 다시 읽고, 한 실행 안에서는 중복이 없다"""
+        posts = [await create_post(user.id, FreePostRequest(title=f"글 {i}", content="내용")) for i in range(3)]
+        [*_, last] = [row async for rows in iter_batches("posts", None, fetch_size=10) for row in rows]
+        # 마지막 행보다 1초 앞선 updated_at 으로 커밋된 수정 (checkpoint 만으로는 놓친다)
+        late = last["updated_at"] - timedelta(seconds=1)
+        await PostModel.filter(id=posts[0].id).update(title="늦은 커밋", updated_at=late)
+
+        checkpoint = (last["updated_at"], last["id"])
+        missed = [row async for rows in iter_batches("posts", checkpoint, 10, overlap=0) for row in rows]
+        resumed = [row async for rows in iter_batches("posts", checkpoint, 2, overlap=60) for row in rows]
+
+        assert missed == []
+        assert "늦은 커밋" in [row["title"] for row in resumed]
+        ids = [row["id"] for row in resumed]
+        assert sorted(ids) == sorted(set(ids)) == sorted(post.id for post in posts)
+
+    async def test_export_endpoint_streams_ndjson(self, async_client, user):
+        post = await create_post(user.id, FreePostRequest(title="글", content="내용"))
+        await CommentModel.create(post=post, user=user, content="댓글")
+        user.is_superuser = True
+        await user.save(update_fields=["is_superuser"])
+
+        response = await async_client.get("/api/community/export/comments")
+
+        assert response.status_code == 200
+        lines = [orjson.loads(line) for line in response.content.splitlines()]
+        assert lines[0]["content"] == "댓글"
+        assert parse_checkpoint(lines[-1]["checkpoint"])[1] == lines[0]["id"]
+
+    async def test_export_rejects_bad_checkpoint(self, async_client, user):
+        user.is_superuser = True
+        await user.save(update_fields=["is_superuser"])
+
+        response = await async_client.get("/api/community/export/posts", params={"since": "broken"})
+
+        assert response.status_code == 400
@@ -0,0 +1,55 @@
+import asyncio
+
+from starlette.status import HTTP_200_OK, HTTP_404_NOT_FOUND
+
+from app.models.community import CategoryType, LikeModel, PostModel
+from app.services.community_services.like_service import like_post
+
+
+class TestLike:
+    async def test_like_is_idempotent(self, async_client, user):
+        """같은 사용자가 여러 번 눌러도 한 번만 반영"""
+        post = await PostModel.create(user=user, title="좋아요", content="내용", category=CategoryType.FREE)
+        endpoint = f"/api/community/post/{post.id}/like"
+
+        first = await async_client.post(endpoint)
+        second = await async_client.post(endpoint)
+
+        assert first.status_code == HTTP_200_OK
+        assert first.json() == {"post_id": post.id, "liked": True, "like_count": 1}
+        assert second.json()["like_count"] == 1
+        assert await LikeModel.filter(post_id=post.id).count() == 1
+
+        unliked = await async_client.delete(endpoint)
+        again = await async_client.delete(endpoint)
+        assert unliked.json() == {"post_id": post.id, "liked": False, "like_count": 0}
+        assert again.json()["like_count"] == 0
+
+    async def test_concurrent_likes_keep_counter_in_sync(self, user):
+        """동시에 눌러도 카운터와 실제 좋아요 수가 일치"""
+        post = await PostModel.create(user=user, title="동시성", content="내용", category=CategoryType.FREE)
+
+        await asyncio.gather(*(like_post(user.id, post.id) for _ in range(10)))
+
+        await post.refresh_from_db()
+        assert post.like_count == await LikeModel.filter(post_id=post.id).count() == 1
+
+    async def test_like_missing_post(self, async_client):
+        response = await async_client.post("/api/community/post/999999/like")
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+    async def test_liked_post_ids(self, async_client, user):
+        """피드의 여러 글에 대해 좋아요 여부를 한 번에 조회"""
+        posts = [
+            await PostModel.create(user=user, title=f"글{i}", content="내용", category=CategoryType.FREE)
+            for i in range(3)
+        ]
+        await like_post(user.id, posts[0].id)
+        await like_post(user.id, posts[2].id)
+
+        response = await async_client.get(
+            "/api/community/posts/likes", params={"post_ids": [post.id for post in posts]}
+        )
+
+        assert response.status_code == HTTP_200_OK
+        assert sorted(response.json()["liked_post_ids"]) == [posts[0].id, posts[2].id]
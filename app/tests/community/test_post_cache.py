@@ -0,0 +1,238 @@
+import asyncio
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.apis import community_router
+from app.services.community_services import post_cache as post_cache_module
+from app.services.community_services.counter_reconciler import CounterReconciler
+from app.services.community_services.counter_store import counter_store
+from app.services.community_services.post_cache import PostResponseCache, post_cache
+from app.utils.db_router import is_primary_pinned
+from app.utils.file_cache import FileCacheTier
+from app.utils.lru_cache import TTLLRUCache
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+class TestPostCache:
+    endpoint = "/api/community/post/study"
+
+    async def _create_post(self, async_client) -> int:
+        now = datetime.now(KST)
+        response = await async_client.post(self.endpoint, json={
+            "title": "캐시 스터디",
+            "content": "내용",
+            "category": "study",
+            "study_start": (now + timedelta(days=10)).isoformat(),
+            "study_end": (now + timedelta(days=40)).isoformat(),
+            "recruit_start": now.isoformat(),
+            "recruit_end": (now + timedelta(days=7)).isoformat(),
+            "max_member": 10,
+        })
+        return response.json()["id"]
+
+    async def test_cache_hit_keeps_counting_views(self, async_client):
+        """두 번째 조회부터는 캐시된 본문을 쓰지만 조회수는 계속 오른다"""
+        post_id = await self._create_post(async_client)
+
+        first = await async_client.get(f"{self.endpoint}/{post_id}")
+        assert post_cache.get(post_id) is not None
+        second = await async_client.get(f"{self.endpoint}/{post_id}")
+
+        assert first.json()["views"] == 1
+        assert second.json()["views"] == 2
+        assert {**first.json(), "views": 0} == {**second.json(), "views": 0}
+
+    async def test_update_invalidates(self, async_client):
+        post_id = await self._create_post(async_client)
+        await async_client.get(f"{self.endpoint}/{post_id}")
+
+        await async_client.put(f"{self.endpoint}/{post_id}", json={"title": "바뀐 제목"})
+        response = await async_client.get(f"{self.endpoint}/{post_id}")
+
+        assert response.json()["title"] == "바뀐 제목"
+
+    async def test_refill_after_update_reads_primary(self, async_client, monkeypatch):
+        """수정 뒤 캐시를 다시 채울 때는 뒤처진 replica 의 옛 본문을 담지 않도록 primary 에서 읽는다"""
+        post_id = await self._create_post(async_client)
+        await async_client.get(f"{self.endpoint}/{post_id}")
+        await async_client.put(f"{self.endpoint}/{post_id}", json={"title": "바뀐 제목"})
+
+        pinned = []
+        get_post = community_router.get_post
+
+        async def recording_get_post(post_id: int):
+            pinned.append(is_primary_pinned())
+            return await get_post(post_id)
+
+        monkeypatch.setattr(community_router, "get_post", recording_get_post)
+        response = await async_client.get(f"{self.endpoint}/{post_id}")
+
+        assert response.json()["title"] == "바뀐 제목"
+        assert pinned == [True]
+
+    async def test_view_flush_keeps_cached_body(self, async_client):
+        """조회수만 DB 에 반영되면 캐시를 유지하고, 좋아요/댓글 수가 반영되면 무효화한다"""
+        post_id = await self._create_post(async_client)
+        reconciler = CounterReconciler(counter_store, flush_interval=60, batch_size=100)
+        reconciler.add_flush_listener(post_cache.apply_counter_flush)
+        await async_client.get(f"{self.endpoint}/{post_id}")
+        await async_client.get(f"{self.endpoint}/{post_id}")
+        loads = post_cache.loads
+
+        await reconciler.flush()
+        assert post_cache.get(post_id).view_count == 2
+        response = await async_client.get(f"{self.endpoint}/{post_id}")
+        assert response.json()["views"] == 3
+        assert post_cache.loads == loads
+
+        await counter_store.incr(post_id, "comment_count")
+        await reconciler.flush()
+        assert post_cache.get(post_id) is None
+
+    def test_shared_tier_invalidation_reaches_other_worker(self, tmp_path):
+        """다른 워커가 무효화하면 로컬 LRU 에 남은 항목도 쓰지 않는다"""
+        def make_cache():
+            local = TTLLRUCache(max_entries=10, max_bytes=1024, ttl=60, sizeof=lambda entry: len(entry.body))
+            return PostResponseCache(local, FileCacheTier(str(tmp_path)), ttl=60)
+
+        worker_a, worker_b = make_cache(), make_cache()
+        worker_a.set(1, b'{"id":1}', view_count=3)
+        assert worker_b.get(1).view_count == 3
+
+        worker_a.invalidate(1)
+
+        assert worker_b.get(1) is None
+
+    def test_view_flush_does_not_rewrite_shared_tier(self, tmp_path):
+        """조회수 반영은 로컬 항목에만 더해 다른 워커의 반영분을 덮어쓰지 않는다"""
+        def make_cache():
+            local = TTLLRUCache(max_entries=10, max_bytes=1024, ttl=60, sizeof=lambda entry: len(entry.body))
+            return PostResponseCache(local, FileCacheTier(str(tmp_path)), ttl=60)
+
+        worker_a, worker_b = make_cache(), make_cache()
+        version = worker_a.set(1, b'{"id":1}', view_count=3).version
+        assert worker_b.get(1).view_count == 3
+
+        worker_a.apply_counter_flush({1: {"view_count": 2}})
+        worker_b.apply_counter_flush({1: {"view_count": 5}})
+
+        assert worker_a.get(1).view_count == 5
+        assert worker_b.get(1).view_count == 8
+        assert worker_a.shared.version("post:1") == version
+
+    async def test_concurrent_misses_share_one_load(self, async_client):
+        """캐시가 빈 인기 글에 동시에 몰린 요청은 DB 조회 한 번을 함께 기다린다"""
+        post_id = await self._create_post(async_client)
+        loads = post_cache.loads
+
+        responses = await asyncio.gather(*(async_client.get(f"{self.endpoint}/{post_id}") for _ in range(20)))
+
+        assert {response.status_code for response in responses} == {200}
+        assert post_cache.loads - loads == 1
+        assert sorted(response.json()["views"] for response in responses) == list(range(1, 21))
+
+    async def test_missing_post_is_404_and_not_cached(self, async_client):
+        response = await async_client.get(f"{self.endpoint}/999999")
+        assert response.status_code == 404
+        assert post_cache.get(999999) is None
+
+
+def _make_cache(beta: float = 0.0) -> PostResponseCache:
+    local = TTLLRUCache(max_entries=10, max_bytes=1024, ttl=60, sizeof=lambda entry: len(entry.body))
+    return PostResponseCache(local, None, ttl=60, early_refresh_beta=beta)
+
+
+class TestPostCacheStampede:
+    async def test_load_error_is_shared_and_not_cached(self):
+        cache = _make_cache()
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("db down")
+
+        results = await asyncio.gather(*(cache.get_or_load(1, failing) for _ in range(5)), return_exceptions=True)
+
+        assert calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert cache.get(1) is None
+
+    async def test_timeout(self):
+        cache = _make_cache()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return b'{"id":1}', 0
+
+        with pytest.raises(TimeoutError):
+            await cache.get_or_load(1, slow, timeout=0.01)
+        # 포기한 뒤에도 조회는 끝까지 돌아 캐시를 채운다
+        await asyncio.sleep(0.06)
+        assert cache.get(1).body == b'{"id":1}'
+
+    async def test_early_refresh_near_expiry(self, monkeypatch):
+        """만료가 가까우면 미리 다시 읽고, 갱신이 실패하면 기존 항목을 그대로 쓴다"""
+        # -log(1 - 0.5) * delta 초 앞당겨 만료된 것으로 본다
+        monkeypatch.setattr(post_cache_module.random, "random", lambda: 0.5)
+        cache = _make_cache(beta=1.0)
+        cache.set(1, b'{"v":1}', view_count=0, delta=1000.0)
+        assert cache.should_refresh(cache.get(1))
+
+        async def fresh():
+            return b'{"v":2}', 0
+
+        async def failing():
+            raise RuntimeError("db down")
+
+        cache.set(1, b'{"v":1}', view_count=0, delta=1000.0)
+        assert (await cache.get_or_load(1, failing)).body == b'{"v":1}'
+        assert (await cache.get_or_load(1, fresh)).body == b'{"v":2}'
+        assert cache.early_refreshes == 2
+
+        # 조회가 빠르고 만료가 멀면 미리 갱신하지 않는다
+        cache.set(1, b'{"v":3}', view_count=0, delta=0.001)
+        assert not cache.should_refresh(cache.get(1))
+        assert not _make_cache(beta=0.0).should_refresh(cache.get(1))
+
+    async def test_invalidation_during_load_is_not_cached(self):
+        cache = _make_cache()
+        started = asyncio.Event()
+
+        async def stale():
+            started.set()
+            await asyncio.sleep(0.02)
+            return b'{"v":"old"}', 0
+
+        async def fresh():
+            return b'{"v":"new"}', 0
+
+        pending = asyncio.create_task(cache.get_or_load(1, stale))
+        await started.wait()
+        cache.invalidate(1)
+
+        # 무효화 뒤 요청은 진행 중이던 (낡은) 조회에 합류하지 않는다
+        assert (await cache.get_or_load(1, fresh)).body == b'{"v":"new"}'
+        assert (await pending).body == b'{"v":"old"}'
+        assert cache.get(1).body == b'{"v":"new"}'
+
+    async def test_invalidating_other_post_keeps_load_cached(self):
+        """다른 글의 무효화는 진행 중인 조회 결과의 캐시 저장을 막지 않는다"""
+        cache = _make_cache()
+        started = asyncio.Event()
+
+        async def load():
+            started.set()
+            await asyncio.sleep(0.01)
+            return b'{"id":1}', 0
+
+        pending = asyncio.create_task(cache.get_or_load(1, load))
+        await started.wait()
+        cache.invalidate(2)
+
+        await pending
+        assert cache.get(1).body == b'{"id":1}'
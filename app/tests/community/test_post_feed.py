@@ -0,0 +1,64 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from starlette.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+
+from app.models.community import CategoryType, PostModel
+from app.services.community_services.post_feed import feed_query
+from app.utils.cursor import encode_cursor
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+class TestPostFeed:
+    endpoint = "/api/community/posts"
+
+    async def test_keyset_pagination(self, async_client, user):
+        """커서로 끝까지 넘기면 최신순으로 빠짐/중복 없이 조회"""
+        created = [
+            await PostModel.create(user=user, title=f"글{i}", content="내용", category=CategoryType.STUDY)
+            for i in range(5)
+        ]
+
+        ids, cursor = [], None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await async_client.get(self.endpoint, params=params)
+            assert response.status_code == HTTP_200_OK
+            data = response.json()
+            assert len(data["items"]) <= 2
+            ids += [item["id"] for item in data["items"]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert ids == [post.id for post in reversed(created)]
+
+    async def test_filters(self, async_client, user):
+        """카테고리, 비활성, 삭제된 글 필터"""
+        study = await PostModel.create(user=user, title="스터디", content="내용", category=CategoryType.STUDY)
+        await PostModel.create(user=user, title="자유", content="내용", category=CategoryType.FREE)
+        await PostModel.create(user=user, title="숨김", content="내용", category=CategoryType.STUDY, is_active=False)
+        await PostModel.create(
+            user=user, title="삭제", content="내용", category=CategoryType.STUDY, deleted_at=datetime.now(KST)
+        )
+
+        response = await async_client.get(self.endpoint, params={"category": "study"})
+
+        assert response.status_code == HTTP_200_OK
+        assert [item["id"] for item in response.json()["items"]] == [study.id]
+
+    async def test_invalid_cursor(self, async_client):
+        response = await async_client.get(self.endpoint, params={"cursor": "잘못된커서"})
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+    async def test_cursor_predicate_bounds_index_range(self):
+        """커서 조건에 OR 와 별도로 created_at <= 상한이 AND 로 붙어 인덱스 범위 스캔 시작점이 된다"""
+        cursor = encode_cursor(datetime(2025, 1, 1, tzinfo=KST).isoformat(), 10)
+
+        sql = feed_query(None, True, cursor).sql()
+
+        where = sql.split(" WHERE ", 1)[1].split(" ORDER BY ")[0]
+        assert ' AND "created_at"<=? AND ("created_at"<? OR ("created_at"=? AND "id"<?))' in where
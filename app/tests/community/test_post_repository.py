@@ -0,0 +1,18 @@
+from app.dtos.community_dtos.community_request import FreePostRequest, SharePostRequest
+from app.services.community_services.post_repository import create_post, get_posts, to_post_response
+
+
+class TestPostRepository:
+    async def test_batch_load_with_extensions(self, user):
+        """목록용 batch 로딩은 카테고리별 확장 정보와 작성자를 함께 읽는다"""
+        free = await create_post(user.id, FreePostRequest(title="자유", content="내용", image_url="a.png"))
+        share = await create_post(user.id, SharePostRequest(title="공유", content="내용", file_url="b.pdf"))
+
+        posts = await get_posts([free.id, share.id, 999999])
+
+        assert set(posts) == {free.id, share.id}
+        free_data = to_post_response(posts[free.id], views=0)
+        share_data = to_post_response(posts[share.id], views=0)
+        assert free_data["free_board"] == {"image_url": "a.png"}
+        assert share_data["data_share"] == {"file_url": "b.pdf"}
+        assert free_data["author_nickname"] == user.nickname
@@ -0,0 +1,37 @@
+from app.dtos.community_dtos.community_request import FreePostRequest, SharePostRequest
+from app.services.community_services.post_repository import create_post
+
+
+class TestPostSearch:
+    endpoint = "/api/community/search"
+
+    async def test_search_with_category_and_cursor(self, async_client, user):
+        """제목/본문 부분 일치, 카테고리 필터, 커서로 다음 페이지"""
+        for i in range(3):
+            await create_post(user.id, FreePostRequest(title=f"파이썬 질문 {i}", content="내용"))
+        await create_post(user.id, SharePostRequest(title="자료", content="파이썬 강의 노트", file_url="a.pdf"))
+        await create_post(user.id, FreePostRequest(title="자바", content="무관한 글"))
+
+        everything = await async_client.get(self.endpoint, params={"q": "파이썬"})
+        assert len(everything.json()["items"]) == 4
+
+        first = await async_client.get(self.endpoint, params={"q": "파이썬", "category": "free", "limit": 2})
+        data = first.json()
+        assert [item["category"] for item in data["items"]] == ["free", "free"]
+        assert data["items"][0]["author_nickname"] == user.nickname
+
+        second = await async_client.get(
+            self.endpoint, params={"q": "파이썬", "category": "free", "limit": 2, "cursor": data["next_cursor"]}
+        )
+        rest = second.json()
+        assert len(rest["items"]) == 1
+        assert rest["next_cursor"] is None
+        assert rest["items"][0]["id"] not in {item["id"] for item in data["items"]}
+
+    async def test_like_wildcards_are_literal(self, async_client, user):
+        await create_post(user.id, FreePostRequest(title="100% 환불", content="내용"))
+        await create_post(user.id, FreePostRequest(title="1000 환불", content="내용"))
+
+        response = await async_client.get(self.endpoint, params={"q": "0%"})
+
+        assert [item["title"] for item in response.json()["items"]] == ["100% 환불"]
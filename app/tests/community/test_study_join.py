@@ -0,0 +1,105 @@
+import asyncio
+from datetime import timedelta
+
+from tortoise import timezone
+
+from app.dtos.community_dtos.community_request import StudyPostRequest
+from app.models.community import MemberStatus, StudyMemberModel, StudyRecruitmentModel
+from app.services.community_services.post_repository import create_post
+from app.services.community_services.study_membership import join_study, leave_study
+from conftest import create_test_user
+
+
+async def create_study(author_id: int, max_member: int) -> int:
+    now = timezone.now()
+    post = await create_post(author_id, StudyPostRequest(
+        title="스터디",
+        content="참여 테스트",
+        study_start=now + timedelta(days=10),
+        study_end=now + timedelta(days=20),
+        recruit_start=now - timedelta(days=1),
+        recruit_end=now + timedelta(days=7),
+        max_member=max_member,
+    ))
+    return post.id
+
+
+class TestStudyJoin:
+    endpoint = "/api/community/post/study"
+
+    async def test_join_and_leave(self, async_client, user):
+        """참여는 멱등이고, 탈퇴하면 자리가 빈다"""
+        post_id = await create_study(user.id, max_member=2)
+
+        first = await async_client.post(f"{self.endpoint}/{post_id}/join")
+        again = await async_client.post(f"{self.endpoint}/{post_id}/join")
+        assert first.status_code == 200
+        assert first.json() == again.json()
+        assert again.json()["status"] == "joined"
+        assert again.json()["member_count"] == 1
+
+        left = await async_client.delete(f"{self.endpoint}/{post_id}/join")
+        assert left.json()["status"] is None
+        assert left.json()["member_count"] == 0
+
+    async def test_join_missing_study(self, async_client):
+        response = await async_client.post(f"{self.endpoint}/999999/join")
+        assert response.status_code == 404
+
+    async def test_concurrent_joins_never_exceed_capacity(self, user):
+        """동시에 몰린 참여 요청 중 정원만큼만 참여하고 나머지는 요청 순서대로 대기"""
+        max_member = 3
+        post_id = await create_study(user.id, max_member=max_member)
+        users = [await create_test_user() for _ in range(10)]
+
+        states = await asyncio.gather(*(join_study(u.id, post_id) for u in users))
+
+        assert sum(state.status == MemberStatus.JOINED for state in states) == max_member
+        recruitment = await StudyRecruitmentModel.get(post_id=post_id)
+        assert recruitment.member_count == max_member
+        assert await StudyMemberModel.filter(post_id=post_id, status=MemberStatus.JOINED).count() == max_member
+        positions = sorted(state.waitlist_position for state in states if state.status == MemberStatus.WAITING)
+        assert positions == list(range(1, len(users) - max_member + 1))
+
+    async def test_leave_promotes_waitlist(self, user):
+        """참여자가 빠지면 대기 1번이 참여로 올라가고 인원 수는 그대로"""
+        post_id = await create_study(user.id, max_member=1)
+        first, second, third = [await create_test_user() for _ in range(3)]
+        await join_study(first.id, post_id)
+        await join_study(second.id, post_id)
+        await join_study(third.id, post_id)
+
+        await leave_study(first.id, post_id)
+
+        promoted = await join_study(second.id, post_id)
+        waiting = await join_study(third.id, post_id)
+        assert promoted.status == MemberStatus.JOINED
+        assert promoted.member_count == 1
+        assert waiting.waitlist_position == 1
+
+    async def test_max_member_below_member_count_is_rejected(self, async_client, user):
+        """참여 인원보다 작게 정원을 줄이면 422, 정원은 그대로"""
+        post_id = await create_study(user.id, max_member=3)
+        for member in [await create_test_user() for _ in range(2)]:
+            await join_study(member.id, post_id)
+
+        response = await async_client.put(f"{self.endpoint}/{post_id}", json={"max_member": 1})
+
+        assert response.status_code == 422
+        assert (await StudyRecruitmentModel.get(post_id=post_id)).max_member == 3
+
+    async def test_raising_max_member_promotes_waitlist(self, async_client, user):
+        """정원을 늘리면 늘어난 자리만큼 대기열 앞 사람부터 참여로 올라간다"""
+        post_id = await create_study(user.id, max_member=1)
+        first, second, third, fourth = [await create_test_user() for _ in range(4)]
+        for member in (first, second, third, fourth):
+            await join_study(member.id, post_id)
+
+        response = await async_client.put(f"{self.endpoint}/{post_id}", json={"max_member": 3})
+
+        assert response.status_code == 200
+        assert response.json()["study_recruitment"]["max_member"] == 3
+        assert response.json()["study_recruitment"]["member_count"] == 3
+        assert (await join_study(second.id, post_id)).status == MemberStatus.JOINED
+        assert (await join_study(third.id, post_id)).status == MemberStatus.JOINED
+        assert (await join_study(fourth.id, post_id)).waitlist_position == 1
@@ -1,6 +1,17 @@
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
-from starlette.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_403_FORBIDDEN, HTTP_422_UNPROCESSABLE_ENTITY
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_400_BAD_REQUEST,
+    HTTP_401_UNAUTHORIZED,
+    HTTP_403_FORBIDDEN,
+    HTTP_404_NOT_FOUND,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+)
+
+from app import app
+from app.apis.auth_router import get_current_user_id
+from conftest import create_test_user
 
 KST = ZoneInfo("Asia/Seoul")
 
@@ -90,3 +101,73 @@ class TestStudyPost:
         # 참여 불가
         res_join = await async_client.post(f"{self.endpoint}/{post_id}/join", json={"user_id": 1})
         assert res_join.status_code in (HTTP_400_BAD_REQUEST, HTTP_403_FORBIDDEN)
+
+    async def test_get_and_update_study_post(self, async_client, user):
+        """상세 조회는 작성자 정보와 구인 정보를 함께 반환하고, 수정은 변경 항목만 반영"""
+        now = datetime.now(KST)
+        response = await async_client.post(self.endpoint, json={
+            "title": "모집중 스터디",
+            "content": "수정 가능",
+            "category": "study",
+            "study_start": (now + timedelta(days=10)).isoformat(),
+            "study_end": (now + timedelta(days=20)).isoformat(),
+            "recruit_start": now.isoformat(),
+            "recruit_end": (now + timedelta(days=7)).isoformat(),
+            "max_member": 4
+        })
+        post_id = response.json()["id"]
+
+        res_view = await async_client.get(f"{self.endpoint}/{post_id}")
+        assert res_view.status_code == HTTP_200_OK
+        data = res_view.json()
+        assert data["author_id"] == user.id
+        assert data["author_nickname"] == user.nickname
+        assert data["study_recruitment"]["max_member"] == 4
+
+        res_edit = await async_client.put(f"{self.endpoint}/{post_id}", json={
+            "title": "수정된 제목",
+            "max_member": 6
+        })
+        assert res_edit.status_code == HTTP_200_OK
+        edited = res_edit.json()
+        assert edited["title"] == "수정된 제목"
+        assert edited["content"] == "수정 가능"
+        assert edited["study_recruitment"]["max_member"] == 6
+
+        res_view = await async_client.get(f"{self.endpoint}/{post_id}")
+        assert res_view.json()["title"] == "수정된 제목"
+
+    async def test_get_missing_study_post(self, async_client):
+        response = await async_client.get(f"{self.endpoint}/999999")
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+    async def _create_open_post(self, async_client) -> int:
+        now = datetime.now(KST)
+        response = await async_client.post(self.endpoint, json={
+            "title": "모집중 스터디",
+            "content": "수정 권한 확인",
+            "category": "study",
+            "study_start": (now + timedelta(days=10)).isoformat(),
+            "study_end": (now + timedelta(days=20)).isoformat(),
+            "recruit_start": now.isoformat(),
+            "recruit_end": (now + timedelta(days=7)).isoformat(),
+            "max_member": 4
+        })
+        return response.json()["id"]
+
+    async def test_update_by_non_author_is_forbidden(self, async_client):
+        post_id = await self._create_open_post(async_client)
+        other = await create_test_user()
+        app.dependency_overrides[get_current_user_id] = lambda: other.id
+
+        res_edit = await async_client.put(f"{self.endpoint}/{post_id}", json={"max_member": 100})
+        assert res_edit.status_code == HTTP_403_FORBIDDEN
+        res_view = await async_client.get(f"{self.endpoint}/{post_id}")
+        assert res_view.json()["study_recruitment"]["max_member"] == 4
+
+    async def test_update_without_token_is_unauthorized(self, async_client):
+        post_id = await self._create_open_post(async_client)
+        del app.dependency_overrides[get_current_user_id]
+
+        res_edit = await async_client.put(f"{self.endpoint}/{post_id}", json={"title": "익명 수정"})
+        assert res_edit.status_code == HTTP_401_UNAUTHORIZED
@@ -1,20 +1,69 @@
 import pytest
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from httpx import AsyncClient
 from starlette.status import HTTP_200_OK
 
+from app.apis import community_router
+from app.services.community_services.counter_store import UnixSocketCounterStore
+
+KST = ZoneInfo("Asia/Seoul")
+
+
 @pytest.mark.asyncio
 class TestPostViews:
     endpoint = "/api/community/post/study"
 
     async def test_view_count_increases(self, async_client: AsyncClient):
+        now = datetime.now(KST)
+        res_create = await async_client.post(self.endpoint, json={
+            "title": "조회수 테스트",
+            "content": "조회수 증가 확인",
+            "category": "study",
+            "study_start": (now + timedelta(days=10)).isoformat(),
+            "study_end": (now + timedelta(days=20)).isoformat(),
+            "recruit_start": now.isoformat(),
+            "recruit_end": (now + timedelta(days=7)).isoformat(),
+            "max_member": 5
+        })
+        post_id = res_create.json()["id"]
+        assert res_create.json()["views"] == 0
+
         # 첫 조회
-        res1 = await async_client.get(f"{self.endpoint}/1")
+        res1 = await async_client.get(f"{self.endpoint}/{post_id}")
         assert res1.status_code == HTTP_200_OK
         data1 = res1.json()
         assert data1["views"] == 1
 
         # 두 번째 조회
-        res2 = await async_client.get(f"{self.endpoint}/1")
+        res2 = await async_client.get(f"{self.endpoint}/{post_id}")
         assert res2.status_code == HTTP_200_OK
         data2 = res2.json()
         assert data2["views"] == 2
+
+    async def test_view_when_counter_backend_is_down(self, async_client: AsyncClient, monkeypatch):
+        """카운터 집계 프로세스에 연결할 수 없어도 상세 조회와 댓글 작성은 된다 (조회수만 세지 않는다)"""
+        now = datetime.now(KST)
+        res_create = await async_client.post(self.endpoint, json={
+            "title": "집계 장애",
+            "content": "조회는 되어야 한다",
+            "category": "study",
+            "study_start": (now + timedelta(days=10)).isoformat(),
+            "study_end": (now + timedelta(days=20)).isoformat(),
+            "recruit_start": now.isoformat(),
+            "recruit_end": (now + timedelta(days=7)).isoformat(),
+            "max_member": 5
+        })
+        post_id = res_create.json()["id"]
+        monkeypatch.setattr(
+            community_router, "counter_store", UnixSocketCounterStore("/nonexistent/counters.sock")
+        )
+
+        res = await async_client.get(f"{self.endpoint}/{post_id}")
+        assert res.status_code == HTTP_200_OK
+        assert res.json()["views"] == 0
+
+        comment = await async_client.post(
+            f"/api/community/post/{post_id}/comment", json={"post_id": post_id, "content": "댓글"}
+        )
+        assert comment.status_code == HTTP_200_OK
@@ -0,0 +1,105 @@
+import os
+import tempfile
+
+import pytest
+
+from app.configs import config
+from app.services.community_services.counter_aggregator import CounterAggregator
+from app.services.community_services.write_throttle import UnixSocketWriteThrottle, write_throttle
+from app.utils.rate_limit import GcraLimiter, RateLimit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+async def aggregator_path():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "counters.sock")
+        aggregator = CounterAggregator(path)
+        await aggregator.start()
+        yield path
+        await aggregator.stop()
+
+
+class TestGcraLimiter:
+    def test_allows_burst_then_limits_until_next_interval(self):
+        clock = FakeClock()
+        limiter = GcraLimiter(max_keys=100, clock=clock)
+        limit = RateLimit(rate=1.0, burst=3)
+
+        assert [limiter.check("u1", limit) for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.check("u1", limit) == pytest.approx(1.0)
+        # 다른 key 는 따로 센다
+        assert limiter.check("u2", limit) == 0.0
+
+        clock.now += 1.0
+        assert limiter.check("u1", limit) == 0.0
+        assert limiter.check("u1", limit) == pytest.approx(1.0)
+        # u2 는 1초 뒤 한도가 다시 찼으므로 지워졌다
+        assert limiter.stats() == {"keys": 1, "allowed": 5, "limited": 2}
+
+    def test_idle_keys_are_evicted_and_size_is_bounded(self):
+        clock = FakeClock()
+        limiter = GcraLimiter(max_keys=3, clock=clock)
+        limit = RateLimit(rate=1.0, burst=1)
+
+        for key in range(10):
+            limiter.check(key, limit)
+        assert len(limiter) == 3
+
+        # 한도가 다 찬 뒤(TAT 가 지난) key 는 새 요청이 올 때 앞에서부터 지워진다
+        clock.now += 10
+        limiter.check("new", limit)
+        limiter.check("new2", limit)
+        assert len(limiter) == 2
+
+
+class TestWriteThrottle:
+    async def test_unix_socket_throttle_shared_between_workers(self, aggregator_path):
+        limit = RateLimit(rate=0.01, burst=2)
+        worker_a = UnixSocketWriteThrottle({"post": limit}, aggregator_path)
+        worker_b = UnixSocketWriteThrottle({"post": limit}, aggregator_path)
+        try:
+            assert await worker_a.retry_after("post", 1) == 0.0
+            assert await worker_b.retry_after("post", 1) == 0.0
+            assert await worker_a.retry_after("post", 1) > 0
+            assert await worker_b.retry_after("post", 2) == 0.0
+        finally:
+            await worker_a.close()
+            await worker_b.close()
+
+    async def test_unreachable_backend_does_not_block_writes(self):
+        throttle = UnixSocketWriteThrottle({"post": RateLimit(rate=0.01, burst=1)}, "/nonexistent/counters.sock")
+        assert await throttle.retry_after("post", 1) == 0.0
+
+    async def test_comment_endpoint_returns_429_with_retry_after(self, async_client, monkeypatch):
+        monkeypatch.setitem(write_throttle.limits, "comment", RateLimit(rate=1 / 60, burst=2))
+        post = await async_client.post("/api/community/post/free", json={"title": "글", "content": "내용"})
+        post_id = post.json()["id"]
+
+        statuses = []
+        for _ in range(3):
+            response = await async_client.post(
+                f"/api/community/post/{post_id}/comment", json={"post_id": post_id, "content": "댓글"}
+            )
+            statuses.append(response.status_code)
+        assert statuses == [200, 200, 429]
+        assert 1 <= int(response.headers["Retry-After"]) <= 60
+
+        # 게시글 작성 한도는 따로 센다
+        assert (await async_client.post(
+            "/api/community/post/free", json={"title": "글2", "content": "내용"}
+        )).status_code == 200
+
+    async def test_disabled(self, async_client, monkeypatch):
+        monkeypatch.setattr(config, "RATE_LIMIT_ENABLED", False)
+        monkeypatch.setitem(write_throttle.limits, "post", RateLimit(rate=1 / 60, burst=1))
+        for _ in range(3):
+            response = await async_client.post("/api/community/post/free", json={"title": "글", "content": "내용"})
+            assert response.status_code == 200
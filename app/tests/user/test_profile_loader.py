@@ -0,0 +1,52 @@
+import asyncio
+
+from conftest import create_test_user
+
+from app.models.community import CategoryType, CommentModel, PostModel
+from app.services.user_services.profile_loader import ProfileLoader, profile_cache
+
+
+class TestProfileLoader:
+    async def test_batches_loads_in_same_tick(self, user):
+        other = await create_test_user()
+        loader = ProfileLoader()
+
+        first, second, missing, again = await asyncio.gather(
+            loader.load(user.id), loader.load(other.id), loader.load(-1), loader.load(user.id)
+        )
+        assert (first.nickname, second.nickname, missing) == (user.nickname, other.nickname, None)
+        assert again is first
+        assert loader.queries == 1
+
+    async def test_cache_hit_skips_query_and_save_invalidates(self, user):
+        await ProfileLoader().load(user.id)
+
+        cached = ProfileLoader()
+        assert (await cached.load(user.id)).nickname == user.nickname
+        assert cached.queries == 0
+
+        user.nickname = "renamed"
+        await user.save()
+        assert profile_cache.get(user.id) is None
+        assert (await ProfileLoader().load(user.id)).nickname == "renamed"
+
+    async def test_attach_authors_to_nested_replies(self, user):
+        other = await create_test_user()
+        items = [{"author_id": user.id, "replies": [{"author_id": other.id, "replies": []}]}]
+        loader = ProfileLoader()
+
+        await loader.attach_authors(items)
+        assert items[0]["author_nickname"] == user.nickname
+        assert items[0]["replies"][0]["author_nickname"] == other.nickname
+        assert loader.queries == 1
+
+    async def test_comment_tree_has_authors(self, async_client, user):
+        other = await create_test_user()
+        post = await PostModel.create(user=user, title="글", content="내용", category=CategoryType.FREE)
+        parent = await CommentModel.create(post=post, user=user, content="원 댓글")
+        await CommentModel.create(post=post, user=other, content="답글", parent_comment=parent)
+
+        response = await async_client.get(f"/api/community/post/{post.id}/comments")
+        item = response.json()["items"][0]
+        assert item["author_nickname"] == user.nickname
+        assert item["replies"][0]["author_nickname"] == other.nickname
@@ -0,0 +1,42 @@
+from app.utils.file_cache import FileCacheTier
+from app.utils.lru_cache import TTLLRUCache
+
+
+class TestTTLLRUCache:
+    def test_evicts_least_recently_used_by_bytes(self):
+        """값 크기 합이 max_bytes 를 넘으면 가장 오래 안 쓴 항목부터 버린다"""
+        cache = TTLLRUCache(max_entries=10, max_bytes=10, ttl=60)
+        cache.set("a", b"aaaa")
+        cache.set("b", b"bbbb")
+        cache.get("a")
+        cache.set("c", b"cccc")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"aaaa"
+        assert cache.get("c") == b"cccc"
+        assert cache.total_bytes == 8
+
+    def test_expired_entry_is_miss(self):
+        cache = TTLLRUCache(max_entries=10, max_bytes=100, ttl=60)
+        cache.set("a", b"a", ttl=0)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+        assert cache.misses == 1
+
+
+class TestFileCacheTier:
+    def test_shared_between_instances(self, tmp_path):
+        """다른 워커(인스턴스)의 덮어쓰기/삭제가 버전으로 드러난다"""
+        worker_a = FileCacheTier(str(tmp_path))
+        worker_b = FileCacheTier(str(tmp_path))
+
+        version = worker_a.set("post:1", b"v1", ttl=60)
+        assert worker_b.get("post:1") == (b"v1", version)
+
+        new_version = worker_b.set("post:1", b"v2", ttl=60)
+        assert new_version != version
+        assert worker_a.version("post:1") == new_version
+
+        worker_b.delete("post:1")
+        assert worker_a.get("post:1") is None
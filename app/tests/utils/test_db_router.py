@@ -0,0 +1,51 @@
+import httpx
+from fastapi import FastAPI
+
+from app.models.community import PostModel
+from app.utils.db_router import (
+    READ_YOUR_WRITES_COOKIE,
+    ReadYourWritesMiddleware,
+    ReplicaRouter,
+    is_primary_pinned,
+    use_primary,
+)
+
+
+def create_test_app() -> FastAPI:
+    test_app = FastAPI()
+    test_app.add_middleware(ReadYourWritesMiddleware, window=5)
+
+    @test_app.get("/pinned")
+    async def read():
+        return {"pinned": is_primary_pinned()}
+
+    @test_app.post("/pinned")
+    async def write():
+        return {"pinned": is_primary_pinned()}
+
+    return test_app
+
+
+class TestReplicaRouter:
+    async def test_without_replica_reads_go_to_primary(self):
+        """replica 가 설정되지 않으면 라우터는 기본 커넥션을 쓴다"""
+        assert ReplicaRouter().db_for_read(PostModel) is None
+
+    async def test_use_primary_pins_reads(self):
+        assert is_primary_pinned() is False
+        with use_primary():
+            assert is_primary_pinned() is True
+        assert is_primary_pinned() is False
+
+    async def test_read_your_writes_window(self):
+        """쓰기 요청 뒤에는 같은 클라이언트의 읽기가 primary 로 고정"""
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=create_test_app()), base_url="http://test"
+        ) as client:
+            assert (await client.get("/pinned")).json() == {"pinned": False}
+
+            res_write = await client.post("/pinned")
+            assert res_write.json() == {"pinned": True}
+            assert READ_YOUR_WRITES_COOKIE in res_write.cookies
+
+            assert (await client.get("/pinned")).json() == {"pinned": True}
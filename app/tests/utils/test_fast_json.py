@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+import orjson
+import pytest
+from pydantic import BaseModel
+
+from app.dtos.community_dtos.community_response import CommentTreeListResponse, StudyPostResponse
+from app.utils.fast_json import encode
+
+NOW = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class TestFastJson:
+    def test_nested_model_matches_schema(self):
+        """중첩 모델, 기본값, 모델에 없는 키 처리가 pydantic 과 같다"""
+        data = {
+            "id": 1,
+            "title": "제목",
+            "content": "내용",
+            "category": "study",
+            "author_id": 2,
+            "views": 3,
+            "study_recruitment": {
+                "recruit_start": NOW,
+                "recruit_end": NOW,
+                "study_start": NOW,
+                "study_end": NOW,
+                "max_member": 5,
+                "unknown": "버려진다",
+            },
+            "created_at": NOW,
+            "updated_at": NOW,
+        }
+
+        body = orjson.loads(encode(StudyPostResponse, data, exclude=("views",)))
+
+        assert "views" not in body
+        assert body["like_count"] == 0
+        assert body["author_nickname"] is None
+        assert "unknown" not in body["study_recruitment"]
+
+    def test_recursive_model(self):
+        reply = {"id": 2, "post_id": 1, "content": "답글", "author_id": 1, "parent_id": 1,
+                 "depth": 1, "reply_count": 0, "created_at": NOW, "updated_at": NOW}
+        root = {**reply, "id": 1, "parent_id": None, "depth": 0, "reply_count": 1, "replies": [reply]}
+
+        body = orjson.loads(encode(CommentTreeListResponse, {"items": [root], "next_cursor": None}))
+
+        assert body["items"][0]["replies"][0]["replies"] == []
+
+    def test_validate_mode_detects_mismatch(self):
+        """검증 모드에서는 스키마와 다른 값을 잡아낸다"""
+
+        class Item(BaseModel):
+            count: int
+            label: Optional[str] = None
+
+        with pytest.raises(AssertionError):
+            encode(Item, {"count": "3"})
@@ -0,0 +1,91 @@
+import re
+
+import pytest
+from conftest import create_test_user
+
+from app.models.community import CategoryType, PostModel
+from app.services.user_services.profile_loader import profile_cache
+from app.utils.instrumentation import (
+    normalize_sql,
+    slow_query_log,
+    track_queries,
+    uninstall_query_hooks,
+)
+from app.utils.metrics import Histogram, MetricsRegistry
+
+
+def query_count(response) -> int:
+    return int(re.search(r'desc="(\d+) queries"', response.headers["server-timing"]).group(1))
+
+
+@pytest.mark.usefixtures("query_hooks")
+class TestInstrumentation:
+    def test_normalize_sql(self):
+        sql = "SELECT *  FROM posts\n WHERE id IN ($1, $2, $3) AND title = 'it''s' LIMIT 20"
+        assert normalize_sql(sql) == "SELECT * FROM posts WHERE id IN (...) AND title = ? LIMIT ?"
+
+    def test_render_prometheus_text(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "지연", ("route",), buckets=(0.1,))
+        latency.labels('/a"b').observe(0.05)
+        registry.register_histogram("plain_seconds", "그대로", Histogram(buckets=(1.0,)))
+        registry.counter("events_total", "이벤트").inc(3)
+
+        text = registry.render()
+        assert 'latency_seconds_bucket{route="/a\\"b",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{route="/a\\"b",le="+Inf"} 1' in text
+        assert 'latency_seconds_count{route="/a\\"b"} 1' in text
+        assert 'plain_seconds_bucket{le="1.0"} 0' in text
+        assert "# TYPE events_total counter\nevents_total 3" in text
+
+    async def test_counts_queries_in_block(self, user):
+        with track_queries() as stats:
+            await PostModel.filter(user_id=user.id).count()
+            await PostModel.filter(user_id=user.id).exists()
+        assert stats.count == 2
+
+    async def test_feed_query_count_does_not_grow_with_rows(self, async_client):
+        """작성자가 다른 글이 늘어나도 목록 조회 SQL 수는 같다 (N+1 회귀 감지)"""
+        for _ in range(2):
+            await PostModel.create(user=await create_test_user(), title="글", content="내용", category=CategoryType.FREE)
+        few = query_count(await async_client.get("/api/community/posts"))
+
+        for _ in range(6):
+            await PostModel.create(user=await create_test_user(), title="글", content="내용", category=CategoryType.FREE)
+        profile_cache.clear()
+        many = query_count(await async_client.get("/api/community/posts"))
+
+        assert 1 <= few == many
+
+    async def test_metrics_endpoint_and_slow_queries(self, async_client, user):
+        user.is_superuser = True
+        await user.save(update_fields=["is_superuser"])
+        threshold = slow_query_log.threshold
+        slow_query_log.threshold = 0.0
+        try:
+            await async_client.get("/api/community/posts", params={"category": "free"})
+        finally:
+            slow_query_log.threshold = threshold
+
+        text = (await async_client.get("/metrics")).text
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/api/community/posts",status="200"' in text
+        assert 'http_request_db_queries_count{method="GET",route="/api/community/posts"}' in text
+
+        slow = (await async_client.get("/api/system/db/slow-queries")).json()["items"]
+        assert any('"posts"' in item["sql"] and "?" in item["sql"] for item in slow)
+        slow_query_log.clear()
+
+    async def test_system_endpoints_require_superuser(self, async_client):
+        for path in ("/api/system/db/slow-queries", "/api/system/db/pool", "/api/system/post-cache"):
+            assert (await async_client.get(path)).status_code == 403
+
+    async def test_uninstall_restores_client_methods(self, user):
+        client_class = type(PostModel._meta.db)
+        assert getattr(client_class.execute_query, "_instrumented", False)
+
+        uninstall_query_hooks()
+
+        assert not getattr(client_class.execute_query, "_instrumented", False)
+        with track_queries() as stats:
+            await PostModel.filter(user_id=user.id).count()
+        assert stats.count == 0
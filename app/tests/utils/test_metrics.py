@@ -0,0 +1,16 @@
+from app.utils.metrics import Histogram
+
+
+class TestHistogram:
+    def test_snapshot_is_cumulative(self):
+        """버킷별 누적 개수와 합계/최댓값"""
+        histogram = Histogram(buckets=(0.01, 0.1))
+        for value in (0.005, 0.05, 0.05, 3.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot["count"] == 4
+        assert snapshot["max"] == 3.0
+        assert [bucket["count"] for bucket in snapshot["buckets"]] == [1, 3, 4]
+        assert snapshot["buckets"][-1]["le"] == "+Inf"
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from app.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    async def test_error_is_shared(self):
+        """진행 중인 호출이 실패하면 함께 기다린 호출도 같은 예외를 받고, 다음 호출은 새로 실행"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(*(flight.do("k", failing) for _ in range(3)), return_exceptions=True)
+
+        assert calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert not flight.in_flight("k")
+        with pytest.raises(RuntimeError):
+            await flight.do("k", failing)
+        assert calls == 2
+
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        flight = SingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.create_task(flight.do("k", slow))
+        second = asyncio.create_task(flight.do("k", slow))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+
+    async def test_timeout_only_gives_up_waiting(self):
+        """timeout 이 지난 호출만 TimeoutError 이고 진행 중인 호출은 끝까지 돌아 다른 쪽이 결과를 받는다"""
+        flight = SingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        waiter = asyncio.create_task(flight.do("k", slow))
+        with pytest.raises(TimeoutError):
+            await flight.do("k", slow, timeout=0.01)
+        assert await waiter == "done"
+
+    async def test_detach_starts_new_call(self):
+        flight = SingleFlight()
+        results = iter(["old", "new"])
+
+        async def load():
+            value = next(results)
+            await asyncio.sleep(0.01)
+            return value
+
+        first = asyncio.create_task(flight.do("k", load))
+        await asyncio.sleep(0)
+        flight.detach("k")
+
+        assert await flight.do("k", load) == "new"
+        assert await first == "old"
@@ -0,0 +1,19 @@
+import base64
+
+import orjson
+
+
+def encode_cursor(*values) -> str:
+    """keyset 페이지네이션 커서 (마지막 행의 정렬 키)를 URL-safe 문자열로 만든다."""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, orjson.JSONDecodeError):
+        raise ValueError("잘못된 커서입니다")
+    if not isinstance(values, list):
+        raise ValueError("잘못된 커서입니다")
+    return values
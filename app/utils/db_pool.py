@@ -0,0 +1,104 @@
+"""
+커넥션 풀 통계를 수집하는 asyncpg 엔진.
+
+TORTOISE_ORM 의 engine 으로 "app.utils.db_pool" 을 지정하면
+tortoise.backends.asyncpg 와 동일하게 동작하면서 커넥션을 얻기까지 기다린 시간을 기록한다.
+"""
+import time
+from collections.abc import Awaitable
+
+import asyncpg
+from tortoise import connections
+from tortoise.backends.asyncpg.client import AsyncpgDBClient
+
+from app.utils.metrics import Histogram
+
+
+class PoolStats:
+    def __init__(self) -> None:
+        self.waiting = 0
+        self.acquire_wait = Histogram()
+        self.acquire_errors = 0
+
+
+class _TimedAcquire:
+    """Pool.acquire() 결과를 감싸 기다린 시간을 잰다. 원래처럼 await 와 async with 둘 다 된다."""
+
+    __slots__ = ("stats", "context")
+
+    def __init__(self, stats: PoolStats, context) -> None:
+        self.stats = stats
+        self.context = context
+
+    async def _timed(self, acquire: Awaitable):
+        self.stats.waiting += 1
+        started = time.perf_counter()
+        try:
+            return await acquire
+        except BaseException:
+            self.stats.acquire_errors += 1
+            raise
+        finally:
+            self.stats.waiting -= 1
+            self.stats.acquire_wait.observe(time.perf_counter() - started)
+
+    def __await__(self):
+        return self._timed(self.context).__await__()
+
+    async def __aenter__(self):
+        return await self._timed(self.context.__aenter__())
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.context.__aexit__(*exc_info)
+
+
+class InstrumentedPool(asyncpg.Pool):
+    """acquire 대기 시간과 대기 중인 요청 수를 기록하는 풀 (공개 API 인 acquire 만 감싼다)"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def acquire(self, *, timeout=None) -> _TimedAcquire:
+        return _TimedAcquire(self.stats, super().acquire(timeout=timeout))
+
+
+class InstrumentedAsyncpgDBClient(AsyncpgDBClient):
+    _pool: InstrumentedPool | None
+
+    async def create_pool(self, **kwargs) -> InstrumentedPool:
+        # asyncpg.create_pool 과 같은 기본값
+        kwargs.setdefault("max_queries", 50000)
+        kwargs.setdefault("max_inactive_connection_lifetime", 300.0)
+        kwargs.setdefault("record_class", asyncpg.Record)
+        return await InstrumentedPool(None, **kwargs)
+
+    def pool_stats(self) -> dict | None:
+        pool = self._pool
+        if pool is None:
+            return None
+        size = pool.get_size()
+        idle = pool.get_idle_size()
+        return {
+            "min_size": pool.get_min_size(),
+            "max_size": pool.get_max_size(),
+            "size": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "waiting": pool.stats.waiting,
+            "acquire_errors": pool.stats.acquire_errors,
+            "acquire_wait_seconds": pool.stats.acquire_wait.snapshot(),
+        }
+
+
+def get_pool_stats() -> dict[str, dict | None]:
+    """설정된 모든 커넥션의 풀 상태 (asyncpg 가 아닌 커넥션은 제외)"""
+    stats = {}
+    for name in connections.db_config:
+        conn = connections.get(name)
+        if isinstance(conn, InstrumentedAsyncpgDBClient):
+            stats[name] = conn.pool_stats()
+    return stats
+
+
+client_class = InstrumentedAsyncpgDBClient
@@ -0,0 +1,102 @@
+"""
+읽기 쿼리를 replica 로 보내는 tortoise 라우터와 read-your-writes 미들웨어.
+
+아래 경우에는 읽기도 primary 에서 처리한다.
+- 트랜잭션 안의 읽기 (같은 트랜잭션에서 쓴 값을 봐야 하므로)
+- 쓰기 요청(POST/PUT/PATCH/DELETE) 처리 중의 읽기
+- 쓰기 요청 직후 DB_READ_YOUR_WRITES_SECONDS 동안 같은 클라이언트의 읽기 (쿠키로 표시)
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from http.cookies import SimpleCookie
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from tortoise import BaseDBAsyncClient, connections
+from tortoise.backends.base.client import TransactionalDBClient
+from tortoise.router import router as tortoise_router
+
+REPLICA_CONNECTION = "replica"
+READ_YOUR_WRITES_COOKIE = "rw_primary_until"
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+_primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+
+
+def is_primary_pinned() -> bool:
+    return _primary_pinned.get()
+
+
+@contextmanager
+def use_primary():
+    """블록 안의 읽기를 primary 로 고정"""
+    token = _primary_pinned.set(True)
+    try:
+        yield
+    finally:
+        _primary_pinned.reset(token)
+
+
+def get_read_connection(model) -> BaseDBAsyncClient:
+    """raw SQL 읽기 쿼리도 ORM 쿼리와 같은 규칙으로 커넥션을 고른다."""
+    return tortoise_router.db_for_read(model) or model._meta.db
+
+
+class ReplicaRouter:
+    def db_for_read(self, model) -> str | None:
+        if _primary_pinned.get() or REPLICA_CONNECTION not in connections.db_config:
+            return None
+        # in_transaction 안에서는 기본 커넥션이 트랜잭션 커넥션으로 바뀌어 있다
+        if isinstance(connections.get(model._meta.default_connection), TransactionalDBClient):
+            return None
+        return REPLICA_CONNECTION
+
+    def db_for_write(self, model) -> str | None:
+        return None
+
+
+class ReadYourWritesMiddleware:
+    """쓰기 요청 후 일정 시간 동안 같은 클라이언트의 읽기를 primary 로 고정한다."""
+
+    def __init__(self, app: ASGIApp, window: float) -> None:
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        is_write = scope["method"] in WRITE_METHODS
+        if not (is_write or self._pinned_by_cookie(scope)):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = int(time.time() + self.window) + 1
+                cookie = (
+                    f"{READ_YOUR_WRITES_COOKIE}={until}; Max-Age={int(self.window) + 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        token = _primary_pinned.set(True)
+        try:
+            await self.app(scope, receive, send_with_cookie if is_write else send)
+        finally:
+            _primary_pinned.reset(token)
+
+    @staticmethod
+    def _pinned_by_cookie(scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == b"cookie":
+                morsel = SimpleCookie(value.decode("latin-1")).get(READ_YOUR_WRITES_COOKIE)
+                if morsel is not None:
+                    try:
+                        return float(morsel.value) > time.time()
+                    except ValueError:
+                        return False
+        return False
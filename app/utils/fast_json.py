@@ -0,0 +1,111 @@
+import functools
+import types
+from collections.abc import Callable, Collection
+from functools import cache
+from typing import Any, Union, get_args, get_origin
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.configs import config
+
+Converter = Callable[[Any], Any]
+
+
+def _identity(value: Any) -> Any:
+    # str / int / bool / datetime / Enum / None 은 orjson 이 그대로 직렬화한다
+    return value
+
+
+class _ModelEncoder:
+    """
+    응답 모델 하나의 필드 구성을 미리 풀어둔 변환기.
+
+    dict -> (필드 순서대로 정리된) dict 변환만 하고 타입 검증은 하지 않는다.
+    중첩 모델(study_recruitment 등)과 list/Optional 은 모델을 처음 볼 때 한 번만 분석한다.
+    """
+
+    def __init__(self, model: type[BaseModel], exclude: frozenset[str]) -> None:
+        self.model = model
+        # (필드명, 변환 함수, 기본값 팩토리 또는 None)
+        self.fields: list[tuple[str, Converter, Callable[[], Any] | None]] = []
+        for name, field in model.model_fields.items():
+            if name in exclude:
+                continue
+            default = None
+            if not field.is_required():
+                default = functools.partial(field.get_default, call_default_factory=True)
+            self.fields.append((name, _converter(field.annotation), default))
+
+    def __call__(self, data: dict) -> dict:
+        out = {}
+        for name, convert, default in self.fields:
+            if name in data:
+                out[name] = convert(data[name])
+            elif default is not None:
+                out[name] = convert(default())
+            else:
+                raise KeyError(f"{self.model.__name__}.{name} 값이 없습니다")
+        return out
+
+
+@cache
+def _model_encoder(model: type[BaseModel], exclude: frozenset[str] = frozenset()) -> _ModelEncoder:
+    return _ModelEncoder(model, exclude)
+
+
+def _converter(annotation: Any) -> Converter:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        # 자기 참조 모델(댓글 트리 replies)이 있으므로 실제 변환기는 호출 시점에 찾는다
+        return lambda value: _model_encoder(annotation)(value)
+
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            inner = _converter(args[0])
+            if inner is _identity:
+                return _identity
+            return lambda value: None if value is None else inner(value)
+        return _identity
+    if origin is list:
+        (item,) = get_args(annotation) or (Any,)
+        inner = _converter(item)
+        if inner is _identity:
+            return _identity
+        return lambda value: [inner(v) for v in value]
+    return _identity
+
+
+def encode(model: type[BaseModel], data: dict, exclude: Collection[str] = ()) -> bytes:
+    """
+    ORM 에서 만든 dict 를 응답 모델의 모양 그대로 orjson bytes 로 만든다.
+
+    핸들러가 dict 를 돌려주면 FastAPI 가 response_model 로 다시 검증한 뒤 직렬화하는데,
+    이미 DB 에서 타입이 보장된 값이므로 검증을 건너뛰고 바로 직렬화한다.
+    FAST_JSON_VALIDATE 가 켜져 있으면(테스트) pydantic 결과와 같은지 확인한다.
+    """
+    exclude = frozenset(exclude)
+    body = orjson.dumps(_model_encoder(model, exclude)(data))
+    if config.FAST_JSON_VALIDATE:
+        _check(model, data, body, exclude)
+    return body
+
+
+def _check(model: type[BaseModel], data: dict, body: bytes, exclude: frozenset[str]) -> None:
+    expected = model.model_validate(data).model_dump(mode="json", exclude=set(exclude))
+    # 검증을 건너뛴 결과를 strict 모드로 다시 읽어 같은 값이 나와야 한다 (datetime 표기 차이 등은 허용)
+    actual = orjson.loads(body)
+    excluded = {name: data[name] for name in exclude if name in data}
+    try:
+        parsed = model.model_validate_json(orjson.dumps({**excluded, **actual}), strict=True)
+    except ValueError as e:
+        raise AssertionError(f"{model.__name__} 빠른 직렬화 결과가 스키마와 다릅니다: {e}") from e
+    if actual.keys() != expected.keys() or parsed.model_dump(mode="json", exclude=set(exclude)) != expected:
+        raise AssertionError(f"{model.__name__} 빠른 직렬화 결과가 스키마와 다릅니다: {actual} != {expected}")
+
+
+def json_response(model: type[BaseModel], data: dict, status_code: int = 200) -> Response:
+    """response_model 재검증 없이 바로 내보내는 응답 (문서화는 데코레이터의 response_model 로)"""
+    return Response(content=encode(model, data), status_code=status_code, media_type="application/json")
@@ -0,0 +1,77 @@
+import hashlib
+import os
+import struct
+import tempfile
+import time
+
+# 파일 앞부분: 만료 시각(unix time, double)
+_HEADER = struct.Struct("<d")
+
+
+def _version(stat: os.stat_result) -> tuple[int, int]:
+    # rename 으로 바꾸면 inode 가 바뀌므로 mtime 해상도보다 짧은 간격의 덮어쓰기도 구분된다
+    return stat.st_ino, stat.st_mtime_ns
+
+
+class FileCacheTier:
+    """
+    같은 호스트의 워커들이 공유하는 파일 기반 캐시 계층.
+
+    /dev/shm 같은 tmpfs 디렉터리를 쓰면 메모리 속도로 읽고 쓸 수 있다.
+    쓰기는 임시 파일 + rename 으로 원자적으로 바꾸고, 파일의 (inode, mtime_ns) 를 버전으로 써서
+    다른 워커가 지우거나 덮어쓴 것을 로컬 캐시가 알아챌 수 있게 한다.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest())
+
+    def get(self, key: str) -> tuple[bytes, tuple[int, int]] | None:
+        """(값, 버전) 또는 None"""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                version = _version(os.fstat(f.fileno()))
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        (expires_at,) = _HEADER.unpack_from(data)
+        if expires_at <= time.time():
+            self.delete(key)
+            return None
+        return data[_HEADER.size :], version
+
+    def set(self, key: str, value: bytes, ttl: float) -> tuple[int, int]:
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(time.time() + ttl))
+                f.write(value)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return _version(os.stat(path))
+
+    def version(self, key: str) -> tuple[int, int] | None:
+        try:
+            return _version(os.stat(self._path(key)))
+        except FileNotFoundError:
+            return None
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,207 @@
+"""
+요청별 지연 시간 / SQL 수 계측.
+
+- MetricsMiddleware: route 템플릿별 지연 시간, SQL 수, DB 시간을 히스토그램에 쌓고
+  Server-Timing 헤더로 돌려준다 (브라우저 개발자 도구에서 N+1 이 바로 보인다).
+- install_query_hooks: tortoise DB 클라이언트의 execute_* 를 감싸 SQL 수와 시간을 잰다.
+  느린 쿼리는 값을 지운 SQL 로 묶어 slow_query_log 에 남긴다. uninstall_query_hooks 로 되돌린다.
+
+sample_rate 로 일부 요청만 계측할 수 있고, 계측하지 않는 요청에서는 ContextVar 조회 한 번만 더 든다.
+"""
+import functools
+import logging
+import random
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.metrics import QUERY_COUNT_BUCKETS, registry
+
+logger = logging.getLogger(__name__)
+
+QUERY_METHODS = ("execute_insert", "execute_query", "execute_query_dict", "execute_many", "execute_script")
+
+REQUEST_LATENCY = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route", "status")
+)
+REQUEST_QUERIES = registry.histogram(
+    "http_request_db_queries", "HTTP 요청 하나가 보낸 SQL 수", ("method", "route"), QUERY_COUNT_BUCKETS
+)
+REQUEST_DB_TIME = registry.histogram("http_request_db_seconds", "HTTP 요청 하나의 SQL 실행 시간 합", ("method", "route"))
+SLOW_QUERIES = registry.counter("db_slow_queries_total", "느린 SQL 수")
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+# execute_query_dict -> execute_query 처럼 안에서 다시 부르는 경우 한 번만 센다
+_in_query: ContextVar[bool] = ContextVar("in_query", default=False)
+
+_NORMALIZE = (
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"\$\d+|\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)"), "(...)"),
+    (re.compile(r"\s+"), " "),
+)
+
+
+def normalize_sql(sql: str) -> str:
+    """값과 placeholder 를 ? 로 바꾸고 IN 목록과 공백을 접어 같은 모양의 SQL 을 하나로 묶는다"""
+    for pattern, replacement in _NORMALIZE:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+class SlowQueryLog:
+    """정규화한 SQL 별 느린 실행 횟수/최대/합계 (많이 쌓이면 가장 오래 안 나온 것부터 버린다)"""
+
+    def __init__(self, threshold: float, max_entries: int = 200) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+
+    def record(self, sql: str, seconds: float) -> None:
+        SLOW_QUERIES.inc()
+        normalized = normalize_sql(sql)
+        logger.warning("느린 SQL %.3fs: %s", seconds, normalized)
+        entry = self._entries.pop(normalized, None)
+        if entry is None:
+            entry = {"sql": normalized, "count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+        entry["count"] += 1
+        entry["total_seconds"] += seconds
+        entry["max_seconds"] = max(entry["max_seconds"], seconds)
+        self._entries[normalized] = entry
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def top(self, limit: int = 20) -> list[dict]:
+        return sorted(self._entries.values(), key=lambda entry: entry["total_seconds"], reverse=True)[:limit]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(threshold=float("inf"))
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """블록 안(그리고 블록에서 만든 task)에서 실행되는 SQL 수와 시간을 센다"""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _wrap(method):
+    if getattr(method, "_instrumented", False):
+        return method
+
+    @functools.wraps(method)
+    async def wrapper(self, query, *args, **kwargs):
+        if _in_query.get():
+            return await method(self, query, *args, **kwargs)
+        token = _in_query.set(True)
+        started = time.perf_counter()
+        try:
+            return await method(self, query, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            _in_query.reset(token)
+            stats = _current.get()
+            if stats is not None:
+                stats.count += 1
+                stats.seconds += elapsed
+            if elapsed >= slow_query_log.threshold:
+                slow_query_log.record(query, elapsed)
+
+    wrapper._instrumented = True
+    return wrapper
+
+
+# install_query_hooks 가 바꿔 끼운 (클라이언트 클래스, 메서드 이름) -> 원래 메서드
+_original_methods: dict[tuple[type, str], Callable] = {}
+
+
+def install_query_hooks(slow_query_seconds: float) -> None:
+    """
+    asyncpg / sqlite 클라이언트(트랜잭션 포함)의 execute_* 를 감싼다. 여러 번 불러도 한 번만 감싼다.
+
+    클래스를 바꾸므로 프로세스 전체에 걸린다. 앱 lifespan 동안만 걸고 끝나면 uninstall_query_hooks 로 되돌린다.
+    """
+    # DB 드라이버는 앱 기동 때 처음 올라오도록 여기서 import
+    from tortoise.backends.asyncpg.client import AsyncpgDBClient
+    from tortoise.backends.asyncpg.client import TransactionWrapper as AsyncpgTransactionWrapper
+    from tortoise.backends.base_postgres.client import BasePostgresClient
+    from tortoise.backends.sqlite.client import SqliteClient, SqliteTransactionWrapper
+
+    slow_query_log.threshold = slow_query_seconds
+    client_classes = (
+        BasePostgresClient, AsyncpgDBClient, AsyncpgTransactionWrapper, SqliteClient, SqliteTransactionWrapper,
+    )
+    for client_class in client_classes:
+        for name in QUERY_METHODS:
+            method = vars(client_class).get(name)
+            if method is not None and not getattr(method, "_instrumented", False):
+                _original_methods[client_class, name] = method
+                setattr(client_class, name, _wrap(method))
+
+
+def uninstall_query_hooks() -> None:
+    """install_query_hooks 가 감싼 메서드를 원래대로 되돌린다"""
+    for (client_class, name), method in _original_methods.items():
+        setattr(client_class, name, method)
+    _original_methods.clear()
+    slow_query_log.threshold = float("inf")
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, sample_rate: float = 1.0) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (self.sample_rate < 1.0 and random.random() >= self.sample_rate):
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                timing = (
+                    f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries", '
+                    f"app;dur={(time.perf_counter() - started) * 1000:.1f}"
+                )
+                message["headers"] = [*message.get("headers", ()), (b"server-timing", timing.encode())]
+            await send(message)
+
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._observe(scope, status, time.perf_counter() - started, stats)
+
+    @staticmethod
+    def _observe(scope: Scope, status: int, elapsed: float, stats: QueryStats) -> None:
+        # 매칭된 route 의 템플릿(/post/study/{post_id})으로 묶어 label 종류를 고정
+        path = getattr(scope.get("route"), "path", "unmatched")
+        method = scope["method"]
+        REQUEST_LATENCY.labels(method, path, str(status)).observe(elapsed)
+        REQUEST_QUERIES.labels(method, path).observe(stats.count)
+        REQUEST_DB_TIME.labels(method, path).observe(stats.seconds)
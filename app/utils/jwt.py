@@ -0,0 +1,52 @@
+import base64
+import hashlib
+import hmac
+import time
+
+import orjson
+
+_HEADER = base64.urlsafe_b64encode(orjson.dumps({"alg": "HS256", "typ": "JWT"})).rstrip(b"=")
+
+
+class InvalidTokenError(Exception):
+    pass
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def encode(claims: dict, secret: str) -> str:
+    """HS256 JWT (헤더는 고정이라 미리 만들어 둔다)"""
+    signing_input = _HEADER + b"." + _b64encode(orjson.dumps(claims))
+    signature = hmac.new(secret.encode(), signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64encode(signature)).decode()
+
+
+def decode(token: str, secret: str, leeway: float = 0.0) -> dict:
+    """서명과 만료(exp)를 확인하고 claims 를 돌려준다. DB 를 보지 않는다."""
+    try:
+        header, payload, signature = token.encode().split(b".")
+    except ValueError:
+        raise InvalidTokenError("토큰 형식이 잘못되었습니다")
+    if header != _HEADER:
+        # alg 를 바꿔치기한 토큰(none, RS256 등)은 받지 않는다
+        raise InvalidTokenError("지원하지 않는 토큰입니다")
+
+    expected = hmac.new(secret.encode(), header + b"." + payload, hashlib.sha256).digest()
+    try:
+        valid = hmac.compare_digest(expected, _b64decode(signature))
+        claims = orjson.loads(_b64decode(payload))
+    except (ValueError, orjson.JSONDecodeError):
+        raise InvalidTokenError("토큰 형식이 잘못되었습니다")
+    if not valid:
+        raise InvalidTokenError("서명이 올바르지 않습니다")
+    if not isinstance(claims, dict) or not isinstance(claims.get("exp"), int | float):
+        raise InvalidTokenError("만료 시각이 없습니다")
+    if claims["exp"] + leeway < time.time():
+        raise InvalidTokenError("만료된 토큰입니다")
+    return claims
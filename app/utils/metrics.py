@@ -0,0 +1,116 @@
+from bisect import bisect_left
+
+# 초 단위 지연 시간 버킷
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (관측 O(log B), 메모리 고정)"""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> dict:
+        cumulative = []
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            cumulative.append({"le": "+Inf" if bound == float("inf") else bound, "count": total})
+        return {"count": self.count, "sum": self.sum, "max": self.max, "buckets": cumulative}
+
+
+# 요청 하나가 보내는 SQL 수 버킷
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class LabeledHistogram:
+    """label 값 조합마다 Histogram 하나 (label 값은 route 템플릿처럼 종류가 적어야 한다)"""
+
+    def __init__(
+        self, name: str, help: str, label_names: tuple[str, ...], buckets: tuple[float, ...] = LATENCY_BUCKETS
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = label_names
+        self.buckets = buckets
+        self.children: dict[tuple[str, ...], Histogram] = {}
+
+    def labels(self, *values: str) -> Histogram:
+        histogram = self.children.get(values)
+        if histogram is None:
+            histogram = self.children[values] = Histogram(self.buckets)
+        return histogram
+
+
+class Counter:
+    def __init__(self, name: str, help: str) -> None:
+        self.name = name
+        self.help = help
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class MetricsRegistry:
+    """Prometheus text 형식(0.0.4)으로 내보낼 지표 모음"""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, LabeledHistogram | Counter | tuple[str, Histogram]] = {}
+
+    def histogram(
+        self, name: str, help: str, label_names: tuple[str, ...] = (), buckets: tuple[float, ...] = LATENCY_BUCKETS
+    ) -> LabeledHistogram:
+        metric = self._metrics[name] = LabeledHistogram(name, help, label_names, buckets)
+        return metric
+
+    def counter(self, name: str, help: str) -> Counter:
+        metric = self._metrics[name] = Counter(name, help)
+        return metric
+
+    def register_histogram(self, name: str, help: str, histogram: Histogram) -> None:
+        """다른 곳에서 이미 쓰고 있는 Histogram 을 그대로 내보낸다"""
+        self._metrics[name] = (help, histogram)
+
+    def render(self) -> str:
+        lines = []
+        for name, metric in self._metrics.items():
+            if isinstance(metric, Counter):
+                lines += [f"# HELP {name} {metric.help}", f"# TYPE {name} counter", f"{name} {metric.value}"]
+                continue
+            if isinstance(metric, LabeledHistogram):
+                help, label_names, children = metric.help, metric.label_names, metric.children.items()
+            else:
+                help, histogram = metric
+                label_names, children = (), [((), histogram)]
+            lines += [f"# HELP {name} {help}", f"# TYPE {name} histogram"]
+            for values, histogram in children:
+                labels = [f'{key}="{_escape(value)}"' for key, value in zip(label_names, values)]
+                cumulative = 0
+                for bound, count in zip((*histogram.buckets, float("inf")), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(float(bound))
+                    bucket_labels = ",".join([*labels, 'le="' + le + '"'])
+                    lines.append(f"{name}_bucket{{{bucket_labels}}} {cumulative}")
+                suffix = "{" + ",".join(labels) + "}" if labels else ""
+                lines.append(f"{name}_sum{suffix} {histogram.sum}")
+                lines.append(f"{name}_count{suffix} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry = MetricsRegistry()
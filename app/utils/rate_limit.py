@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """초당 rate 개, 한 번에 최대 burst 개까지 허용"""
+
+    rate: float
+    burst: int
+
+    @property
+    def interval(self) -> float:
+        return 1 / self.rate
+
+    @property
+    def tolerance(self) -> float:
+        return self.interval * (self.burst - 1)
+
+
+class GcraLimiter:
+    """
+    GCRA(Generic Cell Rate Algorithm) 방식 요청 제한기. 토큰 버킷과 같은 결과를 내지만 key 마다 시각 하나만 둔다.
+
+    - key 마다 "다음 요청이 이상적으로 도착할 시각(TAT)" 만 저장하고, 검사 한 번은 O(1) 이다.
+    - TAT 가 지난 key 는 새 key 와 상태가 같으므로 버려도 결과가 바뀌지 않는다.
+      검사할 때마다 가장 오래 안 쓴 key 부터 이런 key 를 지우고, 그래도 max_keys 를 넘으면 가장 오래 안 쓴 key 를 버린다.
+    """
+
+    def __init__(self, max_keys: int, clock=time.monotonic) -> None:
+        self.max_keys = max_keys
+        self.clock = clock
+        self.allowed = 0
+        self.limited = 0
+        self._tats: OrderedDict[Hashable, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+    def check(self, key: Hashable, limit: RateLimit) -> float:
+        """허용하면 0, 아니면 다시 시도할 수 있을 때까지 남은 초"""
+        now = self.clock()
+        tat = max(self._tats.get(key, now), now)
+        retry_after = tat - limit.tolerance - now
+        if retry_after > 0:
+            self.limited += 1
+            return retry_after
+
+        self._tats[key] = tat + limit.interval
+        self._tats.move_to_end(key)
+        self.allowed += 1
+        self._evict(now)
+        return 0.0
+
+    def _evict(self, now: float) -> None:
+        # 앞쪽(가장 오래 안 쓴 key)부터 몇 개만 본다: 요청마다 드는 비용을 상수로 묶는다
+        for _ in range(2):
+            key, tat = next(iter(self._tats.items()))
+            if tat > now:
+                break
+            del self._tats[key]
+        while len(self._tats) > self.max_keys:
+            self._tats.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {"keys": len(self._tats), "allowed": self.allowed, "limited": self.limited}
+
+    def clear(self) -> None:
+        self._tats.clear()
+        self.allowed = 0
+        self.limited = 0
@@ -0,0 +1,50 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    같은 key 로 동시에 들어온 호출을 하나로 합친다.
+
+    처음 호출한 쪽이 fn 을 별도 task 로 실행하고, 끝나기 전에 들어온 호출은 그 결과(또는 예외)를 함께 받는다.
+    task 는 shield 로 감싸므로 기다리던 요청 하나가 취소되거나 timeout 으로 먼저 포기해도 나머지는 영향을 받지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task[T]] = {}
+        self.coalesced = 0
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]], timeout: float | None = None) -> T:
+        """timeout 초 안에 끝나지 않으면 이 호출만 TimeoutError (진행 중인 fn 은 계속 돈다)"""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        if timeout is None:
+            return await asyncio.shield(task)
+        return await asyncio.wait_for(asyncio.shield(task), timeout)
+
+    def is_current(self, key: Hashable) -> bool:
+        """fn 안에서 부르면 이 호출이 아직 떼어지지 않고 key 의 진행 중인 호출인지 알려준다"""
+        task = self._calls.get(key)
+        return task is not None and task is asyncio.current_task()
+
+    def detach(self, key: Hashable) -> None:
+        """진행 중인 호출을 떼어 낸다. 이미 기다리던 쪽은 그 결과를 받고, 이후 호출은 fn 을 새로 실행한다."""
+        self._calls.pop(key, None)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 기다리던 쪽이 모두 취소됐어도 "exception was never retrieved" 경고가 나지 않게
+        if not task.cancelled():
+            task.exception()
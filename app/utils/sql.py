@@ -0,0 +1,21 @@
+from tortoise import BaseDBAsyncClient
+
+
+class SqlParams:
+    """
+    raw SQL 파라미터 모음.
+
+    값을 추가하면 커넥션 dialect 에 맞는 placeholder 를 돌려준다
+    (postgres: $1, $2 ... / sqlite: ?).
+    """
+
+    def __init__(self, conn: BaseDBAsyncClient) -> None:
+        self.is_postgres = conn.capabilities.dialect == "postgres"
+        self.values: list = []
+
+    def __call__(self, value, cast: str | None = None) -> str:
+        self.values.append(value)
+        if not self.is_postgres:
+            return "?"
+        placeholder = f"${len(self.values)}"
+        return f"{placeholder}::{cast}" if cast else placeholder
@@ -0,0 +1,14 @@
+import orjson
+
+# 첫 바이트를 바로 보내 프록시/브라우저가 연결을 열린 상태로 인식하게 하는 주석 줄
+SSE_OPEN = b": open\n\n"
+
+# nginx 등 리버스 프록시가 응답을 모아 보내지 않도록
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def sse_event(event: str, data: bytes | dict) -> bytes:
+    """Server-Sent Events 이벤트 하나 (data 는 이미 직렬화된 JSON bytes 또는 dict)"""
+    if isinstance(data, dict):
+        data = orjson.dumps(data)
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
@@ -0,0 +1,101 @@
+"""
+앱 import 시간 측정 (python -X importtime).
+
+워커 기동, 자동 확장, 테스트 수집이 모두 `import app` 을 기다리므로 여기에 예산을 둔다.
+DB 드라이버, 마이그레이션 도구, 배치 작업 모듈은 lifespan 에서 처음 올라와야 하고 import 시점에는 없어야 한다.
+
+    python -m benchmarks.import_time --top 20 --out import.json
+"""
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from benchmarks.results import save_results
+
+# `import app` 누적 시간 예산 (ms). 절반 가까이를 fastapi 가 차지한다 (측정 당시 약 600~750ms)
+IMPORT_TIME_BUDGET_MS = 1500.0
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# `import app` 만으로는 올라오면 안 되는 모듈
+LAZY_MODULES = (
+    "aerich",
+    "asyncpg",
+    "tortoise.backends.asyncpg",
+    "app.services.community_services.archive",
+)
+
+
+@dataclass(frozen=True)
+class ImportEntry:
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportEntry]:
+    """`import time: self [us] | cumulative | imported package` 줄을 읽는다"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # 머리글 줄
+        module = name.lstrip()
+        depth = (len(name) - len(module) - 1) // 2
+        entries.append(ImportEntry(module.rstrip(), int(self_us) / 1000, int(cumulative_us) / 1000, depth))
+    return entries
+
+
+def measure(module: str = "app", repeat: int = 3) -> tuple[float, list[ImportEntry], list[str]]:
+    """
+    새 인터프리터에서 module 을 repeat 번 import 해 가장 빠른 누적 시간(ms)과 그 실행의 항목을 돌려준다.
+    세 번째 값은 import 뒤 올라와 있는 LAZY_MODULES 이다.
+    """
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    best: tuple[float, list[ImportEntry], list[str]] | None = None
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=_ROOT,
+        )
+        entries = parse_importtime(result.stderr)
+        total = next(entry.cumulative_ms for entry in reversed(entries) if entry.module == module)
+        loaded = [name for name in result.stdout.strip().split(",") if name]
+        if best is None or total < best[0]:
+            best = (total, entries, loaded)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="앱 import 시간 측정")
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15, help="self 시간이 큰 모듈 몇 개를 보여줄지")
+    parser.add_argument("--out", help="결과 JSON 파일")
+    args = parser.parse_args()
+
+    total, entries, loaded = measure(args.module, args.repeat)
+    for entry in sorted(entries, key=lambda entry: entry.self_ms, reverse=True)[: args.top]:
+        print(f"{entry.self_ms:8.1f} {entry.cumulative_ms:8.1f}  {entry.module}")
+    print(f"import {args.module}: {total:.1f}ms (budget {IMPORT_TIME_BUDGET_MS:.0f}ms)")
+    if loaded:
+        print(f"eagerly imported: {', '.join(loaded)}")
+    if args.out:
+        save_results(args.out, {"import_time": {args.module: {"cumulative_ms": total}}})
+    if total > IMPORT_TIME_BUDGET_MS or loaded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+커뮤니티 API 부하 측정.
+
+시나리오(create/detail/update/join/comment)마다 --requests 개 요청을 --concurrency 개 동시 요청으로 보내고
+p50/p95/p99 지연 시간과 처리량을 JSON 으로 남긴다. 요청 대상과 사용자는 --seed 로 고정된다.
+
+    python -m benchmarks.seed --posts 20000
+    uvicorn app:app --workers 4 &
+    python -m benchmarks.load --base-url http://localhost:8000 --concurrency 64 --out results.json
+    python -m benchmarks.results baseline.json results.json --threshold 0.1
+
+--base-url 을 주지 않으면 같은 프로세스 안의 app 을 ASGI 로 직접 호출한다 (네트워크/서버 제외).
+쓰기 요청 제한에 걸리면 429 가 오류로 잡히므로 서버는 RATE_LIMIT_ENABLED=false 로 띄운다
+(프로세스 안에서 호출할 때는 자동으로 끈다).
+토큰 발급과 대상 id 조회를 위해 서버와 같은 DB(.env)에 접속할 수 있어야 한다.
+"""
+import argparse
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
+import httpx
+from tortoise import Tortoise, timezone
+
+from app.configs import config
+from app.models.community import CategoryType, PostModel, StudyRecruitmentModel
+from app.models.user import UserModel
+from app.services.auth_services.tokens import issue_tokens
+from benchmarks.micro import run_micro
+from benchmarks.results import save_results, summarize
+
+SCENARIOS = ("create", "detail", "update", "join", "comment")
+
+Request = Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+
+
+class Workload:
+    """시드로 고정된 요청 목록을 만든다"""
+
+    def __init__(
+        self,
+        rng: random.Random,
+        tokens: dict[int, str],
+        study_posts: list[tuple[int, int]],
+        post_ids: list[int],
+    ) -> None:
+        self.rng = rng
+        self.tokens = tokens
+        self.user_tokens = list(tokens.values())
+        self.study_post_ids = [post_id for post_id, _ in study_posts]
+        # 수정은 작성자만 할 수 있으므로 토큰이 있는 사용자가 쓴 글만
+        self.owned_study_posts = [(post_id, author_id) for post_id, author_id in study_posts if author_id in tokens]
+        self.post_ids = post_ids
+
+    def _auth(self, user_id: int | None = None) -> dict:
+        token = self.tokens[user_id] if user_id is not None else self.rng.choice(self.user_tokens)
+        return {"Authorization": f"Bearer {token}"}
+
+    def request(self, scenario: str) -> Request:
+        headers = self._auth()
+        if scenario == "create":
+            now = timezone.now()
+            body = {
+                "title": "벤치 모집",
+                "content": "벤치마크 본문",
+                "recruit_start": now.isoformat(),
+                "recruit_end": (now + timedelta(days=7)).isoformat(),
+                "study_start": (now + timedelta(days=8)).isoformat(),
+                "study_end": (now + timedelta(days=30)).isoformat(),
+                "max_member": 5,
+            }
+            return lambda client: client.post("/api/community/post/study", json=body, headers=headers)
+        if scenario == "detail":
+            post_id = self.rng.choice(self.study_post_ids)
+            return lambda client: client.get(f"/api/community/post/study/{post_id}", headers=headers)
+        if scenario == "update":
+            post_id, author_id = self.rng.choice(self.owned_study_posts)
+            headers = self._auth(author_id)
+            body = {"content": f"수정 {self.rng.random()}"}
+            return lambda client: client.put(f"/api/community/post/study/{post_id}", json=body, headers=headers)
+        if scenario == "join":
+            post_id = self.rng.choice(self.study_post_ids)
+            return lambda client: client.post(f"/api/community/post/study/{post_id}/join", headers=headers)
+        if scenario == "comment":
+            post_id = self.rng.choice(self.post_ids)
+            body = {"post_id": post_id, "content": "벤치 댓글"}
+            return lambda client: client.post(f"/api/community/post/{post_id}/comment", json=body, headers=headers)
+        raise ValueError(f"알 수 없는 시나리오: {scenario}")
+
+
+async def run_scenario(client: httpx.AsyncClient, requests: list[Request], concurrency: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    pending = iter(requests)
+
+    async def worker() -> None:
+        nonlocal errors
+        for send in pending:
+            started = time.perf_counter()
+            try:
+                response = await send(client)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+async def load_targets(users: int, sample: int) -> tuple[dict[int, str], list[tuple[int, int]], list[int]]:
+    user_ids = await UserModel.filter(is_active=True).order_by("id").limit(users).values_list("id", flat=True)
+    tokens = {user_id: (await issue_tokens(user_id)).access_token for user_id in user_ids}
+    # 모집 기간이 남은 글만 (수정/참여가 403 이 되지 않도록), (글 id, 작성자 id)
+    study_posts = await StudyRecruitmentModel.filter(
+        recruit_end__gt=timezone.now(), post__deleted_at__isnull=True
+    ).order_by("post_id").limit(sample).values_list("post_id", "post__user_id")
+    post_ids = await PostModel.filter(
+        deleted_at__isnull=True, category__in=[CategoryType.STUDY, CategoryType.FREE]
+    ).order_by("-id").limit(sample).values_list("id", flat=True)
+    if not tokens or not study_posts:
+        raise RuntimeError("사용자나 모집 중인 스터디 글이 없습니다. 먼저 python -m benchmarks.seed 를 실행하세요")
+    return tokens, [tuple(row) for row in study_posts], post_ids
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    scenarios: list[str],
+    requests: int,
+    concurrency: int,
+    seed: int,
+    users: int = 200,
+    sample: int = 5000,
+    warmup: int = 0,
+) -> dict:
+    tokens, study_posts, post_ids = await load_targets(users, sample)
+    results = {}
+    for scenario in scenarios:
+        workload = Workload(random.Random(f"{seed}:{scenario}"), tokens, study_posts, post_ids)
+        if warmup:
+            await run_scenario(client, [workload.request(scenario) for _ in range(warmup)], concurrency)
+        results[scenario] = await run_scenario(
+            client, [workload.request(scenario) for _ in range(requests)], concurrency
+        )
+    return results
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    from app.configs.tortoise_config import TORTOISE_ORM
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        if args.base_url:
+            limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+            client = httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30.0)
+        else:
+            from app import app
+
+            config.RATE_LIMIT_ENABLED = False
+            client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+        async with client:
+            scenarios = await run_load(
+                client, args.scenarios, args.requests, args.concurrency, args.seed, warmup=args.warmup
+            )
+    finally:
+        await Tortoise.close_connections()
+    return {
+        "config": {
+            "base_url": args.base_url or "in-process",
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "seed": args.seed,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="커뮤니티 API 부하 측정")
+    parser.add_argument("--base-url", help="예: http://localhost:8000 (없으면 프로세스 안에서 호출)")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=2000, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=100, help="측정 전에 버리는 요청 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--micro", action="store_true", help="DTO 검증/직렬화 마이크로 벤치마크도 함께")
+    parser.add_argument("--out", default="benchmark-results.json")
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args))
+    if args.micro:
+        results["micro"] = run_micro()
+    save_results(args.out, results)
+    for name, summary in results["scenarios"].items():
+        print(
+            f"{name:8} n={summary['count']} err={summary['errors']} p50={summary['p50_ms']:.1f}ms "
+            f"p95={summary['p95_ms']:.1f}ms p99={summary['p99_ms']:.1f}ms rps={summary['throughput_rps']:.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+DTO 검증 / 응답 직렬화 마이크로 벤치마크 (DB 없음).
+
+    python -m benchmarks.micro --out micro.json
+"""
+import argparse
+import timeit
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+import orjson
+
+from app.dtos.community_dtos.community_request import StudyPostRequest
+from app.dtos.community_dtos.community_response import CommentTreeListResponse, PostListResponse, StudyPostResponse
+from app.utils import fast_json
+from benchmarks.results import save_results
+
+_NOW = datetime(2025, 1, 1, 9, 0)
+
+STUDY_REQUEST = orjson.dumps({
+    "title": "파이썬 스터디",
+    "content": "주 2회 온라인으로 진행합니다" * 5,
+    "recruit_start": _NOW.isoformat(),
+    "recruit_end": (_NOW + timedelta(days=7)).isoformat(),
+    "study_start": (_NOW + timedelta(days=8)).isoformat(),
+    "study_end": (_NOW + timedelta(days=60)).isoformat(),
+    "max_member": 6,
+})
+
+STUDY_POST = {
+    "id": 1, "title": "파이썬 스터디", "content": "본문" * 100, "category": "study",
+    "author_id": 1, "author_nickname": "tester", "author_profile_image_url": None,
+    "views": 10, "like_count": 3, "comment_count": 2,
+    "study_recruitment": {
+        "recruit_start": _NOW, "recruit_end": _NOW, "study_start": _NOW, "study_end": _NOW,
+        "max_member": 6, "member_count": 2,
+    },
+    "created_at": _NOW, "updated_at": _NOW,
+}
+
+POST_LIST = {
+    "items": [
+        {
+            "id": i, "title": f"글 {i}", "category": "free", "author_id": i, "author_nickname": f"user{i}",
+            "views": i, "like_count": 0, "comment_count": 0, "created_at": _NOW, "updated_at": _NOW,
+        }
+        for i in range(20)
+    ],
+    "next_cursor": "abc",
+}
+
+
+def _comment(i: int, depth: int) -> dict:
+    replies = [_comment(i * 10 + j, depth + 1) for j in range(3)] if depth < 2 else []
+    return {
+        "id": i, "post_id": 1, "content": "댓글", "author_id": i, "author_nickname": "user", "parent_id": None,
+        "depth": depth, "reply_count": len(replies), "replies": replies, "created_at": _NOW, "updated_at": _NOW,
+    }
+
+
+COMMENT_TREE = {"items": [_comment(i, 0) for i in range(10)], "next_cursor": None}
+
+CASES: dict[str, Callable[[], object]] = {
+    "validate_study_request": lambda: StudyPostRequest.model_validate_json(STUDY_REQUEST),
+    "pydantic_study_post": lambda: StudyPostResponse.model_validate(STUDY_POST).model_dump_json(),
+    "fast_json_study_post": lambda: fast_json.encode(StudyPostResponse, STUDY_POST),
+    "pydantic_post_list": lambda: PostListResponse.model_validate(POST_LIST).model_dump_json(),
+    "fast_json_post_list": lambda: fast_json.encode(PostListResponse, POST_LIST),
+    "pydantic_comment_tree": lambda: CommentTreeListResponse.model_validate(COMMENT_TREE).model_dump_json(),
+    "fast_json_comment_tree": lambda: fast_json.encode(CommentTreeListResponse, COMMENT_TREE),
+}
+
+
+def run_micro(repeat: int = 5, min_time: float = 0.2) -> dict:
+    """케이스마다 min_time 초 이상 도는 횟수를 정하고 repeat 번 중 가장 빠른 값을 쓴다"""
+    results = {}
+    for name, case in CASES.items():
+        timer = timeit.Timer(case)
+        number, _ = timer.autorange()
+        number = max(1, int(number * min_time / 0.2))
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        results[name] = {"ns_per_op": best * 1e9, "ops_per_second": 1 / best}
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DTO 검증/직렬화 마이크로 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--out", help="결과 JSON 파일")
+    args = parser.parse_args()
+
+    results = run_micro(repeat=args.repeat)
+    for name, result in results.items():
+        print(f"{name:24} {result['ns_per_op'] / 1000:8.2f} us/op")
+    if args.out:
+        save_results(args.out, {"micro": results})
+
+
+if __name__ == "__main__":
+    main()
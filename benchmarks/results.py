@@ -0,0 +1,105 @@
+"""
+벤치마크 결과 요약/저장/비교.
+
+    python -m benchmarks.results baseline.json current.json --threshold 0.1
+
+current 가 baseline 보다 threshold 비율 이상 느리면(지연 시간 증가, 처리량 감소) 목록을 출력하고 1 로 끝난다.
+"""
+import argparse
+import math
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+import orjson
+
+# 값이 클수록 나쁜 지표 / 작을수록 나쁜 지표
+LOWER_IS_BETTER = ("p50_ms", "p95_ms", "p99_ms", "ns_per_op", "cumulative_ms")
+HIGHER_IS_BETTER = ("throughput_rps",)
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """정렬된 값의 q 분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * q
+    low, high = math.floor(rank), math.ceil(rank)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    values = sorted(latencies)
+    return {
+        "count": len(values),
+        "errors": errors,
+        "mean_ms": sum(values) / len(values) * 1000 if values else 0.0,
+        "p50_ms": percentile(values, 0.50) * 1000,
+        "p95_ms": percentile(values, 0.95) * 1000,
+        "p99_ms": percentile(values, 0.99) * 1000,
+        "max_ms": values[-1] * 1000 if values else 0.0,
+        "throughput_rps": len(values) / elapsed if elapsed else 0.0,
+    }
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def save_results(path: str, results: dict) -> None:
+    with open(path, "wb") as f:
+        f.write(orjson.dumps({"environment": environment(), **results}, option=orjson.OPT_INDENT_2))
+
+
+def load_results(path: str) -> dict:
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """두 결과의 같은 항목끼리 비교해 threshold 를 넘게 나빠진 것을 돌려준다"""
+    regressions = []
+    for section in ("scenarios", "micro", "import_time"):
+        for name, before in baseline.get(section, {}).items():
+            after = current.get(section, {}).get(name)
+            if after is None:
+                continue
+            for metric in LOWER_IS_BETTER:
+                if before.get(metric) and metric in after and after[metric] > before[metric] * (1 + threshold):
+                    regressions.append(f"{section}.{name}.{metric}: {before[metric]:.3f} -> {after[metric]:.3f}")
+            for metric in HIGHER_IS_BETTER:
+                if before.get(metric) and metric in after and after[metric] < before[metric] * (1 - threshold):
+                    regressions.append(f"{section}.{name}.{metric}: {before[metric]:.3f} -> {after[metric]:.3f}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.1, help="허용하는 악화 비율 (기본 10%%)")
+    args = parser.parse_args()
+
+    regressions = compare(load_results(args.baseline), load_results(args.current), args.threshold)
+    for line in regressions:
+        print(f"regression {line}")
+    if regressions:
+        sys.exit(1)
+    print("no regressions")
+
+
+if __name__ == "__main__":
+    main()
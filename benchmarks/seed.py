@@ -0,0 +1,142 @@
+"""
+벤치마크용 데이터 적재 (로컬 postgres, .env 의 DB 설정 사용).
+
+    python -m benchmarks.seed --users 1000 --posts 20000 --comments-per-post 5 --likes-per-post 3
+
+게시글/댓글은 bulk_ingest(COPY) 로 넣고, 같은 --seed 면 같은 데이터가 만들어진다.
+기존 데이터는 지우지 않고 뒤에 덧붙인다.
+"""
+import argparse
+import asyncio
+import random
+from collections.abc import AsyncIterator
+from datetime import timedelta
+
+import orjson
+from tortoise import Tortoise, timezone
+
+from app.models.community import PostModel
+from app.models.user import ProviderType, SocialAccountModel, UserModel
+from app.services.community_services.bulk_ingest import ingest
+
+_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _base36(value: int, width: int) -> str:
+    digits = []
+    while value:
+        value, rest = divmod(value, 36)
+        digits.append(_ALPHABET[rest])
+    return "".join(reversed(digits)).rjust(width, "0")
+
+
+async def _max_id(table: str) -> int:
+    rows = await PostModel._meta.db.execute_query_dict(f'SELECT COALESCE(MAX("id"), 0) AS id FROM "{table}"')
+    return rows[0]["id"]
+
+
+async def seed_users(count: int) -> list[int]:
+    start = await _max_id("users") + 1
+    accounts = [
+        SocialAccountModel(
+            provider=ProviderType.GOOGLE, provider_id=f"bench-{start + i}", email=f"bench{start + i}@example.com"
+        )
+        for i in range(count)
+    ]
+    await SocialAccountModel.bulk_create(accounts, batch_size=1000)
+    account_ids = await SocialAccountModel.filter(provider_id__in=[a.provider_id for a in accounts]).values_list(
+        "id", flat=True
+    )
+    # nickname 은 8자 unique: b + 7자리 36진수
+    users = [
+        UserModel(social_account_id=account_id, nickname="b" + _base36(start + i, 7))
+        for i, account_id in enumerate(sorted(account_ids))
+    ]
+    await UserModel.bulk_create(users, batch_size=1000)
+    return await UserModel.filter(nickname__in=[u.nickname for u in users]).values_list("id", flat=True)
+
+
+async def _post_lines(
+    rng: random.Random, user_ids: list[int], posts: int, comments_per_post: int, study_ratio: float
+) -> AsyncIterator[bytes]:
+    now = timezone.now()
+    for i in range(posts):
+        record = {"author_id": rng.choice(user_ids), "title": f"벤치 {i}"[:20], "content": "벤치마크 본문 " * 10}
+        if rng.random() < study_ratio:
+            # 수정/참여 시나리오가 동작하도록 모집 기간을 미래까지
+            record.update(
+                category="study",
+                recruit_start=(now - timedelta(days=1)).isoformat(),
+                recruit_end=(now + timedelta(days=30)).isoformat(),
+                study_start=(now + timedelta(days=31)).isoformat(),
+                study_end=(now + timedelta(days=90)).isoformat(),
+                max_member=rng.randint(2, 20),
+            )
+        else:
+            record.update(category="free", image_url=None)
+        comments = []
+        for c in range(comments_per_post):
+            parent = rng.choice(comments)["id"] if comments and rng.random() < 0.3 else None
+            comments.append({"id": c, "author_id": rng.choice(user_ids), "content": f"댓글 {c}", "parent_id": parent})
+        record["comments"] = comments
+        yield orjson.dumps(record)
+
+
+async def seed_likes(rng: random.Random, user_ids: list[int], post_ids: list[int], per_post: int) -> int:
+    conn = PostModel._meta.db
+    rows = []
+    now = timezone.now()
+    for post_id in post_ids:
+        for user_id in rng.sample(user_ids, min(per_post, len(user_ids))):
+            rows.append((user_id, post_id, now, now))
+    for start in range(0, len(rows), 5000):
+        await conn.execute_many(
+            'INSERT INTO "likes" ("user_id", "post_id", "created_at", "updated_at") VALUES ($1, $2, $3, $4) '
+            "ON CONFLICT DO NOTHING",
+            rows[start : start + 5000],
+        )
+    await conn.execute_query(
+        'UPDATE "posts" p SET "like_count" = (SELECT COUNT(*) FROM "likes" l WHERE l."post_id" = p."id") '
+        'WHERE p."id" = ANY($1::bigint[])',
+        [post_ids],
+    )
+    return len(rows)
+
+
+async def seed(
+    users: int, posts: int, comments_per_post: int, likes_per_post: int, study_ratio: float, seed: int
+) -> dict:
+    rng = random.Random(seed)
+    user_ids = await seed_users(users)
+    before = await _max_id("posts")
+    report = await ingest(_post_lines(rng, user_ids, posts, comments_per_post, study_ratio))
+    post_ids = await PostModel.filter(id__gt=before).values_list("id", flat=True)
+    likes = await seed_likes(rng, user_ids, post_ids, likes_per_post)
+    return {"users": len(user_ids), "posts": report.posts, "comments": report.comments, "likes": likes}
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    from app.configs.tortoise_config import TORTOISE_ORM
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        return await seed(
+            args.users, args.posts, args.comments_per_post, args.likes_per_post, args.study_ratio, args.seed
+        )
+    finally:
+        await Tortoise.close_connections()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크 데이터 적재")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--comments-per-post", type=int, default=5)
+    parser.add_argument("--likes-per-post", type=int, default=3)
+    parser.add_argument("--study-ratio", type=float, default=0.5, help="스터디 모집 글 비율")
+    parser.add_argument("--seed", type=int, default=42)
+    print(asyncio.run(_run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,94 @@
+import itertools
+
 import pytest
 import httpx
 from app import app   # FastAPI 앱 (app/__init__.py 에 있는 app)
-from tortoise.contrib.test import initializer, finalizer
+from tortoise.contrib.test import _restore_default, finalizer, initializer, truncate_all_models
+
+from app.apis.auth_router import get_current_user_id
+from app.configs import config
+from app.models.user import ProviderType, SocialAccountModel, UserModel
+from app.services.ai_services.plan_cache import plan_generator
+from app.services.auth_services.tokens import revocation_index
+from app.services.community_services.counter_store import counter_store
+from app.services.community_services.post_cache import post_cache
+from app.services.community_services.write_throttle import write_throttle
+from app.services.user_services.profile_loader import profile_cache
+from app.utils.instrumentation import install_query_hooks, uninstall_query_hooks
 
-from app.apis.community_router import post_views
+_user_seq = itertools.count(1)
 
 
 @pytest.fixture(scope="session", autouse=True)
 def initialize_tests():
+    # 응답 빠른 직렬화 결과를 매번 pydantic 스키마와 대조
+    config.FAST_JSON_VALIDATE = True
     initializer(["app.models.community", "app.models.user", "app.models.ai"])
     yield
     finalizer()
 
 
+@pytest.fixture(autouse=True)
+async def restore_db_connections():
+    # initializer 는 초기화 후 연결을 비워두므로 테스트마다 복원하고, 끝나면 데이터를 비운다
+    _restore_default()
+    yield
+    await truncate_all_models()
+
+
+@pytest.fixture
+def query_hooks():
+    # httpx ASGITransport 는 lifespan 을 돌리지 않으므로 기동 때 하는 SQL 계측 설치를 필요한 테스트에서만 한다
+    install_query_hooks(slow_query_seconds=config.SLOW_QUERY_SECONDS)
+    yield
+    uninstall_query_hooks()
+
+
 @pytest.fixture
-async def async_client():
+async def async_client(user):
+    # 요청 사용자는 user fixture 로 고정
+    app.dependency_overrides[get_current_user_id] = lambda: user.id
     async with httpx.AsyncClient(
         transport=httpx.ASGITransport(app=app),
         base_url="http://test",
     ) as client:
         yield client
+    app.dependency_overrides.clear()
+
+
+async def create_test_user() -> UserModel:
+    # 세션 동안 DB 가 유지되므로 유니크 컬럼은 매번 새로 생성
+    seq = next(_user_seq)
+    social_account = await SocialAccountModel.create(
+        provider=ProviderType.GOOGLE,
+        provider_id=f"test-{seq}",
+        email=f"test{seq}@example.com",
+    )
+    return await UserModel.create(social_account=social_account, nickname=f"user{seq}")
+
+
+@pytest.fixture
+async def user() -> UserModel:
+    return await create_test_user()
+
+
+@pytest.fixture(autouse=True)
+async def clear_post_counters():
+    await counter_store.clear()
+    await write_throttle.clear()
+    yield
+    await counter_store.clear()
+    await write_throttle.clear()
 
 
 @pytest.fixture(autouse=True)
-def clear_post_views():
-    post_views.clear()
+def clear_caches():
+    post_cache.clear()
+    plan_generator.clear()
+    revocation_index.clear()
+    profile_cache.clear()
     yield
-    post_views.clear()
\ No newline at end of file
+    post_cache.clear()
+    plan_generator.clear()
+    revocation_index.clear()
+    profile_cache.clear()
@@ -0,0 +1,13 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_posts_feed" ON "posts" ("is_active", "created_at" DESC, "id" DESC) WHERE "deleted_at" IS NULL;
+        CREATE INDEX IF NOT EXISTS "idx_posts_category_feed" ON "posts" ("category", "is_active", "created_at" DESC, "id" DESC) WHERE "deleted_at" IS NULL;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_posts_category_feed";
+        DROP INDEX IF EXISTS "idx_posts_feed";"""
@@ -0,0 +1,13 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DELETE FROM "likes" a USING "likes" b WHERE a."user_id" = b."user_id" AND a."post_id" = b."post_id" AND a."id" > b."id";
+        CREATE UNIQUE INDEX IF NOT EXISTS "uid_likes_user_id_post_id" ON "likes" ("user_id", "post_id");
+        UPDATE "posts" SET "like_count" = (SELECT COUNT(*) FROM "likes" WHERE "likes"."post_id" = "posts"."id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "uid_likes_user_id_post_id";"""
@@ -0,0 +1,23 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "study_recruitments" ADD "member_count" INT NOT NULL DEFAULT 0;
+        CREATE TABLE IF NOT EXISTS "study_members" (
+    "id" BIGSERIAL NOT NULL PRIMARY KEY,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "status" VARCHAR(7) NOT NULL,
+    "post_id" BIGINT NOT NULL REFERENCES "posts" ("id") ON DELETE CASCADE,
+    "user_id" BIGINT NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_study_membe_user_id_f1e352" UNIQUE ("user_id", "post_id")
+);
+COMMENT ON COLUMN "study_members"."status" IS 'JOINED: joined\nWAITING: waiting';
+        CREATE INDEX IF NOT EXISTS "idx_study_members_waitlist" ON "study_members" ("post_id", "id") WHERE "status" = 'waiting';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "study_members";
+        ALTER TABLE "study_recruitments" DROP COLUMN "member_count";"""
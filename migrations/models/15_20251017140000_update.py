@@ -0,0 +1,50 @@
+from tortoise import BaseDBAsyncClient
+from tortoise.backends.base.client import TransactionalDBClient
+
+# 한국어 형태소 사전이 없으므로 'simple' 설정으로 공백 단위 토큰화, 제목 가중치를 더 높게
+SCHEMA = """
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        ALTER TABLE "posts" ADD COLUMN IF NOT EXISTS "search_vector" TSVECTOR GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', coalesce("title", '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce("content", '')), 'B')
+) STORED;"""
+
+INDEXES = (
+    'CREATE INDEX {concurrently} IF NOT EXISTS "idx_posts_search_vector" ON "posts" USING GIN ("search_vector")',
+    'CREATE INDEX {concurrently} IF NOT EXISTS "idx_posts_search_trgm" ON "posts" '
+    "USING GIN ((\"title\" || ' ' || \"content\") gin_trgm_ops)",
+)
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if isinstance(db, TransactionalDBClient):
+        # aerich upgrade 기본값(트랜잭션 안)에서는 CONCURRENTLY 를 쓸 수 없고, 일반 CREATE INDEX 는 만드는 동안 쓰기를 막는다.
+        # 데이터가 없는 DB(새로 만든 개발/테스트 DB)에서만 그대로 만들고, 데이터가 있으면 쓰기를 막는 대신 실패한다.
+        if await _has_posts(db):
+            raise RuntimeError(
+                "posts 에 데이터가 있어 트랜잭션 안에서는 검색 인덱스를 만들지 않습니다. "
+                "`aerich upgrade --in-transaction False` 로 실행하세요 "
+                "(search_vector 추가는 posts 를 다시 쓰므로 점검 시간에 실행해야 합니다)"
+            )
+        return SCHEMA + "".join(f"\n        {index.format(concurrently='')};" for index in INDEXES)
+
+    # STORED generated column 추가는 어떻게 해도 posts 를 ACCESS EXCLUSIVE 로 잠그고 다시 쓴다.
+    # 앞선 트랜잭션을 기다리며 그 뒤 요청까지 모두 막지 않도록 잠금을 바로 못 잡으면 실패시킨다.
+    # (한 번에 보낸 statement 들은 암묵적 트랜잭션 하나이므로 SET LOCAL 이 SCHEMA 에만 걸린다)
+    await db.execute_script("SET LOCAL lock_timeout = '5s';" + SCHEMA)
+    # CONCURRENTLY 는 여러 statement 를 한 번에 보내도 암묵적 트랜잭션으로 묶이므로 하나씩 실행
+    for index in INDEXES:
+        await db.execute_script(index.format(concurrently="CONCURRENTLY"))
+    return ""
+
+
+async def _has_posts(db: BaseDBAsyncClient) -> bool:
+    rows = await db.execute_query_dict('SELECT EXISTS (SELECT 1 FROM "posts") AS "found"')
+    return rows[0]["found"]
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_posts_search_trgm";
+        DROP INDEX IF EXISTS "idx_posts_search_vector";
+        ALTER TABLE "posts" DROP COLUMN IF EXISTS "search_vector";"""
@@ -0,0 +1,34 @@
+from tortoise import BaseDBAsyncClient
+from tortoise.backends.base.client import TransactionalDBClient
+
+# 증분 내보내기((updated_at, id) 순서 읽기)용
+INDEXES = (
+    'CREATE INDEX {concurrently} IF NOT EXISTS "idx_posts_updated_at_id" ON "posts" ("updated_at", "id")',
+    'CREATE INDEX {concurrently} IF NOT EXISTS "idx_comments_updated_at_id" ON "comments" ("updated_at", "id")',
+)
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if isinstance(db, TransactionalDBClient):
+        # 트랜잭션 안에서는 CONCURRENTLY 를 쓸 수 없으므로 데이터가 없는 DB 에서만 그대로 만든다 (migration 15 참고)
+        if await _has_posts(db):
+            raise RuntimeError(
+                "posts 에 데이터가 있어 트랜잭션 안에서는 내보내기 인덱스를 만들지 않습니다. "
+                "`aerich upgrade --in-transaction False` 로 실행하세요"
+            )
+        return "".join(f"\n        {index.format(concurrently='')};" for index in INDEXES)
+
+    for index in INDEXES:
+        await db.execute_script(index.format(concurrently="CONCURRENTLY"))
+    return ""
+
+
+async def _has_posts(db: BaseDBAsyncClient) -> bool:
+    rows = await db.execute_query_dict('SELECT EXISTS (SELECT 1 FROM "posts") AS "found"')
+    return rows[0]["found"]
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_comments_updated_at_id";
+        DROP INDEX IF EXISTS "idx_posts_updated_at_id";"""
@@ -0,0 +1,26 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "ai_plan_jobs" (
+    "id" BIGSERIAL NOT NULL PRIMARY KEY,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "status" VARCHAR(9) NOT NULL DEFAULT 'pending',
+    "is_challenge" BOOL NOT NULL DEFAULT False,
+    "input_data" TEXT NOT NULL,
+    "start_date" TIMESTAMPTZ NOT NULL,
+    "end_date" TIMESTAMPTZ NOT NULL,
+    "attempts" INT NOT NULL DEFAULT 0,
+    "error" TEXT,
+    "plan_id" BIGINT REFERENCES "ai_study_plan" ("id") ON DELETE SET NULL,
+    "user_id" BIGINT NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE
+);
+COMMENT ON COLUMN "ai_plan_jobs"."status" IS 'PENDING: pending\nRUNNING: running\nSUCCEEDED: succeeded\nFAILED: failed';
+        CREATE INDEX IF NOT EXISTS "idx_ai_plan_jobs_unfinished" ON "ai_plan_jobs" ("status", "id") WHERE "status" IN ('pending', 'running');"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "ai_plan_jobs";"""
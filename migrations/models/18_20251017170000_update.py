@@ -0,0 +1,21 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "refresh_tokens" ADD "token_hash" VARCHAR(64);
+        UPDATE "refresh_tokens" SET "token_hash" = encode(sha256(convert_to("token", 'UTF8')), 'hex');
+        ALTER TABLE "refresh_tokens" ALTER COLUMN "token_hash" SET NOT NULL;
+        ALTER TABLE "refresh_tokens" DROP COLUMN "token";
+        CREATE UNIQUE INDEX IF NOT EXISTS "uid_refresh_tok_token_h_e92003" ON "refresh_tokens" ("token_hash");
+        CREATE INDEX IF NOT EXISTS "idx_refresh_tok_expires_310999" ON "refresh_tokens" ("expires_at");
+        CREATE INDEX IF NOT EXISTS "idx_refresh_tokens_revoked_updated_at" ON "refresh_tokens" ("updated_at") WHERE "revoked";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_refresh_tokens_revoked_updated_at";
+        DROP INDEX IF EXISTS "idx_refresh_tok_expires_310999";
+        DROP INDEX IF EXISTS "uid_refresh_tok_token_h_e92003";
+        ALTER TABLE "refresh_tokens" ADD "token" TEXT NOT NULL DEFAULT '';
+        ALTER TABLE "refresh_tokens" DROP COLUMN "token_hash";"""
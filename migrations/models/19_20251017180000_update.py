@@ -0,0 +1,84 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "posts_archive" (
+    "id" BIGINT NOT NULL PRIMARY KEY,
+    "user_id" BIGINT NOT NULL,
+    "title" VARCHAR(20) NOT NULL,
+    "content" VARCHAR(500) NOT NULL,
+    "category" VARCHAR(5) NOT NULL,
+    "view_count" BIGINT NOT NULL,
+    "like_count" BIGINT NOT NULL,
+    "comment_count" BIGINT NOT NULL,
+    "is_active" BOOL NOT NULL,
+    "deleted_at" TIMESTAMPTZ,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "archived_at" TIMESTAMPTZ NOT NULL
+);
+CREATE INDEX IF NOT EXISTS "idx_posts_archi_user_id_707dfe" ON "posts_archive" ("user_id");
+COMMENT ON COLUMN "posts_archive"."category" IS 'STUDY: study\nFREE: free\nSHARE: share';
+        CREATE TABLE IF NOT EXISTS "comments_archive" (
+    "id" BIGINT NOT NULL PRIMARY KEY,
+    "user_id" BIGINT NOT NULL,
+    "post_id" BIGINT NOT NULL,
+    "content" VARCHAR(50) NOT NULL,
+    "parent_comment_id" BIGINT,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "archived_at" TIMESTAMPTZ NOT NULL
+);
+CREATE INDEX IF NOT EXISTS "idx_comments_ar_post_id_02ace6" ON "comments_archive" ("post_id");
+        CREATE TABLE IF NOT EXISTS "likes_archive" (
+    "id" BIGINT NOT NULL PRIMARY KEY,
+    "user_id" BIGINT NOT NULL,
+    "post_id" BIGINT NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "archived_at" TIMESTAMPTZ NOT NULL
+);
+CREATE INDEX IF NOT EXISTS "idx_likes_archi_post_id_bca6ff" ON "likes_archive" ("post_id");
+        CREATE TABLE IF NOT EXISTS "study_recruitments_archive" (
+    "post_id" BIGINT NOT NULL PRIMARY KEY,
+    "recruit_start" TIMESTAMPTZ NOT NULL,
+    "recruit_end" TIMESTAMPTZ NOT NULL,
+    "study_start" TIMESTAMPTZ NOT NULL,
+    "study_end" TIMESTAMPTZ NOT NULL,
+    "max_member" INT NOT NULL,
+    "member_count" INT NOT NULL,
+    "archived_at" TIMESTAMPTZ NOT NULL
+);
+        CREATE TABLE IF NOT EXISTS "study_members_archive" (
+    "id" BIGINT NOT NULL PRIMARY KEY,
+    "user_id" BIGINT NOT NULL,
+    "post_id" BIGINT NOT NULL,
+    "status" VARCHAR(7) NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "archived_at" TIMESTAMPTZ NOT NULL
+);
+CREATE INDEX IF NOT EXISTS "idx_study_membe_post_id_5916e2" ON "study_members_archive" ("post_id");
+COMMENT ON COLUMN "study_members_archive"."status" IS 'JOINED: joined\nWAITING: waiting';
+        CREATE TABLE IF NOT EXISTS "free_boards_archive" (
+    "post_id" BIGINT NOT NULL PRIMARY KEY,
+    "image_url" TEXT,
+    "archived_at" TIMESTAMPTZ NOT NULL
+);
+        CREATE TABLE IF NOT EXISTS "data_shares_archive" (
+    "post_id" BIGINT NOT NULL PRIMARY KEY,
+    "file_url" TEXT,
+    "archived_at" TIMESTAMPTZ NOT NULL
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "data_shares_archive";
+        DROP TABLE IF EXISTS "free_boards_archive";
+        DROP TABLE IF EXISTS "study_members_archive";
+        DROP TABLE IF EXISTS "study_recruitments_archive";
+        DROP TABLE IF EXISTS "likes_archive";
+        DROP TABLE IF EXISTS "comments_archive";
+        DROP TABLE IF EXISTS "posts_archive";"""
@@ -0,0 +1,44 @@
+from tortoise import BaseDBAsyncClient
+from tortoise.backends.base.client import TransactionalDBClient
+
+# 검색 인덱스는 살아 있는 글만 담고(검색 쿼리 조건과 같아야 쓰인다),
+# 보관 대상 찾기용으로 soft delete 된 글만 담는 인덱스를 따로 둔다
+INDEXES = (
+    'CREATE INDEX {concurrently} IF NOT EXISTS "idx_posts_search_vector_live" ON "posts" USING GIN ("search_vector") '
+    'WHERE "deleted_at" IS NULL AND "is_active"',
+    'CREATE INDEX {concurrently} IF NOT EXISTS "idx_posts_search_trgm_live" ON "posts" '
+    "USING GIN ((\"title\" || ' ' || \"content\") gin_trgm_ops) WHERE \"deleted_at\" IS NULL AND \"is_active\"",
+    'CREATE INDEX {concurrently} IF NOT EXISTS "idx_posts_deleted" ON "posts" ("deleted_at", "id") '
+    'WHERE "deleted_at" IS NOT NULL',
+    'DROP INDEX {concurrently} IF EXISTS "idx_posts_search_vector"',
+    'DROP INDEX {concurrently} IF EXISTS "idx_posts_search_trgm"',
+)
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if isinstance(db, TransactionalDBClient):
+        # 트랜잭션 안에서는 CONCURRENTLY 를 쓸 수 없으므로 데이터가 없는 DB 에서만 그대로 만든다 (migration 15 참고)
+        if await _has_posts(db):
+            raise RuntimeError(
+                "posts 에 데이터가 있어 트랜잭션 안에서는 부분 인덱스를 만들지 않습니다. "
+                "`aerich upgrade --in-transaction False` 로 실행하세요"
+            )
+        return "".join(f"\n        {index.format(concurrently='')};" for index in INDEXES)
+
+    for index in INDEXES:
+        await db.execute_script(index.format(concurrently="CONCURRENTLY"))
+    return ""
+
+
+async def _has_posts(db: BaseDBAsyncClient) -> bool:
+    rows = await db.execute_query_dict('SELECT EXISTS (SELECT 1 FROM "posts") AS "found"')
+    return rows[0]["found"]
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_posts_search_vector" ON "posts" USING GIN ("search_vector");
+        CREATE INDEX IF NOT EXISTS "idx_posts_search_trgm" ON "posts" USING GIN (("title" || ' ' || "content") gin_trgm_ops);
+        DROP INDEX IF EXISTS "idx_posts_deleted";
+        DROP INDEX IF EXISTS "idx_posts_search_trgm_live";
+        DROP INDEX IF EXISTS "idx_posts_search_vector_live";"""